@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+import math
+import numpy as np
+from geometry import PointArray
+from algorithms.quatre_cadrans import ResultatFiltre
+
+
+@dataclass(frozen=True)
+class ResultatApproche(ResultatFiltre):
+    """
+    Résultat du filtrage approché : en plus des indices gardés, la borne
+    d'erreur réellement obtenue (distance maximale d'un point du nuage à
+    l'enveloppe approchée, toujours <= epsilon) et le nombre de bandes.
+    """
+    erreur: float = 0.0
+    n_bandes: int = 0
+
+    def __repr__(self):
+        return (f"ResultatApproche({self.n_restants}/{self.n_initial} points conservés, "
+                f"{self.n_bandes} bandes, erreur <= {self.erreur:.3g})")
+
+
+def filtre_approche(points: PointArray, epsilon: float) -> ResultatApproche:
+    """
+    Enveloppe à epsilon près (Bentley–Faust–Preparata), en une passe O(n + k) :
+    on coupe le nuage en k bandes verticales de largeur <= epsilon et on ne
+    garde dans chaque bande que le point le plus haut et le plus bas (plus les
+    points le plus à gauche et le plus à droite). L'enveloppe de ces 2k + 2 points
+    est dans la vraie enveloppe, et tout point du nuage en est à moins de la
+    largeur de sa bande : un point p de la bande c est à la hauteur d'un point
+    du segment [plus bas, plus haut] de c, dans la même bande.
+
+    L'erreur renvoyée est la vraie largeur maximale (étendue en x des points
+    d'une même bande), toujours <= epsilon ; sur un nuage dense (uniforme par
+    exemple) elle vaut pratiquement epsilon, elle n'est plus petite que si des
+    bandes sont presque vides.
+    Ce sont des indices, comme un pré-filtre : n'importe quel algorithme exact
+    appliqué aux points gardés donne l'enveloppe approchée (option epsilon=).
+    """
+    if not epsilon > 0:
+        raise ValueError("epsilon doit être strictement positif.")
+    n = len(points)
+    x, y = points.x, points.y
+    if n < 3:
+        return ResultatApproche(np.arange(n, dtype=np.intp), n)
+
+    x_min, x_max = x.min(), x.max()
+    etendue = float(x_max - x_min)
+    k = max(1, math.ceil(etendue / epsilon))
+    if k >= n:
+        # Plus de bandes que de points : autant garder tout le monde (enveloppe exacte)
+        return ResultatApproche(np.arange(n, dtype=np.intp), n, 0.0, n)
+
+    bande = np.multiply(x - x_min, k / etendue if etendue > 0 else 0.0).astype(np.intp)
+    np.minimum(bande, k - 1, out=bande) # x = x_max tombe pile sur la borne de la dernière bande
+
+    gardes = [np.array([np.argmin(x), np.argmax(x)], dtype=np.intp)]
+    for extreme, depart in ((np.maximum, -np.inf), (np.minimum, np.inf)):
+        valeur = np.full(k, depart)
+        extreme.at(valeur, bande, y)
+        # Un représentant par bande (s'il y a des ex æquo, la dernière écriture gagne)
+        atteint = np.flatnonzero(y == valeur[bande])
+        representant = np.full(k, -1, dtype=np.intp)
+        representant[bande[atteint]] = atteint
+        gardes.append(representant[representant >= 0])
+
+    # Borne réelle : étendue en x des points de chaque bande
+    gauche = np.full(k, np.inf)
+    droite = np.full(k, -np.inf)
+    np.minimum.at(gauche, bande, x)
+    np.maximum.at(droite, bande, x)
+    non_vides = droite >= gauche
+    erreur = float((droite[non_vides] - gauche[non_vides]).max())
+
+    return ResultatApproche(np.unique(np.concatenate(gardes)), n, erreur, k)
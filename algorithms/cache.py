@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from functools import wraps
+from typing import List, Optional, Union
+import hashlib
+import os
+import sys
+import threading
+import numpy as np
+from geometry import Point, PointArray
+
+
+class CacheEnveloppes:
+    """
+    Cache des résultats d'enveloppe, adressé par le contenu : la clé est une
+    empreinte (blake2b) des buffers de coordonnées, du nom de l'algorithme et
+    de ses options. Resoumettre le même nuage (nouvel essai, image répétée...)
+    coûte alors O(n) de hachage au lieu du calcul complet en O(n log n).
+
+    - éviction LRU dès qu'on dépasse `max_entrees` résultats ou `max_octets`
+    - compteurs `succes` / `echecs` (et `succes_disque`)
+    - `dossier` (facultatif) : second niveau sur disque, un fichier .npy par
+      résultat ; il survit au processus et n'est pas limité (voir vider()).
+
+    On garde les indices des sommets (petits) et jamais les points. Marche avec
+    toutes les fonctions publiques des algorithms/ (celles qui acceptent un
+    PointArray et renvoient des indices).
+    Options acceptées dans la clé (voir cle_cache) : None, booléens, nombres,
+    chaînes, tableaux NumPy et fonctions définies au niveau d'un module. Avec
+    autre chose (lambda, fonction locale, objet quelconque), le calcul est fait
+    sans passer par le cache (compteur `non_caches`).
+    Avec avec_filtrage=True, l'appel se fait sans le cache : seuls les
+    indices sont gardés, pas le résultat du filtrage.
+    """
+
+    def __init__(self, max_entrees: int = 1024, max_octets: int = 64 << 20, dossier: Optional[str] = None):
+        self.max_entrees = max_entrees
+        self.max_octets = max_octets
+        self.dossier = dossier
+        if dossier is not None:
+            os.makedirs(dossier, exist_ok=True)
+        self.succes = 0
+        self.succes_disque = 0 # parmi les succès, ceux relus sur disque
+        self.echecs = 0
+        self.non_caches = 0 # appels dont les options n'ont pas d'empreinte sûre
+        self.n_octets = 0
+        self._entrees = OrderedDict() # cle -> indices, du moins au plus récemment utilisé
+        self._verrou = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+    @property
+    def taux_succes(self) -> float:
+        total = self.succes + self.echecs
+        return self.succes / total if total else 0.0
+
+    def __repr__(self):
+        return (f"CacheEnveloppes({len(self)} entrées, {self.n_octets} octets, "
+                f"{self.succes} succès / {self.echecs} échecs)")
+
+    def enveloppe(self, fonction, points: Union[List[Point], PointArray], *args, **kwargs):
+        """
+        fonction(points, *args, **kwargs), en passant par le cache.
+        Même interface que la fonction : liste de Point -> liste de Point,
+        PointArray -> indices.
+        """
+        if kwargs.get("avec_filtrage"):
+            with self._verrou:
+                self.non_caches += 1
+            return fonction(points, *args, **kwargs)
+
+        pa = points if isinstance(points, PointArray) else PointArray.depuis_points(points)
+        nom = _nom(fonction)
+        cle = cle_cache(pa, nom, args, kwargs) if nom is not None else None
+
+        if cle is None:
+            with self._verrou:
+                self.non_caches += 1
+            indices = np.asarray(fonction(pa, *args, **kwargs))
+        elif (indices := self._chercher(cle)) is None:
+            indices = np.asarray(fonction(pa, *args, **kwargs))
+            self._ranger(cle, indices)
+
+        if isinstance(points, PointArray):
+            return indices.copy() # le résultat gardé ne doit pas être modifié par l'appelant
+        return [points[i] for i in indices.tolist()]
+
+    def envelopper(self, fonction):
+        """Décorateur : renvoie `fonction` avec le cache devant (même signature)."""
+        @wraps(fonction)
+        def avec_cache(points, *args, **kwargs):
+            return self.enveloppe(fonction, points, *args, **kwargs)
+        avec_cache.cache = self
+        return avec_cache
+
+    def vider(self, disque: bool = False) -> None:
+        """Oublie tout (et efface aussi les fichiers du dossier si disque=True)."""
+        with self._verrou:
+            self._entrees.clear()
+            self.n_octets = 0
+            if disque and self.dossier is not None:
+                for nom in os.listdir(self.dossier):
+                    if nom.endswith(".npy"):
+                        os.remove(os.path.join(self.dossier, nom))
+
+    def _chercher(self, cle: str) -> Optional[np.ndarray]:
+        with self._verrou:
+            indices = self._entrees.get(cle)
+            if indices is not None:
+                self._entrees.move_to_end(cle)
+                self.succes += 1
+                return indices
+
+        chemin = self._chemin(cle)
+        if chemin is not None and os.path.exists(chemin):
+            indices = np.load(chemin)
+            with self._verrou:
+                self.succes += 1
+                self.succes_disque += 1
+            self._ranger(cle, indices, sur_disque=False)
+            return indices
+
+        with self._verrou:
+            self.echecs += 1
+        return None
+
+    def _ranger(self, cle: str, indices: np.ndarray, sur_disque: bool = True) -> None:
+        indices.setflags(write=False)
+        with self._verrou:
+            if cle not in self._entrees:
+                self._entrees[cle] = indices
+                self.n_octets += indices.nbytes
+            self._entrees.move_to_end(cle)
+            # Éviction des moins récemment utilisés (on garde au moins le dernier)
+            while len(self._entrees) > 1 and (len(self._entrees) > self.max_entrees
+                                              or self.n_octets > self.max_octets):
+                _, vieux = self._entrees.popitem(last=False)
+                self.n_octets -= vieux.nbytes
+
+        chemin = self._chemin(cle)
+        if sur_disque and chemin is not None:
+            # Écriture dans un fichier temporaire puis renommage : jamais de fichier à moitié écrit
+            temporaire = f"{chemin}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporaire, "wb") as f:
+                np.save(f, indices)
+            os.replace(temporaire, chemin)
+
+    def _chemin(self, cle: str) -> Optional[str]:
+        if self.dossier is None:
+            return None
+        return os.path.join(self.dossier, cle + ".npy")
+
+
+def cle_cache(points: PointArray, algorithme: str, args=(), kwargs=None) -> Optional[str]:
+    """
+    Empreinte blake2b (128 bits, en hexadécimal) d'un nuage et d'un calcul :
+    octets bruts de x et de y (un seul passage O(n), sans créer de Point),
+    type des coordonnées (float64 / int64), nom de l'algorithme et options.
+    Chaque option est prise par son contenu, jamais par son repr() (adresse
+    mémoire d'une fonction, tableau tronqué...) : type et valeur pour None,
+    booléens, nombres et chaînes, type, forme et octets pour un tableau NumPy,
+    module.nom pour une fonction de module. Renvoie None si une option n'entre
+    dans aucun de ces cas : le résultat ne doit pas être mis en cache.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{algorithme}|{points.x.dtype.str}|{len(points)}".encode())
+    options = [(None, valeur) for valeur in args] + sorted((kwargs or {}).items())
+    for nom, valeur in options:
+        h.update(f"|{nom}=".encode())
+        if not _hacher_option(h, valeur):
+            return None
+    h.update(b"|")
+    h.update(np.ascontiguousarray(points.x).data)
+    h.update(np.ascontiguousarray(points.y).data)
+    return h.hexdigest()
+
+
+def _hacher_option(h, valeur) -> bool:
+    """Ajoute une option à l'empreinte h ; False si elle n'a pas d'empreinte sûre."""
+    if valeur is None or isinstance(valeur, (bool, int, float, complex, str, np.generic)):
+        if isinstance(valeur, np.generic) and valeur.dtype.kind not in "biufc":
+            return False
+        # Le type compte : 1, 1.0 et True sont égaux mais ne donnent pas forcément le même calcul
+        h.update(f"{type(valeur).__name__}:{valeur!r}".encode())
+        return True
+    if isinstance(valeur, np.ndarray):
+        if valeur.dtype.hasobject:
+            return False
+        h.update(f"ndarray:{valeur.dtype.str}:{valeur.shape}:".encode())
+        h.update(np.ascontiguousarray(valeur).data)
+        return True
+    nom = _nom(valeur)
+    if nom is None:
+        return False
+    h.update(f"fonction:{nom}".encode())
+    return True
+
+
+def _nom(fonction) -> Optional[str]:
+    """
+    module.nom d'une fonction, seulement si ce nom la désigne bien (on le
+    résout dans le module et on retrouve le même objet) : il reste alors le
+    même d'un processus à l'autre. Les fonctions décorées au niveau d'un module
+    (toutes les fonctions publiques d'algorithms/) passent ; une lambda, une
+    fonction locale, une méthode liée (l'état de l'objet n'est pas dans le nom)
+    ou une fonction de __main__ (un autre script peut avoir la même) donnent None.
+    """
+    nom_module = getattr(fonction, "__module__", None)
+    qualname = getattr(fonction, "__qualname__", None)
+    if not nom_module or nom_module == "__main__" or not qualname or "<" in qualname:
+        return None
+    objet = sys.modules.get(nom_module)
+    for partie in qualname.split("."):
+        objet = getattr(objet, partie, None)
+    if objet is not fonction:
+        return None
+    return f"{nom_module}.{qualname}"
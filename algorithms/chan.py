@@ -0,0 +1,129 @@
+from typing import List, Optional
+import numpy as np
+from geometry import PointArray, orientation_xy
+from algorithms.par_lots import hull_many
+from algorithms.index_enveloppe import _tangente_batch, _distance_carre
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+
+@accepte_point_array
+def trouver_enveloppe_chan(points: PointArray) -> np.ndarray:
+    """
+    Algorithme de Chan, sensible à la sortie : O(n log h).
+    On devine une borne m sur h (m = 2^(2^t), t = 1, 2, ...) :
+    1) on coupe les points en paquets de m et on calcule leurs mini-enveloppes
+       (O(n log m), tous les paquets d'un coup avec par_lots.hull_many)
+    2) on fait au plus m pas de Jarvis, mais chaque pas ne regarde que la
+       tangente de chaque mini-enveloppe, trouvée par dichotomie (O((n/m) log m),
+       en passes NumPy sur toutes les mini-enveloppes à la fois)
+    Si l'enveloppe n'est pas refermée après m pas, c'est que h > m : on recommence.
+
+    Même résultat et même sens de parcours que Jarvis (départ au point le plus
+    à gauche). Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
+    """
+    n = len(points)
+    if n < 3:
+        return indices_vers_tableau([])
+
+    x, y = points.x, points.y
+    gauche = np.flatnonzero(x == x.min())
+    depart = int(gauche[np.argmin(y[gauche])])
+
+    # Mini-enveloppes bout à bout : la k-ième est ordre[offsets[k]:offsets[k + 1]].
+    # Au départ chaque point est son propre paquet.
+    ordre = np.arange(n)
+    offsets = np.arange(n + 1)
+    m_precedent = 1
+
+    t = 1
+    while True:
+        m = min(n, 2 ** (2 ** t))
+        # Les paquets de taille m sont des unions de paquets consécutifs de l'essai
+        # précédent : l'enveloppe de l'union ne dépend que des anciennes mini-enveloppes
+        par_paquet = -(-m // m_precedent)
+        groupes = offsets[:-1:par_paquet]
+        if len(groupes) > 1 and len(ordre) - groupes[-1] < 3:
+            groupes = groupes[:-1] # hull_many ignore les paquets de moins de 3 points
+        groupes = np.append(groupes, len(ordre))
+        sommets, offsets = hull_many(PointArray._depuis_colonnes(x[ordre], y[ordre]), groupes)
+        ordre = ordre[sommets]
+
+        enveloppe = _essai_chan(x, y, depart, m, ordre, offsets)
+        if enveloppe is not None:
+            return indices_vers_tableau(enveloppe)
+        m_precedent = m
+        t += 1
+
+
+def _essai_chan(x: np.ndarray, y: np.ndarray, depart: int, m: int,
+                ordre: np.ndarray, offsets: np.ndarray) -> Optional[List[int]]:
+    """
+    Un essai de Chan avec la borne m, sur les mini-enveloppes (ordre, offsets).
+    Renvoie l'enveloppe (indices), ou None si elle a plus de m sommets.
+    Chaque pas de Jarvis interroge toutes les mini-enveloppes d'un coup : une
+    dichotomie vectorisée pour les tangentes (_tangente_batch de index_enveloppe),
+    puis un tournoi vectorisé entre les candidats, sans boucle Python sur les paquets.
+    """
+    debuts, tailles = offsets[:-1], np.diff(offsets)
+    paquet = np.repeat(np.arange(len(tailles)), tailles)
+    hx, hy = x[ordre], y[ordre]
+
+    # 1 ou 2 points : pas de tangente, tous leurs points sont candidats à chaque pas
+    grandes = tailles >= 3
+    petits = np.flatnonzero(~grandes[paquet])
+    debut_g, taille_g = debuts[grandes], tailles[grandes]
+    rang_g = np.cumsum(grandes) - 1 # position d'un grand paquet parmi les grands
+
+    # Sommets des grandes mini-enveloppes triés par (x, y), pour retrouver celles
+    # dont p est un sommet (un même point, en doublon, peut l'être de plusieurs)
+    sommets = np.flatnonzero(grandes[paquet])
+    sommets = sommets[np.lexsort((hy[sommets], hx[sommets]))]
+    sx, sy = hx[sommets], hy[sommets]
+
+    # === MARCHE DE JARVIS SUR LES MINI-ENVELOPPES ===
+    x0, y0 = x[depart], y[depart]
+    enveloppe = []
+    p = depart
+
+    for _ in range(m):
+        enveloppe.append(p)
+        px, py = x[p], y[p]
+
+        candidats = debut_g + _tangente_batch(hx, hy, px, py, debut_g, taille_g)
+        # p est un sommet de ces paquets : leur tangente est simplement le sommet suivant
+        a, b = np.searchsorted(sx, px, "left"), np.searchsorted(sx, px, "right")
+        if a < b:
+            copies = sommets[a + np.searchsorted(sy[a:b], py, "left"):a + np.searchsorted(sy[a:b], py, "right")]
+            h = paquet[copies]
+            candidats[rang_g[h]] = debuts[h] + (copies - debuts[h] + 1) % tailles[h]
+
+        candidats = np.concatenate((candidats, petits))
+        candidats = candidats[(hx[candidats] != px) | (hy[candidats] != py)]
+        if len(candidats) == 0:
+            # Tous les points sont confondus
+            return enveloppe
+
+        p = int(ordre[candidats[_plus_a_droite_batch(px, py, hx[candidats], hy[candidats])]])
+        #Si on est revenu au point de départ, on a fait le tour complet.
+        if x[p] == x0 and y[p] == y0:
+            return enveloppe
+
+    return None
+
+
+def _plus_a_droite_batch(px, py, cx: np.ndarray, cy: np.ndarray) -> int:
+    """
+    Critère de Jarvis sur tous les candidats c d'un coup : la position du
+    candidat que garde la marche depuis p (le plus à droite, puis le plus loin).
+    Tournoi par paires : les candidats sont dans un cône < 180° vu de p, le
+    critère est donc un ordre total et log2(len(c)) passes NumPy suffisent.
+    """
+    restants = np.arange(len(cx))
+    while len(restants) > 1:
+        impair = restants[len(restants) - len(restants) % 2:]
+        a, b = restants[0:len(restants) - 1:2], restants[1::2]
+        o = orientation_xy(px, py, cx[a], cy[a], cx[b], cy[b]) # signe exact
+        plus_loin = _distance_carre(cx[b], cy[b], px, py) > _distance_carre(cx[a], cy[a], px, py)
+        restants = np.concatenate((np.where((o > 0) | ((o == 0) & plus_loin), b, a), impair))
+    return int(restants[0])
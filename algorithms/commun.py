@@ -0,0 +1,70 @@
+from functools import wraps
+from typing import List, Union
+import numpy as np
+from geometry import Point, PointArray
+from algorithms.quatre_cadrans import filtre_quatre_cadrans
+from algorithms.approchee import filtre_approche
+
+
+def accepte_point_array(noyau=None, *, filtrable: bool = True):
+    """
+    Transforme un noyau `noyau(pa: PointArray) -> indices` en fonction publique
+    qui accepte indifféremment :
+    - un PointArray  -> renvoie un tableau d'indices (np.intp) dans ce PointArray
+    - une liste de Point -> renvoie la liste des Point de l'enveloppe (comme avant)
+
+    Ainsi chaque algorithme n'est écrit qu'une seule fois, sur les coordonnées.
+
+    Option commune `prefilter=` :
+    - True : on écarte d'abord les points intérieurs à l'octogone des 4 cadrans
+    - une fonction `filtre(pa) -> ResultatFiltre` : filtre personnalisé
+
+    Option commune `epsilon=` : enveloppe approchée à epsilon près (voir
+    approchee.filtre_approche), bien plus rapide sur des nuages énormes ; le
+    noyau ne voit que O(étendue / epsilon) points. Remplace `prefilter`.
+
+    Option commune `avec_filtrage=True` : renvoie le couple (enveloppe,
+    résultat du filtrage), pour lire le taux d'élimination ou, avec epsilon,
+    la borne d'erreur réellement obtenue (`.erreur`) ; None sans filtrage.
+    Rien n'est gardé entre deux appels : pas d'état partagé entre threads.
+
+    `@accepte_point_array(filtrable=False)` : pour un noyau qui dépend de
+    l'ordre ou de la totalité des points (Melkman suit une polyligne), où
+    écarter des points donnerait une enveloppe fausse ; prefilter= et
+    epsilon= lèvent alors TypeError.
+    """
+    if noyau is None:
+        return lambda noyau: accepte_point_array(noyau, filtrable=filtrable)
+
+    @wraps(noyau)
+    def enveloppe(points: Union[List[Point], PointArray], *args, prefilter=False, epsilon=None,
+                  avec_filtrage=False, **kwargs):
+        if not filtrable and (prefilter or epsilon is not None):
+            raise TypeError(f"{noyau.__name__} n'accepte ni prefilter= ni epsilon= : "
+                            "filtrer les points changerait le résultat.")
+        pa = points if isinstance(points, PointArray) else PointArray.depuis_points(points)
+
+        if epsilon is not None:
+            prefilter = lambda nuage: filtre_approche(nuage, epsilon)
+        if prefilter:
+            filtre = filtre_quatre_cadrans if prefilter is True else prefilter
+            filtrage = filtre(pa)
+            # Les indices du noyau portent sur le sous-nuage : on les ramène au nuage complet
+            indices = filtrage.indices[noyau(pa[filtrage.indices], *args, **kwargs)]
+        else:
+            filtrage = None
+            indices = noyau(pa, *args, **kwargs)
+
+        if isinstance(points, PointArray):
+            resultat = indices
+        else:
+            # Ancienne interface : on retrouve les Point d'origine
+            resultat = [points[i] for i in indices.tolist()]
+        return (resultat, filtrage) if avec_filtrage else resultat
+
+    return enveloppe
+
+
+def indices_vers_tableau(indices) -> np.ndarray:
+    """Convertit une liste d'indices Python en tableau NumPy d'indices."""
+    return np.asarray(indices, dtype=np.intp)
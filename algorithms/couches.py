@@ -0,0 +1,49 @@
+from typing import List, Union
+import numpy as np
+from geometry import Point, PointArray
+from algorithms.monotone import ordre_lexicographique, enveloppe_triee
+
+
+def couches_convexes(points: Union[List[Point], PointArray]) -> np.ndarray:
+    """
+    Décomposition en couches convexes (« pelure d'oignon ») : la couche 0 est
+    le bord de l'enveloppe, la couche 1 le bord de l'enveloppe des points
+    restants, etc. Un point profond est peu « extrême » (classement d'aberrations).
+
+    Renvoie, pour chaque point, le numéro de sa couche (tableau int32).
+    Les points alignés sur une arête et les doublons sont dans la couche de l'arête.
+
+    Le tri lexicographique n'est fait qu'une fois : les points restants sont
+    gardés dans l'ordre trié (filtrage par masque) et chaque couche est une
+    chaîne monotone vectorisée sur ce sous-ensemble déjà trié, sans recopie
+    de liste ni nouveau tri. O(n log n + n·L) pour L couches, en passes NumPy.
+    """
+    pa = points if isinstance(points, PointArray) else PointArray.depuis_points(points)
+    n = len(pa)
+    if n == 0:
+        return np.empty(0, dtype=np.int32)
+
+    ordre = ordre_lexicographique(pa.x, pa.y)
+    xs, ys = pa.x[ordre], pa.y[ordre]
+
+    # Un seul exemplaire de chaque point ; ses doublons prendront sa couche
+    nouveau = np.ones(n, dtype=bool)
+    nouveau[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+    groupe = np.cumsum(nouveau) - 1 # numéro du point distinct, pour chaque position triée
+    ux, uy = xs[nouveau], ys[nouveau]
+
+    couche_unique = np.empty(len(ux), dtype=np.int32)
+    restants = np.arange(len(ux)) # positions dans ux / uy, toujours triées
+    k = 0
+    while len(restants):
+        # Le bord de l'enveloppe des restants (points alignés compris) forme la couche k
+        bord = enveloppe_triee(ux, uy, restants, bord=True) if len(restants) >= 3 else restants
+        couche_unique[bord] = k
+        sur_le_bord = np.zeros(len(ux), dtype=bool)
+        sur_le_bord[bord] = True
+        restants = restants[~sur_le_bord[restants]]
+        k += 1
+
+    couches = np.empty(n, dtype=np.int32)
+    couches[ordre] = couche_unique[groupe]
+    return couches
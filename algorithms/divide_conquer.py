@@ -1,56 +1,195 @@
-from typing import List
-from geometry import Point, Polygone, orientation
-from .glouton import trouver_enveloppe_glouton
-from .sklansky import appliquer_scan_sklansky
+from typing import List, Sequence, Tuple
+from itertools import islice
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+from geometry import PointArray, orientation_coords
+from .monotone import ordre_lexicographique, _chaine_pile
+from .commun import accepte_point_array, indices_vers_tableau
+
+# En dessous de cette taille on construit directement les deux chaînes (cas de base)
+TAILLE_FEUILLE = 8
+
+# En dessous de cette taille, lancer des processus coûte plus cher que le calcul
+SEUIL_PARALLELE = 50_000
+
+# Une enveloppe = (chaîne basse, chaîne haute), toutes deux de gauche à droite,
+# données par leurs positions dans les tableaux triés. Elles partagent leurs extrémités.
+Chaines = Tuple[List[int], List[int]]
 
 
 # =============================================================================
 # 1) Fonction publique
 # =============================================================================
-def trouver_enveloppe_diviser(points: list[Point]) -> Polygone:
+@accepte_point_array
+def trouver_enveloppe_diviser(points: PointArray, parallele: bool = False, n_processus: int = None) -> np.ndarray:
     """
     Approche « diviser pour régner » pour l'enveloppe convexe.
-    mais comme c'était dur de faire du récursif a l'infini on ne coupe que en deux
-    1) on trie les points par coordonnée x croissante
-    2) on divise en deux moitiés haut et bas
-    3) on construit l'enveloppe convexe de chaque moitié avec lsklanski
+    1) on trie les points par x (puis y) une seule fois
+    2) on coupe récursivement en deux moitiés gauche / droite
+    3) on fusionne les deux enveloppes en O(n) grâce aux ponts (tangentes) bas et haut
+    Récurrence T(n) = 2T(n/2) + O(n) => O(n log n).
+
+    En mode entier (PointArray int64), le tri se fait sur une clé entière et
+    toutes les orientations en entiers Python exacts.
+
+    Avec parallele=True, les feuilles (une tranche du tri par processus) sont
+    traitées dans un ProcessPoolExecutor qui lit les coordonnées dans une mémoire
+    partagée, puis les sous-enveloppes sont fusionnées dans le processus parent.
+
+    L'enveloppe est donnée dans le même sens que Jarvis, en partant du point le
+    plus à gauche. Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
     """
-    if not points:
-        return []
+    if len(points) < 3:
+        return indices_vers_tableau([])
 
-    P_tries = tri_par_coord(points)
-    print(P_tries)
-    enveloppe = appliquer_scan_sklansky(P_tries)
+    ordre = ordre_lexicographique(points.x, points.y)
+    xs = points.x[ordre]
+    ys = points.y[ordre]
 
-    return enveloppe
-    
+    # Doublons retirés : deux copies d'un même point ne doivent pas se retrouver
+    # de part et d'autre d'une coupure
+    distinct = np.ones(len(ordre), dtype=bool)
+    distinct[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+    ordre, xs, ys = ordre[distinct], xs[distinct], ys[distinct]
 
-def tri_par_coord(points):
+    if parallele and len(ordre) >= SEUIL_PARALLELE:
+        bas, haut = _diviser_parallele(xs, ys, n_processus or os.cpu_count() or 1)
+    else:
+        bas, haut = _diviser(memoryview(xs), memoryview(ys), 0, len(ordre))
 
-    n=len(points)
-    ptExtrm=0
+    # Chaîne basse puis chaîne haute à l'envers, sans répéter les extrémités
+    return ordre[indices_vers_tableau(bas + haut[-2:0:-1])]
 
-    #on cherhche le point le plus à gauche
-    for i in range(n):
-        if points[i].x < points[ptExtrm].x:
-            ptExtrm=i 
 
-    extreme = points[ptExtrm]
+# =============================================================================
+# 2) Récursion et fusion
+# =============================================================================
+def _diviser(xs: Sequence[float], ys: Sequence[float], debut: int, fin: int) -> Chaines:
+    """
+    Enveloppe des points triés d'indices [debut, fin) sous forme de deux chaînes.
+    xs / ys : memoryview des tableaux triés (float ou int Python à chaque accès, sans copie).
+    """
+    if fin - debut <= TAILLE_FEUILLE:
+        sx, sy = xs[debut:fin], ys[debut:fin]
+        bas = [debut + i for i in _chaine_pile(sx, sy, -1.0)]
+        haut = [debut + i for i in _chaine_pile(sx, sy, 1.0)]
+        return bas, haut
+
+    milieu = (debut + fin) // 2
+    gauche = _diviser(xs, ys, debut, milieu)
+    droite = _diviser(xs, ys, milieu, fin)
+    return fusionner(xs, ys, gauche, droite)
+
+
+def fusionner(xs: Sequence[float], ys: Sequence[float], gauche: Chaines, droite: Chaines) -> Chaines:
+    """
+    Fusionne deux enveloppes séparées (tous les points de gauche avant ceux de
+    droite dans l'ordre lexicographique) en O(h_gauche + h_droite).
+    """
+    bas = _pont(xs, ys, gauche[0], droite[0], -1.0)
+    haut = _pont(xs, ys, gauche[1], droite[1], 1.0)
+    return bas, haut
 
-    Haut,Bas=[],[]
 
-    for i in range(n):
-        if points[i].y <= extreme.y:
-            Bas.append(points[i])
-        else: 
-            Haut.append(points[i])
+def _pont(xs, ys, g: List[int], d: List[int], sens: float) -> List[int]:
+    """
+    Relie deux demi-chaînes par leur pont (tangente commune).
+    On recule sur la chaîne de gauche et on avance sur celle de droite tant que
+    le virage au point courant n'est pas strictement du bon côté
+    (même critère que la pile d'Andrew : sens * orientation > 0).
+    """
+    a = len(g) - 1
+    b = 0
 
-    #on trie les listes par ordonnées croissantes 
-    Poly = sorted(Bas, key=lambda p: p.x)
-    Haut = sorted(Haut, key=lambda p: p.x)
+    def virage(p, q, r):
+        return sens * orientation_coords(xs[p], ys[p], xs[q], ys[q], xs[r], ys[r])
 
-    #on complète le polygone avec sa partie haute 
-    for p in reversed(Haut):
-        Poly.append(p)
-    
-    return Poly
\ No newline at end of file
+    bouge = True
+    while bouge:
+        bouge = False
+        while a > 0 and virage(g[a - 1], g[a], d[b]) <= 0:
+            a -= 1
+            bouge = True
+        while b < len(d) - 1 and virage(g[a], d[b], d[b + 1]) <= 0:
+            b += 1
+            bouge = True
+
+    # La chaîne de gauche n'est plus utilisée après la fusion : on la complète sur place
+    del g[a + 1:]
+    g.extend(islice(d, b, None))
+    return g
+
+
+# =============================================================================
+# 3) Version parallèle
+# =============================================================================
+def _diviser_parallele(xs: np.ndarray, ys: np.ndarray, n_processus: int) -> Chaines:
+    """
+    Découpe le tableau trié en une tranche par processus, calcule l'enveloppe de
+    chaque tranche en parallèle, puis fusionne les sous-enveloppes deux à deux.
+    """
+    m = len(xs)
+    shm = shared_memory.SharedMemory(create=True, size=2 * m * 8)
+    try:
+        # Même type que les coordonnées (int64 en mode entier, float64 sinon) : 8 octets
+        coords = np.ndarray((2, m), dtype=xs.dtype, buffer=shm.buf)
+        coords[0] = xs
+        coords[1] = ys
+        del coords # plus aucune vue sur le buffer, sinon close() échoue
+
+        bornes = np.linspace(0, m, n_processus + 1).astype(int).tolist()
+        taches = [(shm.name, m, xs.dtype.str, bornes[k], bornes[k + 1])
+                  for k in range(n_processus) if bornes[k + 1] > bornes[k]]
+
+        with ProcessPoolExecutor(max_workers=len(taches)) as executeur:
+            enveloppes = list(executeur.map(_enveloppe_tranche, taches))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    # Fusion dans le parent : même arbre de fusion que la récursion séquentielle
+    lx, ly = memoryview(xs), memoryview(ys)
+    while len(enveloppes) > 1:
+        suivantes = [fusionner(lx, ly, enveloppes[k], enveloppes[k + 1])
+                     for k in range(0, len(enveloppes) - 1, 2)]
+        if len(enveloppes) % 2 == 1:
+            suivantes.append(enveloppes[-1])
+        enveloppes = suivantes
+    return enveloppes[0]
+
+
+def _enveloppe_tranche(tache) -> Chaines:
+    """Travail d'un processus : enveloppe de la tranche [debut, fin) du tableau partagé."""
+    nom, m, dtype, debut, fin = tache
+    shm = _attacher_memoire(nom)
+    try:
+        coords = np.ndarray((2, m), dtype=dtype, buffer=shm.buf)
+        # Copie de la tranche (le buffer partagé est fermé juste après)
+        xs = memoryview(coords[0, debut:fin].copy())
+        ys = memoryview(coords[1, debut:fin].copy())
+        del coords
+    finally:
+        shm.close()
+    bas, haut = _diviser(xs, ys, 0, fin - debut)
+    # Positions locales à la tranche -> positions dans le tableau complet
+    return [debut + i for i in bas], [debut + i for i in haut]
+
+
+def _attacher_memoire(nom: str) -> shared_memory.SharedMemory:
+    """
+    S'attache à une mémoire partagée créée par le parent, sans que ce processus
+    ne la déclare au « resource tracker » (c'est le parent qui la libère).
+    """
+    try:
+        return shared_memory.SharedMemory(name=nom, track=False) # Python >= 3.13
+    except TypeError:
+        # Avant 3.13 : on neutralise l'enregistrement le temps de l'attache
+        enregistrer = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return shared_memory.SharedMemory(name=nom)
+        finally:
+            resource_tracker.register = enregistrer
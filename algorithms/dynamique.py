@@ -0,0 +1,291 @@
+import random
+from typing import Iterable, List, Optional, Tuple
+from geometry import Point, orientation_coords
+
+# Un sommet de chaîne : le couple (x, y). Les tuples se comparent dans l'ordre
+# lexicographique, c'est exactement l'ordre des chaînes de la chaîne monotone.
+Coord = Tuple[float, float]
+
+
+class DynamicHull:
+    """
+    Enveloppe convexe dynamique : insertions et suppressions en temps
+    polylogarithmique, sans tout recalculer à chaque modification.
+
+    Structure d'Overmars–van Leeuwen : un arbre binaire équilibré (treap) trié
+    par (x, y). Chaque nœud garde les chaînes haute et basse de son sous-arbre ;
+    elles s'obtiennent à partir de celles des enfants en cherchant le pont
+    (tangente commune) par double dichotomie. Les chaînes sont des séquences
+    persistantes : une fusion ne recopie que O(log n) maillons, le reste est
+    partagé avec les enfants.
+    Coût d'une mise à jour : O(log³ n) (hauteur de l'arbre x pont en O(log² n)).
+
+    Les doublons sont comptés mais ne changent pas l'enveloppe. Même critère
+    d'orientation que geometry.orientation (signe exact) et même résultat que
+    les algorithmes « en bloc » (sens de Jarvis, départ au point le plus à
+    gauche, pas de points alignés).
+    """
+
+    def __init__(self, points: Iterable[Point] = ()):
+        self._racine: Optional[_Noeud] = None
+        self._compte = {} # (x, y) -> nombre d'exemplaires
+        self._taille = 0
+        for p in points:
+            self.insert(p)
+
+    @property
+    def size(self) -> int:
+        """Nombre de points stockés (doublons compris)."""
+        return self._taille
+
+    def __len__(self) -> int:
+        return self._taille
+
+    def __contains__(self, p: Point) -> bool:
+        return (p.x, p.y) in self._compte
+
+    def insert(self, p: Point) -> None:
+        """Ajoute le point p."""
+        cle = (p.x, p.y)
+        self._taille += 1
+        if cle in self._compte:
+            # Doublon : l'arbre (et donc l'enveloppe) ne change pas
+            self._compte[cle] += 1
+            return
+        self._compte[cle] = 1
+        self._racine = _inserer(self._racine, _Noeud(cle))
+
+    def delete(self, p: Point) -> None:
+        """Retire un exemplaire du point p (ValueError s'il n'y est pas)."""
+        cle = (p.x, p.y)
+        if cle not in self._compte:
+            raise ValueError(f"{p} n'est pas dans l'enveloppe dynamique")
+        self._taille -= 1
+        self._compte[cle] -= 1
+        if self._compte[cle] == 0:
+            del self._compte[cle]
+            self._racine = _supprimer(self._racine, cle)
+
+    def hull(self) -> List[Point]:
+        """Enveloppe courante, dans le même sens que Jarvis."""
+        if self._taille < 3:
+            return []
+        bas = _vers_liste(self._racine.bas)
+        haut = _vers_liste(self._racine.haut)
+        # Chaîne basse puis chaîne haute à l'envers, sans répéter les extrémités
+        return [Point(x, y) for x, y in bas + haut[-2:0:-1]]
+
+
+# =============================================================================
+# 1) Séquences persistantes (treap à clés implicites, maillons jamais modifiés)
+# =============================================================================
+class _Maillon:
+    __slots__ = ("p", "prio", "gauche", "droite", "taille", "premier", "dernier")
+
+    def __init__(self, p: Coord, prio: float, gauche: "_Maillon" = None, droite: "_Maillon" = None):
+        self.p = p
+        self.prio = prio
+        self.gauche = gauche
+        self.droite = droite
+        self.taille = 1
+        self.premier = self.dernier = p
+        if gauche is not None:
+            self.taille += gauche.taille
+            self.premier = gauche.premier
+        if droite is not None:
+            self.taille += droite.taille
+            self.dernier = droite.dernier
+
+
+def _taille(t: Optional[_Maillon]) -> int:
+    return t.taille if t is not None else 0
+
+
+def _concatener(a: Optional[_Maillon], b: Optional[_Maillon]) -> Optional[_Maillon]:
+    """a puis b, en ne recréant que les maillons du chemin de fusion."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        return _Maillon(a.p, a.prio, a.gauche, _concatener(a.droite, b))
+    return _Maillon(b.p, b.prio, _concatener(a, b.gauche), b.droite)
+
+
+def _couper(t: Optional[_Maillon], k: int) -> Tuple[Optional[_Maillon], Optional[_Maillon]]:
+    """Sépare t en (k premiers éléments, le reste)."""
+    if t is None or k <= 0:
+        return None, t
+    if k >= t.taille:
+        return t, None
+    tg = _taille(t.gauche)
+    if k <= tg:
+        g, d = _couper(t.gauche, k)
+        return g, _Maillon(t.p, t.prio, d, t.droite)
+    g, d = _couper(t.droite, k - tg - 1)
+    return _Maillon(t.p, t.prio, t.gauche, g), d
+
+
+def _vers_liste(t: Optional[_Maillon]) -> List[Coord]:
+    """Parcours infixe itératif (pas de récursion sur les grandes chaînes)."""
+    res = []
+    pile = []
+    while pile or t is not None:
+        while t is not None:
+            pile.append(t)
+            t = t.gauche
+        t = pile.pop()
+        res.append(t.p)
+        t = t.droite
+    return res
+
+
+# =============================================================================
+# 2) Pont entre deux chaînes séparées
+# =============================================================================
+def _virage(p: Coord, q: Coord, r: Coord, sens: float) -> float:
+    # geometry.orientation(p, q, r) (signe exact) ; > 0 : q est un vrai sommet de la chaîne
+    return sens * orientation_coords(p[0], p[1], q[0], q[1], r[0], r[1])
+
+
+def _tangente(chaine: _Maillon, p: Coord, sens: float) -> Tuple[int, Coord]:
+    """
+    Tangente depuis p (avant tous les points de la chaîne) : premier sommet r[j]
+    tel que p, r[j], r[j+1] tourne du bon côté (le dernier sinon).
+    Dichotomie en descendant le treap : O(log n).
+    """
+    t = chaine
+    decalage = 0
+    suivant = None # élément qui suit le sous-arbre courant
+    res = None
+    while t is not None:
+        i = decalage + _taille(t.gauche)
+        nxt = t.droite.premier if t.droite is not None else suivant
+        if nxt is None or _virage(p, t.p, nxt, sens) > 0:
+            res = (i, t.p)
+            suivant = t.p
+            t = t.gauche
+        else:
+            decalage = i + 1
+            t = t.droite
+    return res
+
+
+def _pont(gauche: _Maillon, droite: _Maillon, sens: float) -> Tuple[int, int]:
+    """
+    Positions (a, b) du pont entre deux chaînes dont tous les points de gauche
+    précèdent ceux de droite : la chaîne fusionnée est gauche[:a+1] + droite[b:].
+    Double dichotomie : pour chaque candidat a, sa tangente b sur la chaîne de
+    droite dit s'il faut aller plus à gauche ou plus à droite. O(log² n).
+    """
+    t = gauche
+    decalage = 0
+    precedent = suivant = None # éléments qui encadrent le sous-arbre courant
+    while True:
+        i = decalage + _taille(t.gauche)
+        prv = t.gauche.dernier if t.gauche is not None else precedent
+        nxt = t.droite.premier if t.droite is not None else suivant
+        j, b = _tangente(droite, t.p, sens)
+        if nxt is not None and _virage(t.p, nxt, b, sens) > 0:
+            # Le sommet suivant dépasse la droite (a, b) : le pont est plus loin
+            precedent = t.p
+            decalage = i + 1
+            t = t.droite
+        elif prv is not None and _virage(prv, t.p, b, sens) <= 0:
+            # a est sous (ou sur) la droite (a-1, b) : le pont est avant
+            suivant = t.p
+            t = t.gauche
+        else:
+            return i, j
+
+
+def _fusionner(gauche: Optional[_Maillon], droite: Optional[_Maillon], sens: float) -> Optional[_Maillon]:
+    """Chaîne (haute si sens = 1, basse si sens = -1) de l'union de deux chaînes séparées."""
+    if gauche is None:
+        return droite
+    if droite is None:
+        return gauche
+    a, b = _pont(gauche, droite, sens)
+    return _concatener(_couper(gauche, a + 1)[0], _couper(droite, b)[1])
+
+
+# =============================================================================
+# 3) Arbre des points (treap trié par (x, y))
+# =============================================================================
+class _Noeud:
+    __slots__ = ("cle", "prio", "gauche", "droite", "feuille", "haut", "bas")
+
+    def __init__(self, cle: Coord):
+        self.cle = cle
+        self.prio = random.random()
+        self.gauche = None
+        self.droite = None
+        # La chaîne réduite au seul point du nœud, partagée par les deux côtés
+        self.feuille = _Maillon(cle, random.random())
+        self.haut = self.bas = self.feuille
+
+
+def _recalculer(n: _Noeud) -> None:
+    """Chaînes du sous-arbre de n à partir de celles de ses enfants."""
+    g, d = n.gauche, n.droite
+    n.haut = _fusionner(_fusionner(g.haut if g else None, n.feuille, 1.0), d.haut if d else None, 1.0)
+    n.bas = _fusionner(_fusionner(g.bas if g else None, n.feuille, -1.0), d.bas if d else None, -1.0)
+
+
+def _rotation_droite(n: _Noeud) -> _Noeud:
+    g = n.gauche
+    n.gauche = g.droite
+    g.droite = n
+    _recalculer(n)
+    _recalculer(g)
+    return g
+
+
+def _rotation_gauche(n: _Noeud) -> _Noeud:
+    d = n.droite
+    n.droite = d.gauche
+    d.gauche = n
+    _recalculer(n)
+    _recalculer(d)
+    return d
+
+
+def _inserer(n: Optional[_Noeud], nouveau: _Noeud) -> _Noeud:
+    if n is None:
+        return nouveau
+    if nouveau.cle < n.cle:
+        n.gauche = _inserer(n.gauche, nouveau)
+        if n.gauche.prio > n.prio:
+            return _rotation_droite(n)
+    else:
+        n.droite = _inserer(n.droite, nouveau)
+        if n.droite.prio > n.prio:
+            return _rotation_gauche(n)
+    _recalculer(n)
+    return n
+
+
+def _supprimer(n: _Noeud, cle: Coord) -> Optional[_Noeud]:
+    if cle == n.cle:
+        return _joindre(n.gauche, n.droite)
+    if cle < n.cle:
+        n.gauche = _supprimer(n.gauche, cle)
+    else:
+        n.droite = _supprimer(n.droite, cle)
+    _recalculer(n)
+    return n
+
+
+def _joindre(a: Optional[_Noeud], b: Optional[_Noeud]) -> Optional[_Noeud]:
+    """Réunit deux sous-arbres (toutes les clés de a avant celles de b)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.droite = _joindre(a.droite, b)
+        _recalculer(a)
+        return a
+    b.gauche = _joindre(a, b.gauche)
+    _recalculer(b)
+    return b
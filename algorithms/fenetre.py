@@ -0,0 +1,68 @@
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+import time
+from geometry import Point
+from algorithms.dynamique import DynamicHull
+
+
+class EnveloppeGlissante:
+    """
+    Enveloppe convexe d'une fenêtre glissante sur un flux de points datés :
+    les `taille` derniers points et/ou ceux des `duree` dernières secondes.
+
+    Chaque arrivée insère le point dans une DynamicHull et en retire les points
+    expirés (file FIFO) : O(log³ W) par point au lieu de recalculer toute la
+    fenêtre en O(W log W) à chaque arrivée. Chaque point n'expire qu'une fois,
+    donc le coût des retraits est amorti. enveloppe() est en O(h).
+    """
+
+    def __init__(self, taille: Optional[int] = None, duree: Optional[float] = None):
+        if taille is None and duree is None:
+            raise ValueError("Il faut une taille de fenêtre, une durée, ou les deux.")
+        if taille is not None and taille < 1:
+            raise ValueError("La taille de la fenêtre doit être au moins 1.")
+        self.taille = taille
+        self.duree = duree
+        self._file = deque() # (date, point), du plus ancien au plus récent
+        self._dyn = DynamicHull()
+
+    def __len__(self) -> int:
+        return len(self._file)
+
+    def ajouter(self, p: Point, t: Optional[float] = None) -> None:
+        """
+        Ajoute le point p arrivé à la date t (time.monotonic() par défaut ;
+        les dates doivent croître), puis fait sortir les points expirés.
+        """
+        if t is None:
+            t = time.monotonic()
+        self._file.append((t, p))
+        self._dyn.insert(p)
+        if self.taille is not None:
+            while len(self._file) > self.taille:
+                self._retirer_plus_ancien()
+        self.expirer(t)
+
+    def expirer(self, t: float) -> None:
+        """Retire les points plus vieux que `duree` à la date t (sans rien ajouter)."""
+        if self.duree is None:
+            return
+        while self._file and t - self._file[0][0] > self.duree:
+            self._retirer_plus_ancien()
+
+    def enveloppe(self) -> List[Point]:
+        """Enveloppe des points de la fenêtre (sens de Jarvis, [] s'il y en a moins de 3)."""
+        return self._dyn.hull()
+
+    def _retirer_plus_ancien(self) -> None:
+        _, p = self._file.popleft()
+        self._dyn.delete(p)
+
+
+def suivre_fenetre(points: Iterable[Tuple[float, Point]], taille: Optional[int] = None,
+                   duree: Optional[float] = None) -> Iterator[List[Point]]:
+    """Pour un flux de couples (date, point), donne l'enveloppe de la fenêtre après chaque arrivée."""
+    fenetre = EnveloppeGlissante(taille, duree)
+    for t, p in points:
+        fenetre.ajouter(p, t)
+        yield fenetre.enveloppe()
@@ -0,0 +1,79 @@
+from typing import Iterable, Iterator, List, Union
+import numpy as np
+from geometry import Point, PointArray
+from algorithms.monotone import ordre_lexicographique, enveloppe_triee
+from algorithms.quatre_cadrans import filtre_quatre_cadrans
+
+# Ce qu'on accepte comme paquet de points dans un flux
+Bloc = Union[PointArray, np.ndarray, List[Point]]
+
+
+class EnveloppeFlux:
+    """
+    Enveloppe convexe d'un flux de points arrivant par paquets.
+    On ne garde que les sommets de l'enveloppe courante : chaque paquet est
+    fusionné avec eux (4 cadrans puis chaîne monotone), puis oublié.
+    Mémoire O(h + taille d'un paquet), quelle que soit la longueur du flux.
+
+    L'enveloppe courante (PointArray des sommets, sens de Jarvis) est
+    disponible à tout moment avec enveloppe().
+    """
+
+    def __init__(self, prefilter: bool = True):
+        self.prefilter = prefilter
+        self.n_points = 0 # nombre total de points reçus
+        # Sommets courants, créés au premier paquet avec son dtype : un tampon
+        # float64 dès le départ ferait passer les paquets int64 en float
+        self._x = None
+        self._y = None
+
+    def ajouter(self, bloc: Bloc) -> None:
+        """Fusionne un paquet de points dans l'enveloppe courante."""
+        pa = vers_point_array(bloc)
+        if len(pa) == 0:
+            return
+        self.n_points += len(pa)
+
+        # Les anciens sommets + le nouveau paquet : l'enveloppe de l'union est la bonne
+        if self._x is None:
+            x, y = pa.x, pa.y
+        else:
+            x = np.concatenate((self._x, pa.x))
+            y = np.concatenate((self._y, pa.y))
+        if self.prefilter:
+            garder = filtre_quatre_cadrans(PointArray._depuis_colonnes(x, y)).indices
+            x, y = x[garder], y[garder]
+
+        sommets = enveloppe_triee(x, y, ordre_lexicographique(x, y))
+        self._x, self._y = x[sommets], y[sommets]
+
+    def enveloppe(self) -> PointArray:
+        """Sommets de l'enveloppe de tous les points reçus jusqu'ici."""
+        if self.n_points < 3:
+            return PointArray(np.empty(0), np.empty(0)) # comme les autres algorithmes
+        return PointArray._depuis_colonnes(self._x.copy(), self._y.copy())
+
+
+def enveloppe_flux(blocs: Iterable[Bloc], prefilter: bool = True) -> PointArray:
+    """Consomme tout le flux et renvoie l'enveloppe finale."""
+    flux = EnveloppeFlux(prefilter)
+    for bloc in blocs:
+        flux.ajouter(bloc)
+    return flux.enveloppe()
+
+
+def suivre_enveloppe(blocs: Iterable[Bloc], prefilter: bool = True) -> Iterator[PointArray]:
+    """Comme enveloppe_flux, mais donne l'enveloppe courante après chaque paquet."""
+    flux = EnveloppeFlux(prefilter)
+    for bloc in blocs:
+        flux.ajouter(bloc)
+        yield flux.enveloppe()
+
+
+def vers_point_array(bloc: Bloc) -> PointArray:
+    """Un paquet du flux sous forme de PointArray (tableau (n, 2), liste de Point...)."""
+    if isinstance(bloc, PointArray):
+        return bloc
+    if isinstance(bloc, np.ndarray):
+        return PointArray.depuis_coords(bloc)
+    return PointArray.depuis_points(list(bloc))
@@ -1,50 +1,147 @@
-from geometry import Point, orientation, distance_carre
-from typing import List
+from geometry import PointArray, orientation_coords, orientation_xy
+import numpy as np
+
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+
+@accepte_point_array
+def trouver_enveloppe_glouton(points: PointArray) -> np.ndarray:
+    """
+    Marche de Jarvis (O(n·h)).
+    En mode entier (PointArray int64), les coordonnées deviennent des int
+    Python : orientations et distances sont exactes, sans aucun arrondi.
+    Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
+    """
 
-def trouver_enveloppe_glouton(points: List[Point]) -> List[Point]:
-   
     n = len(points)
     if n < 3:
-        return [] # On ne peut pas former un polygone avec moins de 3 points.
+        return indices_vers_tableau([]) # On ne peut pas former un polygone avec moins de 3 points.
+
+    xs, ys = points.colonnes()
 
     enveloppe = []
 
-    point_depart = min(points, key=lambda p: (p.x, p.y)) #point de départ - Point le plus à gauche (O(1))
-    point_actuel = point_depart
+    depart = min(range(n), key=lambda i: (xs[i], ys[i])) #point de départ - Point le plus à gauche (O(n))
+    actuel = depart
 
     # On boucle tant qu'on n'est pas revenu au point de départ
     while True:
-        
-        enveloppe.append(point_actuel)
 
-        candidat_suivant = points[0]
-        if candidat_suivant == point_actuel:
-            candidat_suivant = points[1]
+        enveloppe.append(actuel)
+        ax, ay = xs[actuel], ys[actuel]
 
-        for point_teste in points:
-            
-            if point_teste == point_actuel:
+        candidat = 0
+        if xs[candidat] == ax and ys[candidat] == ay:
+            candidat = 1
+
+        for i in range(n):
+            tx, ty = xs[i], ys[i]
+
+            if tx == ax and ty == ay:
                 continue
-            
-            o = orientation(point_actuel, candidat_suivant, point_teste)
-        
+
+            cx, cy = xs[candidat], ys[candidat]
+            # geometry.orientation(actuel, candidat, teste), avec un signe exact
+            o = orientation_coords(ax, ay, cx, cy, tx, ty)
+
             if o > 0: # Virage à gauche
-                candidat_suivant = point_teste
-                
+                candidat = i
+
             elif o == 0: # Les points sont colinéaires
-                # Si (point_actuel, candidat_suivant, point_teste) sont alignés, 
-                # on veut garder le point le plus éloigné du 'point_actuel'.
+                # Si (actuel, candidat, teste) sont alignés,
+                # on veut garder le point le plus éloigné de 'actuel'.
 
-                dist_c = distance_carre(point_actuel, candidat_suivant)
-                dist_t = distance_carre(point_actuel, point_teste)
+                # Produits plutôt que **2 : un float énorme donne inf, pas une OverflowError
+                dist_c = (cx - ax) * (cx - ax) + (cy - ay) * (cy - ay)
+                dist_t = (tx - ax) * (tx - ax) + (ty - ay) * (ty - ay)
 
                 if dist_t > dist_c:
-                    candidat_suivant = point_teste
+                    candidat = i
+
+        actuel = candidat
 
-        point_actuel = candidat_suivant
-        
         #Si on est revenu au point de départ, on a fait le tour complet.
-        if point_actuel == point_depart:
+        if xs[actuel] == xs[depart] and ys[actuel] == ys[depart]:
             break
-            
-    return enveloppe
\ No newline at end of file
+
+    return indices_vers_tableau(enveloppe)
+
+
+@accepte_point_array
+def trouver_enveloppe_glouton_vectorise(points: PointArray) -> np.ndarray:
+    """
+    Marche de Jarvis vectorisée : toujours O(n·h), mais chaque pas est fait
+    par NumPy sur tout le nuage d'un coup au lieu d'une boucle Python.
+    À chaque pas, depuis le sommet p atteint par la direction d :
+    1) le suivant est le point qui tourne le moins par rapport à d,
+       c.-à-d. celui qui maximise cos(d, r - p) (un argmax)
+    2) on vérifie avec la même orientation que la version classique qu'aucun
+       point n'est strictement à droite (sinon on corrige), et parmi les points
+       alignés on garde le plus éloigné.
+
+    Même résultat et même sens de parcours que trouver_enveloppe_glouton.
+    Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
+    """
+    n = len(points)
+    if n < 3:
+        return indices_vers_tableau([])
+
+    x, y = points.x, points.y
+
+    depart = int(np.lexsort((y, x))[0]) # point le plus à gauche, puis le plus bas
+    x0, y0 = x[depart], y[depart]
+
+    enveloppe = []
+    actuel = depart
+    # Depuis le point le plus à gauche, tout le nuage est à gauche de la direction « vers le bas »
+    dx, dy = 0.0, -1.0
+
+    # Coordonnées minuscules (~1e-170) : un carré de distance tomberait à 0 ;
+    # énormes (~1e300) : il déborderait. D'où np.hypot et des directions unitaires.
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore", under="ignore"):
+        while True:
+            enveloppe.append(actuel)
+            ax, ay = x[actuel], y[actuel]
+            # En float64 même en mode entier : les cosinus et distances ne servent
+            # qu'à choisir un candidat, vérifié ensuite par l'orientation exacte
+            vx = np.subtract(x, ax, dtype=np.float64)
+            vy = np.subtract(y, ay, dtype=np.float64)
+            distance = np.hypot(vx, vy)
+
+            # 1) Candidat : le plus petit angle par rapport à la direction courante
+            cosinus = (dx * vx + dy * vy) / distance
+            cosinus[(x == ax) & (y == ay)] = -np.inf # le point actuel et ses doublons (égalité exacte)
+            candidat = int(np.argmax(cosinus))
+            if cosinus[candidat] == -np.inf:
+                break # tous les points sont confondus
+
+            # 2) Vérification exacte avec geometry.orientation(actuel, candidat, teste)
+            while True:
+                o = orientation_xy(ax, ay, x[candidat], y[candidat], x, y)
+                if not (o > 0).any():
+                    break
+                candidat = int(np.argmax(o)) # strictement plus à droite : on avance
+
+            # Parmi les points alignés (même sens), le plus éloigné
+            dx, dy = _unitaire(vx[candidat], vy[candidat])
+            alignes = (o == 0) & (vx * dx + vy * dy > 0)
+            if alignes.any():
+                plus_loin = int(np.argmax(np.where(alignes, distance, -1.0)))
+                if distance[plus_loin] > distance[candidat]:
+                    candidat = plus_loin
+
+            actuel = candidat
+
+            #Si on est revenu au point de départ, on a fait le tour complet.
+            if x[actuel] == x0 and y[actuel] == y0:
+                break
+
+    return indices_vers_tableau(enveloppe)
+
+
+def _unitaire(vx: float, vy: float):
+    """Le vecteur (vx, vy) ramené à la norme 1, sans carré (ni débordement, ni 0 parasite)."""
+    norme = np.hypot(vx, vy)
+    return vx / norme, vy / norme
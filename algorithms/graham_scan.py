@@ -1,44 +1,113 @@
-from geometry import Point, orientation, distance_carre
+from geometry import PointArray, orientation_coords, orientation_xy
 from typing import List
 from functools import cmp_to_key
+import numpy as np
 
 # On importe la fonction Sklansky réutilisable
-from algorithms.sklansky import appliquer_scan_sklansky
+from algorithms.sklansky import scanner_sklansky
+from algorithms.commun import accepte_point_array, indices_vers_tableau
 
-def trouver_enveloppe_sklanski(points: List[Point]) -> List[Point]:
+# Taille des blocs de la vérification du tri par angle (temporaires NumPy bornés)
+TAILLE_BLOC = 1 << 14
+
+
+@accepte_point_array
+def trouver_enveloppe_sklanski(points: PointArray) -> np.ndarray:
     """
     Calcule l'enveloppe convexe en utilisant le Parcours de Graham.
-    Étape 1 : Tri par angle (O(n log n)) 
+    Étape 1 : Tri par angle (O(n log n))
     Étape 2 : Scan "Sklansky" (O(n))
+    Le tri par angle est vérifié avec l'orientation exacte ; en mode entier
+    (PointArray int64), le scan se fait en entiers Python exacts.
+
+    Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
     """
-    
-    n = len(points)
-    if n < 3:
+
+    return indices_vers_tableau(enveloppe_graham(points.x, points.y, np.arange(len(points))))
+
+
+def enveloppe_graham(x: np.ndarray, y: np.ndarray, indices: np.ndarray) -> List[int]:
+    """
+    Parcours de Graham sur un sous-ensemble de points donné par ses indices
+    (tableau NumPy) dans x / y. Renvoie les indices des sommets de l'enveloppe
+    (liste vide s'il y a moins de 3 points).
+    Aucune liste de n objets Python n'est créée : le tri par angle se fait en
+    NumPy et le scan lit les coordonnées à travers des memoryview.
+    """
+    if len(indices) < 3:
         return []
 
     # === ÉTAPE 1 : TROUVER LE POINT DE DÉPART ET TRIER (O(n log n)) ===
-    
+
     # 1. Trouver le point de départ : le plus bas, puis le plus à gauche
-    point_depart = min(points, key=lambda p: (p.y, p.x))
-    
-    # 2. Fonction de comparaison pour le tri par angle
-    def comparer_angles(p1: Point, p2: Point) -> int:
-        o = orientation(point_depart, p1, p2)
-        if o == 0:
-            return -1 if distance_carre(point_depart, p1) < distance_carre(point_depart, p2) else 1
-        return -1 if o > 0 else 1 # -1 si p1 est avant p2 (gauche)
+    depart = int(indices[np.lexsort((x[indices], y[indices]))[0]])
+    x0, y0 = x[depart], y[depart]
+
+    # 2. Les autres points (sans le point de départ ni ses doublons), triés par angle
+    autres = indices[(x[indices] != x0) | (y[indices] != y0)]
+    ordre_pour_scan = _trier_par_angle(x, y, depart, autres)
 
-    # 3. Trier les points (sans le point de départ) 
-    points_sans_depart = [p for p in points if p != point_depart]
-    points_tries = sorted(points_sans_depart, key=cmp_to_key(comparer_angles))
-    
-    # 4. Préparer la liste complète pour Sklansky
-    # C'est le "polygone"  que Sklansky va nettoyer
-    points_pour_scan = [point_depart] + points_tries
+    # 3. Le point de départ en tête : c'est le "polygone" que Sklansky va nettoyer
+    ordre_pour_scan = np.concatenate(([depart], ordre_pour_scan)).astype(np.intp)
 
     # === ÉTAPE 2 : APPLIQUER LE SCAN SKLANSKY (O(n)) ===
-    
+
     # On appelle simplement notre fonction réutilisable !
-    enveloppe = appliquer_scan_sklansky(points_pour_scan)
-    
-    return enveloppe
\ No newline at end of file
+    xs, ys = memoryview(x), memoryview(y)
+    return scanner_sklansky(xs, ys, memoryview(ordre_pour_scan))
+
+
+def _trier_par_angle(x: np.ndarray, y: np.ndarray, depart: int, autres: np.ndarray) -> np.ndarray:
+    """
+    Trie `autres` par angle autour du point de départ (le plus bas), dans
+    l'ordre de la comparaison exacte (orientation(depart, p_i, p_j) > 0 : p_i
+    d'abord), et à angle égal du plus proche au plus loin.
+    On trie d'abord par arctan2 (approché), puis on vérifie chaque paire de
+    voisins avec l'orientation exacte : si l'une est dans le désordre (angles
+    égaux à l'arrondi près), on reprend le tri avec la comparaison exacte, sur
+    un ordre déjà presque trié (le tri de Python est alors quasi linéaire).
+    """
+    x0, y0 = x[depart], y[depart]
+    # Sur une même demi-droite issue du point le plus bas, |dx| et |dy| croissent
+    # avec la distance : |dx| + |dy| range les points alignés sans carré
+    dx = np.subtract(x[autres], x0, dtype=np.float64)
+    dy = np.subtract(y[autres], y0, dtype=np.float64)
+    cles = np.empty((2, len(autres)))
+    np.abs(dx, out=cles[0])
+    cles[0] += np.abs(dy)
+    # Même sens que orientation() > 0 : angles décroissants
+    np.arctan2(dy, dx, out=cles[1])
+    np.negative(cles[1], out=cles[1])
+    del dx, dy
+    ordre = autres[np.lexsort(cles)]
+    del cles
+
+    # orientation(depart, p_k, p_k+1), par blocs : le signe exact dit si la paire est dans l'ordre
+    for debut in range(0, len(ordre) - 1, TAILLE_BLOC):
+        i = ordre[debut:debut + TAILLE_BLOC]
+        j = ordre[debut + 1:debut + TAILLE_BLOC + 1]
+        i = i[:len(j)]
+        o = orientation_xy(x0, y0, x[i], y[i], x[j], y[j])
+        # Différences exactes en mode entier (|c| < 2^62 : elles tiennent en int64)
+        adx_i, adx_j = np.abs(x[i] - x0), np.abs(x[j] - x0)
+        plus_proche = (adx_i < adx_j) | ((adx_i == adx_j) & (np.abs(y[i] - y0) <= np.abs(y[j] - y0)))
+        if not ((o > 0) | ((o == 0) & plus_proche)).all():
+            break
+    else:
+        return ordre
+
+    # Repli : comparaison exacte (int Python en mode entier, lus par memoryview)
+    xs, ys = memoryview(x), memoryview(y)
+    x0, y0 = xs[depart], ys[depart]
+
+    def comparer_angles(i: int, j: int) -> int:
+        # orientation(point_depart, p_i, p_j) : le signe exact garde un tri cohérent
+        o = orientation_coords(x0, y0, xs[i], ys[i], xs[j], ys[j])
+        if o == 0:
+            d_i = (xs[i] - x0) * (xs[i] - x0) + (ys[i] - y0) * (ys[i] - y0)
+            d_j = (xs[j] - x0) * (xs[j] - x0) + (ys[j] - y0) * (ys[j] - y0)
+            return -1 if d_i < d_j else 1
+        return -1 if o > 0 else 1 # -1 si p_i est avant p_j (gauche)
+
+    return np.array(sorted(ordre.tolist(), key=cmp_to_key(comparer_angles)), dtype=np.intp)
@@ -0,0 +1,27 @@
+import numpy as np
+from geometry import PointArray
+from fichiers_points import ouvrir_points
+from algorithms.flux import EnveloppeFlux
+
+# 2^16 points par tranche : 512 Ko par coordonnée, la tranche reste dans le cache L2
+# pendant le filtrage et les passes vectorisées, et le surcoût par tranche est négligeable
+TAILLE_BLOC = 1 << 16
+
+
+def trouver_enveloppe_fichier(chemin: str, taille_bloc: int = TAILLE_BLOC, prefilter: bool = True) -> PointArray:
+    """
+    Enveloppe convexe d'un fichier de points trop gros pour la mémoire
+    (format planaire ou .npy, voir fichiers_points.py).
+    Le fichier est projeté en mémoire (np.memmap) et lu tranche par tranche :
+    chaque tranche est réduite (4 cadrans + chaîne monotone) avec les sommets
+    de l'enveloppe courante, comme pour un flux. Aucun Point n'est créé.
+
+    Renvoie les sommets de l'enveloppe (PointArray, sens de Jarvis).
+    """
+    x, y = ouvrir_points(chemin)
+    flux = EnveloppeFlux(prefilter)
+    for debut in range(0, len(x), taille_bloc):
+        fin = debut + taille_bloc
+        # np.array : copie contiguë de la tranche (lecture disque séquentielle)
+        flux.ajouter(PointArray(np.array(x[debut:fin]), np.array(y[debut:fin])))
+    return flux.enveloppe()
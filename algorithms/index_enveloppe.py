@@ -0,0 +1,258 @@
+from fractions import Fraction
+from typing import List, Tuple, Union
+import numpy as np
+from geometry import Point, PointArray, orientation_xy, ERREUR_ORIENTATION, PLUS_PETIT_NORMAL
+from algorithms.flux import Bloc, vers_point_array
+
+# Résultat de position_batch
+EXTERIEUR, BORD, INTERIEUR = -1, 0, 1
+
+
+class HullIndex:
+    """
+    Index sur un polygone convexe (typiquement une enveloppe déjà calculée,
+    par ex. avec appliquer_scan_sklansky) pour répondre très vite à beaucoup
+    de requêtes, chacune en O(log h) au lieu de O(h) :
+    - le point est-il dans le polygone ?           contient / contient_batch
+    - quel sommet est extrême dans la direction d ? extreme / extreme_batch
+    - quels sommets sont les tangentes depuis p ?   tangentes / tangentes_batch
+
+    Les versions _batch prennent des tableaux de requêtes (PointArray, tableau
+    (n, 2) ou liste de Point) et font toutes les dichotomies en même temps,
+    avec des passes NumPy : O(n log h) sans boucle Python sur les requêtes.
+
+    Le polygone peut être donné dans un sens ou dans l'autre (Jarvis, Graham...),
+    mais doit être strictement convexe (pas de sommets alignés ni confondus).
+    Les indices renvoyés sont ceux des sommets dans le polygone donné.
+    Tous les tests de côté utilisent l'orientation exacte de geometry.
+    """
+
+    def __init__(self, polygone: Union[List[Point], PointArray]):
+        pa = polygone if isinstance(polygone, PointArray) else PointArray.depuis_points(polygone)
+        k = len(pa)
+        if k < 3:
+            raise ValueError("HullIndex : il faut un polygone d'au moins 3 sommets.")
+
+        x, y = pa.x, pa.y
+        suivant = np.roll(np.arange(k), -1)
+        apres = np.roll(suivant, -1)
+        virages = orientation_xy(x, y, x[suivant], y[suivant], x[apres], y[apres])
+        if (virages < 0).all():
+            self._ordre = np.arange(k) # déjà dans le sens trigonométrique (sens de Jarvis)
+        elif (virages > 0).all():
+            self._ordre = np.arange(k)[::-1].copy() # sens horaire (Graham) : on le retourne
+        else:
+            raise ValueError("HullIndex : le polygone n'est pas strictement convexe.")
+
+        # Sommets dans le sens trigonométrique : tout le polygone est à gauche de chaque arête
+        self._x = x[self._ordre]
+        self._y = y[self._ordre]
+
+        # Angles des arêtes, croissants à partir de celui de l'arête 0 (pour extreme)
+        ex = np.roll(self._x, -1) - self._x
+        ey = np.roll(self._y, -1) - self._y
+        theta = np.arctan2(ey, ex)
+        self._angles = theta[0] + np.mod(theta - theta[0], 2 * np.pi)
+
+        # Même polygone vu dans un miroir (x -> -x) et parcouru à l'envers : encore
+        # dans le sens trigonométrique. Sa tangente « suivante » est l'autre tangente.
+        self._x_miroir = -self._x[::-1]
+        self._y_miroir = self._y[::-1]
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    # =========================================================================
+    # 1) Point dans le polygone
+    # =========================================================================
+    def position_batch(self, requetes: Bloc) -> np.ndarray:
+        """
+        Pour chaque point : EXTERIEUR (-1), BORD (0) ou INTERIEUR (1), en int8.
+        Éventail autour du sommet 0 : une dichotomie trouve le triangle
+        (0, i, i + 1) qui contient la direction du point, puis un test de côté
+        sur l'arête (i, i + 1) conclut.
+        """
+        rq = vers_point_array(requetes)
+        rx, ry = rq.x, rq.y
+        hx, hy, k = self._x, self._y, len(self._x)
+        x0, y0 = hx[0], hy[0]
+
+        # Dans le cône de sommet 0 ? (à gauche de 0 -> 1 et à droite de 0 -> k-1)
+        c1 = _gauche(x0, y0, hx[1], hy[1], rx, ry)
+        cn = _gauche(x0, y0, hx[k - 1], hy[k - 1], rx, ry)
+
+        # Dernier i dans [1, k - 2] avec le point à gauche (ou sur) 0 -> i
+        lo = np.ones(len(rx), dtype=np.intp)
+        hi = np.full(len(rx), k - 2, dtype=np.intp)
+        while (lo < hi).any():
+            milieu = (lo + hi + 1) // 2
+            ok = _gauche(x0, y0, hx[milieu], hy[milieu], rx, ry) >= 0
+            lo = np.where(ok, milieu, lo)
+            hi = np.where(ok, hi, milieu - 1)
+
+        e = _gauche(hx[lo], hy[lo], hx[lo + 1], hy[lo + 1], rx, ry)
+        position = np.sign(e).astype(np.int8)
+        # Sur l'une des deux arêtes qui partent du sommet 0
+        position[(position > 0) & (((lo == 1) & (c1 == 0)) | ((lo == k - 2) & (cn == 0)))] = BORD
+        position[(c1 < 0) | (cn > 0)] = EXTERIEUR
+        return position
+
+    def contient_batch(self, requetes: Bloc, strict: bool = False) -> np.ndarray:
+        """Tableau de booléens : chaque point est-il dans le polygone (bord compris sauf si strict) ?"""
+        position = self.position_batch(requetes)
+        return position > 0 if strict else position >= 0
+
+    def contient(self, p: Point, strict: bool = False) -> bool:
+        return bool(self.contient_batch([p], strict)[0])
+
+    # =========================================================================
+    # 2) Sommet extrême dans une direction
+    # =========================================================================
+    def extreme_batch(self, directions: Bloc) -> np.ndarray:
+        """
+        Pour chaque direction d, l'indice d'un sommet qui maximise le produit
+        scalaire <sommet, d>. Les arêtes d'un polygone convexe sont rangées par
+        angle : le sommet cherché est le début de la première arête qui fait un
+        angle d'au moins 90° avec d (un searchsorted). Les angles étant arrondis,
+        on vérifie ensuite avec les voisins (et on avance si besoin), en
+        comparant les produits scalaires exactement (voir _plus_loin).
+        """
+        rq = vers_point_array(directions)
+        dx, dy = rq.x, rq.y
+        hx, hy, k = self._x, self._y, len(self._x)
+
+        cible = np.arctan2(dy, dx) + np.pi / 2
+        cible = self._angles[0] + np.mod(cible - self._angles[0], 2 * np.pi)
+        i = np.searchsorted(self._angles, cible) % k
+
+        # Correction locale : on monte tant qu'un voisin fait strictement mieux
+        while True:
+            suivant, precedent = (i + 1) % k, (i - 1) % k
+            mieux_suivant = _plus_loin(hx, hy, suivant, i, dx, dy)
+            mieux_precedent = _plus_loin(hx, hy, precedent, i, dx, dy)
+            if not (mieux_suivant | mieux_precedent).any():
+                break
+            i = np.where(mieux_suivant, suivant, np.where(mieux_precedent, precedent, i))
+        return self._ordre[i]
+
+    def extreme(self, dx: float, dy: float) -> int:
+        return int(self.extreme_batch(np.array([[dx, dy]]))[0])
+
+    # =========================================================================
+    # 3) Tangentes depuis un point extérieur
+    # =========================================================================
+    def tangentes_batch(self, requetes: Bloc) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pour chaque point p strictement extérieur, les deux sommets de contact
+        (i, j) des tangentes issues de p : tout le polygone est à gauche de la
+        droite p -> sommet i et à droite de p -> sommet j (sens trigonométrique
+        usuel). Si une arête est alignée avec p, on garde le sommet le plus
+        éloigné (comme Jarvis). -1 pour les points intérieurs ou sur le bord.
+        """
+        rq = vers_point_array(requetes)
+        rx, ry = rq.x, rq.y
+        k = len(self._x)
+
+        dehors = self.position_batch(rq) == EXTERIEUR
+        px, py = rx[dehors], ry[dehors]
+        i = _tangente_batch(self._x, self._y, px, py)
+        # Dans le miroir (x -> -x), la position j correspond au sommet k - 1 - j
+        j = k - 1 - _tangente_batch(self._x_miroir, self._y_miroir, -px, py)
+
+        gauche = np.full(len(rx), -1, dtype=np.intp)
+        droite = np.full(len(rx), -1, dtype=np.intp)
+        gauche[dehors] = self._ordre[i]
+        droite[dehors] = self._ordre[j]
+        return gauche, droite
+
+    def tangentes(self, p: Point) -> Tuple[int, int]:
+        gauche, droite = self.tangentes_batch([p])
+        return int(gauche[0]), int(droite[0])
+
+
+def _gauche(ax, ay, bx, by, rx, ry) -> np.ndarray:
+    """> 0 si r est à gauche de a -> b (sens usuel), 0 si aligné : -orientation(a, b, r), signe exact."""
+    return -orientation_xy(ax, ay, bx, by, rx, ry)
+
+
+def _plus_loin(hx, hy, j, i, dx, dy) -> np.ndarray:
+    """
+    True là où le sommet j fait strictement mieux que le sommet i dans la
+    direction d : signe exact de <h[j] - h[i], d>. En int64, hx[i] * dx déborde
+    près de 2^62 ; en float64 deux scores proches sont mal départagés. Même
+    filtre que geometry.orientation_xy, puis recalcul exact des cas douteux.
+    """
+    ex = hx[j] - hx[i] # exact en mode entier (|c| < 2^62)
+    ey = hy[j] - hy[i]
+    with np.errstate(over="ignore", invalid="ignore"):
+        gauche = np.multiply(ex, dx, dtype=np.float64)
+        droite = np.multiply(ey, dy, dtype=np.float64)
+        val = gauche + droite
+        borne = ERREUR_ORIENTATION * (np.abs(gauche) + np.abs(droite))
+    doute = (np.abs(val) <= borne) | np.isnan(val) | (borne < PLUS_PETIT_NORMAL)
+    # Un facteur nul dans chaque produit : le 0 est exact
+    doute &= ~(((ex == 0) | (dx == 0)) & ((ey == 0) | (dy == 0)))
+
+    mieux = val > 0
+    if doute.any():
+        quoi = np.flatnonzero(doute)
+        # tolist : int ou float Python, que Fraction convertit exactement
+        cols = [t[quoi].tolist() for t in (hx[j], hx[i], hy[j], hy[i], dx, dy)]
+        mieux[quoi] = [(Fraction(ax) - Fraction(bx)) * Fraction(ux) + (Fraction(ay) - Fraction(by)) * Fraction(uy) > 0
+                       for ax, bx, ay, by, ux, uy in zip(*cols)]
+    return mieux
+
+
+def _tangente_batch(hx: np.ndarray, hy: np.ndarray, px, py, debut=0, k=None) -> np.ndarray:
+    """
+    Tangente par dichotomie, vectorisée : pour chaque point p (strictement
+    extérieur au polygone (hx, hy), sens trigonométrique), la position du sommet
+    suivant de Jarvis depuis p. Même dichotomie, menée pour tous les p à la fois.
+    Avec des tableaux debut / k, chaque requête a son propre polygone
+    hx[debut:debut + k] (Chan : un même p contre toutes les mini-enveloppes).
+    """
+    if k is None:
+        k = len(hx)
+
+    def ccw(i, j):
+        # > 0 si, vu de p, le sommet j est dans le sens trigonométrique par rapport à i
+        i, j = debut + i % k, debut + j % k
+        return _gauche(px, py, hx[i], hy[i], hx[j], hy[j])
+
+    def arete(i):
+        # > 0 : l'arête i -> i+1 est cachée vue de p ; <= 0 : elle est visible
+        return ccw(i, i + 1)
+
+    zero = np.zeros(np.broadcast(px, debut, k).shape, dtype=np.intp)
+    cachee_0 = arete(zero) > 0
+    trouve = cachee_0 & (arete(zero + k - 1) <= 0) # réponse : le sommet 0
+
+    # Sinon le sommet est dans [1, k - 1], début de la suite d'arêtes cachées
+    lo = zero + 1
+    hi = zero + k - 1
+    lo[trouve] = hi[trouve] = 0
+    while (lo < hi).any():
+        c = (lo + hi) // 2
+        cachee = arete(c) > 0
+        sens = ccw(zero, c)
+        apres = np.where(cachee_0, cachee & (sens < 0), cachee | (sens > 0))
+        actif = lo < hi
+        hi = np.where(actif & apres, c, hi)
+        lo = np.where(actif & ~apres, c + 1, lo)
+    q = lo
+
+    # Arête alignée avec p : on garde le plus éloigné des deux sommets
+    a = (q - 1) % k
+    alignee = arete(a) == 0
+    if alignee.any():
+        da = _distance_carre(hx[debut + a], hy[debut + a], px, py)
+        dq = _distance_carre(hx[debut + q], hy[debut + q], px, py)
+        q = np.where(alignee & (da > dq), a, q)
+    return q
+
+
+def _distance_carre(ax, ay, bx, by) -> np.ndarray:
+    # En float64 : en mode entier, les carrés peuvent dépasser un int64
+    dx = np.subtract(ax, bx, dtype=np.float64)
+    dy = np.subtract(ay, by, dtype=np.float64)
+    return dx * dx + dy * dy
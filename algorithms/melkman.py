@@ -0,0 +1,122 @@
+from collections import deque
+from typing import Iterable, List
+import numpy as np
+from geometry import Point, PointArray, orientation_coords
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+
+class EnveloppeMelkman:
+    """
+    Enveloppe convexe d'une polyligne simple (sans auto-intersection), construite
+    en ligne avec l'algorithme de Melkman : les sommets arrivent un par un
+    (trace GPS, contour d'image...) et chaque push coûte O(1) amorti.
+
+    L'enveloppe est gardée dans une file à deux bouts dont les deux extrémités
+    sont le dernier sommet ajouté. Comme la polyligne ne se recoupe pas, le
+    sommet suivant ne peut sortir de l'enveloppe qu'à côté de ce dernier sommet :
+    on ne teste donc que les deux arêtes qui le touchent, puis on dépile de
+    chaque côté les sommets devenus rentrants (chaque sommet n'est dépilé
+    qu'une fois de chaque côté). Contrairement au scan de Sklansky, c'est
+    correct pour n'importe quel polygone ou polyligne simple.
+
+    Si la polyligne se recoupe, le résultat n'est pas garanti.
+    """
+
+    def __init__(self, points: Iterable[Point] = ()):
+        self._file = deque() # (x, y, étiquette), du bas vers le haut, sens trigo
+        self._debut = [] # sommets tant qu'ils sont tous alignés (au plus les 2 extrêmes)
+        self._n = 0
+        for p in points:
+            self.push(p)
+
+    def __len__(self) -> int:
+        """Nombre de sommets reçus."""
+        return self._n
+
+    def push(self, p: Point) -> None:
+        """Ajoute le sommet suivant de la polyligne."""
+        self._ajouter(p.x, p.y, p)
+
+    def hull(self) -> List[Point]:
+        """
+        Enveloppe courante, dans le même sens que les autres algorithmes (sens
+        de Jarvis, départ au point le plus à gauche, pas de points alignés).
+        Moins de 3 sommets reçus : []. Tous alignés : les extrémités distinctes.
+        """
+        return self._etiquettes()
+
+    def _ajouter(self, x, y, etiquette) -> None:
+        self._n += 1
+        f = self._file
+        if not f:
+            self._demarrer(x, y, etiquette)
+            return
+
+        # Sommet dans l'enveloppe (ou sur son bord) : rien ne change
+        if (_gauche(f[-2], f[-1], x, y) >= 0) and (_gauche(f[0], f[1], x, y) >= 0):
+            return
+
+        # Côté haut : on enlève les sommets qui ne tournent plus à gauche
+        while _gauche(f[-2], f[-1], x, y) <= 0:
+            f.pop()
+        # Côté bas, symétrique (le nouveau sommet est avant f[0])
+        while _gauche(f[0], f[1], x, y) <= 0:
+            f.popleft()
+        sommet = (x, y, etiquette)
+        f.append(sommet)
+        f.appendleft(sommet)
+
+    def _demarrer(self, x, y, etiquette) -> None:
+        """Tant que tout est aligné, on ne garde que les deux extrémités du segment."""
+        sommet = (x, y, etiquette)
+        debut = self._debut # triés dans l'ordre lexicographique
+        if len(debut) < 2:
+            if not debut or (x, y) != debut[0][:2]:
+                debut.append(sommet)
+                debut.sort(key=lambda s: (s[0], s[1]))
+            return
+
+        a, b = debut
+        o = _gauche(a, b, x, y)
+        if o == 0:
+            # Encore aligné : le sommet remplace l'extrémité qu'il dépasse
+            if (x, y) < a[:2]:
+                debut[0] = sommet
+            elif (x, y) > b[:2]:
+                debut[1] = sommet
+            return
+
+        # Premier sommet hors de la droite : triangle (a, b, sommet) en sens trigo
+        if o < 0:
+            a, b = b, a
+        self._file.extend((sommet, a, b, sommet))
+        self._debut = []
+
+    def _etiquettes(self) -> list:
+        if self._n < 3:
+            return []
+        if not self._file:
+            return [s[2] for s in self._debut]
+        sommets = list(self._file)[:-1]
+        depart = min(range(len(sommets)), key=lambda k: sommets[k][:2])
+        return [s[2] for s in sommets[depart:] + sommets[:depart]]
+
+
+@accepte_point_array(filtrable=False)
+def trouver_enveloppe_melkman(polyligne: PointArray) -> np.ndarray:
+    """
+    Enveloppe convexe d'une polyligne simple (ou d'un polygone simple, les
+    sommets dans l'ordre du contour) en temps linéaire O(n), sans tri.
+    À préférer à appliquer_scan_sklansky, qui échoue sur certains polygones simples.
+    Pas de prefilter= / epsilon= ici (TypeError) : ne garder qu'une partie
+    des sommets peut rendre la polyligne non simple.
+    """
+    enveloppe = EnveloppeMelkman()
+    for i, (x, y) in enumerate(zip(polyligne.x.tolist(), polyligne.y.tolist())):
+        enveloppe._ajouter(x, y, i)
+    return indices_vers_tableau(enveloppe._etiquettes())
+
+
+def _gauche(a, b, x, y):
+    """> 0 si (a, b, (x, y)) tourne à gauche (sens trigo), signe exact."""
+    return -orientation_coords(a[0], a[1], b[0], b[1], x, y)
@@ -0,0 +1,275 @@
+from dataclasses import dataclass
+from typing import List, Tuple, Union
+import math
+import numpy as np
+from geometry import Point, PointArray
+from algorithms.monotone import trouver_enveloppe_monotone
+
+# Mesures sur une enveloppe déjà calculée (sortie de n'importe quel algorithme :
+# liste de Point, ou pa[indices] pour un PointArray), par « pieds à coulisse
+# tournants » (rotating calipers) : on fait tourner des droites d'appui autour
+# du polygone convexe, chaque pointeur ne fait qu'un tour => O(h).
+Polygone = Union[List[Point], PointArray]
+
+
+@dataclass(frozen=True)
+class Rectangle:
+    """Rectangle (pas forcément aligné sur les axes) : 4 coins dans le sens trigonométrique."""
+    coins: Tuple[Point, Point, Point, Point]
+    largeur: float # le long de l'arête d'appui
+    hauteur: float
+
+    @property
+    def aire(self) -> float:
+        return self.largeur * self.hauteur
+
+    @property
+    def perimetre(self) -> float:
+        return 2 * (self.largeur + self.hauteur)
+
+
+# =============================================================================
+# 1) Aire et centroïde (un polygone, ou des lots de polygones)
+# =============================================================================
+def aire(polygone: Polygone) -> float:
+    """Aire du polygone (formule du lacet), quel que soit son sens de parcours."""
+    x, y = _coordonnees(polygone)
+    return abs(_aire_signee(x, y))
+
+
+def centroide(polygone: Polygone) -> Point:
+    """Centre de gravité de la surface (moyenne des sommets si le polygone est plat)."""
+    x, y = _coordonnees(polygone)
+    offsets = np.array([0, len(x)])
+    cx, cy = _centroides(x, y, offsets)
+    return Point(float(cx[0]), float(cy[0]))
+
+
+def aires_batch(coords, offsets) -> np.ndarray:
+    """
+    Aires de beaucoup de polygones d'un coup, en disposition « CSR » comme
+    hull_many : le polygone i est formé des lignes offsets[i] à offsets[i + 1] - 1
+    de coords (tableau (N, 2) ou PointArray). Ex : aires_batch(coords[sommets], offsets_env).
+    """
+    x, y = _colonnes(coords)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    return np.abs(_aires_signees(x, y, offsets))
+
+
+def centroides_batch(coords, offsets) -> np.ndarray:
+    """Centroïdes de beaucoup de polygones (même entrée que aires_batch), en tableau (k, 2)."""
+    x, y = _colonnes(coords)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    return np.column_stack(_centroides(x, y, offsets))
+
+
+def _aire_signee(x: np.ndarray, y: np.ndarray) -> float:
+    return float(_aires_signees(x, y, np.array([0, len(x)]))[0])
+
+
+def _produits_lacet(x: np.ndarray, y: np.ndarray, offsets: np.ndarray):
+    """
+    Pour chaque sommet : (numéro du polygone, coordonnées relatives au premier
+    sommet de son polygone, terme x_i y_{i+1} - x_{i+1} y_i de la formule du lacet).
+    Se ramener au premier sommet évite de perdre des chiffres loin de l'origine.
+    """
+    tailles = np.diff(offsets)
+    ensemble = np.repeat(np.arange(len(tailles)), tailles)
+    premier = offsets[:-1][ensemble]
+    suivant = np.arange(len(x)) + 1
+    non_vides = tailles > 0
+    suivant[offsets[1:][non_vides] - 1] = offsets[:-1][non_vides] # le dernier rejoint le premier
+    rx = x - x[premier]
+    ry = y - y[premier]
+    croix = rx * ry[suivant] - rx[suivant] * ry
+    return ensemble, rx, ry, suivant, croix
+
+
+def _aires_signees(x: np.ndarray, y: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    ensemble, _, _, _, croix = _produits_lacet(x, y, offsets)
+    return np.bincount(ensemble, weights=croix, minlength=len(offsets) - 1) / 2
+
+
+def _centroides(x: np.ndarray, y: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    k = len(offsets) - 1
+    ensemble, rx, ry, suivant, croix = _produits_lacet(x, y, offsets)
+    aire6 = 3 * np.bincount(ensemble, weights=croix, minlength=k)
+    sx = np.bincount(ensemble, weights=(rx + rx[suivant]) * croix, minlength=k)
+    sy = np.bincount(ensemble, weights=(ry + ry[suivant]) * croix, minlength=k)
+
+    # Polygone plat (segment, point) : la formule divise par 0, on prend la moyenne des sommets
+    tailles = np.maximum(np.diff(offsets), 1)
+    plat = aire6 == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cx = np.where(plat, np.bincount(ensemble, weights=rx, minlength=k) / tailles, sx / aire6)
+        cy = np.where(plat, np.bincount(ensemble, weights=ry, minlength=k) / tailles, sy / aire6)
+    # Retour aux coordonnées d'origine (polygone vide : pas de centroïde)
+    vide = np.diff(offsets) == 0
+    premier = np.where(vide, 0, offsets[:-1])
+    if len(x):
+        cx = cx + x[premier]
+        cy = cy + y[premier]
+    cx[vide] = cy[vide] = np.nan
+    return cx, cy
+
+
+# =============================================================================
+# 2) Pieds à coulisse tournants
+# =============================================================================
+def diametre(polygone: Polygone) -> Tuple[int, int, float]:
+    """
+    Paire de sommets la plus éloignée : (i, j, distance), indices dans le polygone.
+    Seules les paires « antipodales » (touchées par deux droites d'appui
+    parallèles) sont candidates : il y en a O(h).
+    """
+    xs, ys, ordre = _sens_trigo(polygone)
+    h = len(xs)
+    if h == 1:
+        return ordre[0], ordre[0], 0.0
+
+    meilleur = (0, 0, -1.0)
+    j = 1
+    for i in range(h):
+        i2 = (i + 1) % h
+        # On avance j tant qu'il s'éloigne de l'arête (i, i+1)
+        while _double_aire(xs, ys, i, i2, (j + 1) % h) > _double_aire(xs, ys, i, i2, j):
+            j = (j + 1) % h
+        for a in (i, i2):
+            d = _distance_carre(xs, ys, a, j)
+            if d > meilleur[2]:
+                meilleur = (a, j, d)
+    i, j, d = meilleur
+    return ordre[i], ordre[j], math.sqrt(d)
+
+
+def largeur(polygone: Polygone) -> Tuple[int, int, float]:
+    """
+    Largeur minimale : plus petite distance entre deux droites d'appui parallèles.
+    Renvoie (i, j, largeur) : l'arête (i, i + 1) et le sommet opposé j réalisent
+    le minimum (indices dans le polygone, arête prise dans son sens de parcours).
+    """
+    xs, ys, ordre = _sens_trigo(polygone)
+    h = len(xs)
+    if h < 3:
+        return ordre[0], ordre[-1], 0.0 # polygone plat
+
+    meilleur = (0, 0, math.inf)
+    j = 1
+    for i in range(h):
+        i2 = (i + 1) % h
+        while _double_aire(xs, ys, i, i2, (j + 1) % h) > _double_aire(xs, ys, i, i2, j):
+            j = (j + 1) % h
+        d = _double_aire(xs, ys, i, i2, j) / math.sqrt(_distance_carre(xs, ys, i, i2))
+        if d < meilleur[2]:
+            meilleur = (i, j, d)
+    i, j, d = meilleur
+    if ordre[0] != 0:
+        i = (i + 1) % h # polygone retourné : l'arête (i, i+1) commence à l'autre bout
+    return ordre[i], ordre[j], d
+
+
+def rectangle_aire_min(polygone: Polygone) -> Rectangle:
+    """Rectangle d'aire minimale contenant le polygone (un de ses côtés porte une arête)."""
+    return min(_rectangles(polygone), key=lambda r: r.aire)
+
+
+def rectangle_perimetre_min(polygone: Polygone) -> Rectangle:
+    """Rectangle de périmètre minimal contenant le polygone (un de ses côtés porte une arête)."""
+    return min(_rectangles(polygone), key=lambda r: r.perimetre)
+
+
+def _rectangles(polygone: Polygone) -> List[Rectangle]:
+    """
+    Pour chaque arête, le rectangle qui s'y appuie : trois autres pieds à coulisse
+    (le plus loin dans le sens de l'arête, à l'opposé, et derrière) tournent avec
+    elle. Les deux rectangles optimaux sont parmi ces h rectangles (Freeman–Shapira).
+    """
+    xs, ys, _ = _sens_trigo(polygone)
+    h = len(xs)
+    if h < 3:
+        raise ValueError("Il faut un polygone non plat (au moins 3 sommets non alignés).")
+
+    def projection(k, ux, uy):
+        return xs[k] * ux + ys[k] * uy
+
+    rectangles = []
+    droite = haut = gauche = None
+    for i in range(h):
+        i2 = (i + 1) % h
+        norme = math.sqrt(_distance_carre(xs, ys, i, i2))
+        ux, uy = (xs[i2] - xs[i]) / norme, (ys[i2] - ys[i]) / norme
+        vx, vy = -uy, ux # normale vers l'intérieur (sens trigonométrique)
+
+        if droite is None:
+            # Premier rectangle : on place les trois pieds en O(h)
+            droite = max(range(h), key=lambda k: projection(k, ux, uy))
+            haut = max(range(h), key=lambda k: projection(k, vx, vy))
+            gauche = min(range(h), key=lambda k: projection(k, ux, uy))
+        else:
+            while projection((droite + 1) % h, ux, uy) > projection(droite, ux, uy):
+                droite = (droite + 1) % h
+            while projection((haut + 1) % h, vx, vy) > projection(haut, vx, vy):
+                haut = (haut + 1) % h
+            while projection((gauche + 1) % h, ux, uy) < projection(gauche, ux, uy):
+                gauche = (gauche + 1) % h
+
+        base = projection(i, ux, uy)
+        p_min = projection(gauche, ux, uy) - base
+        p_max = projection(droite, ux, uy) - base
+        hauteur = projection(haut, vx, vy) - projection(i, vx, vy)
+        ax, ay = xs[i], ys[i]
+        coins = (Point(ax + p_min * ux, ay + p_min * uy),
+                 Point(ax + p_max * ux, ay + p_max * uy),
+                 Point(ax + p_max * ux + hauteur * vx, ay + p_max * uy + hauteur * vy),
+                 Point(ax + p_min * ux + hauteur * vx, ay + p_min * uy + hauteur * vy))
+        rectangles.append(Rectangle(coins, p_max - p_min, hauteur))
+    return rectangles
+
+
+def paire_la_plus_eloignee(points: Polygone) -> Tuple[Point, Point, float]:
+    """
+    Les deux points les plus éloignés d'un nuage quelconque : enveloppe
+    (chaîne monotone) puis diamètre par pieds à coulisse, O(n log n + h)
+    au lieu de comparer toutes les paires en O(n²).
+    """
+    pa = points if isinstance(points, PointArray) else PointArray.depuis_points(points)
+    if len(pa) == 0:
+        raise ValueError("Nuage vide.")
+    # Moins de 3 points : pas d'enveloppe, les points eux-mêmes suffisent
+    sommets = trouver_enveloppe_monotone(pa) if len(pa) >= 3 else np.arange(len(pa))
+    i, j, d = diametre(pa[sommets])
+    return pa[int(sommets[i])], pa[int(sommets[j])], d
+
+
+# =============================================================================
+# 3) Outils
+# =============================================================================
+def _colonnes(coords) -> Tuple[np.ndarray, np.ndarray]:
+    pa = coords if isinstance(coords, PointArray) else PointArray.depuis_coords(coords)
+    return pa.x.astype(np.float64), pa.y.astype(np.float64)
+
+
+def _coordonnees(polygone: Polygone) -> Tuple[np.ndarray, np.ndarray]:
+    pa = polygone if isinstance(polygone, PointArray) else PointArray.depuis_points(polygone)
+    if len(pa) == 0:
+        raise ValueError("Polygone vide.")
+    # En float64 même en mode entier : les mesures ne sont de toute façon pas entières
+    return pa.x.astype(np.float64), pa.y.astype(np.float64)
+
+
+def _sens_trigo(polygone: Polygone) -> Tuple[List[float], List[float], List[int]]:
+    """Sommets en listes Python, remis dans le sens trigonométrique, et leurs indices d'origine."""
+    x, y = _coordonnees(polygone)
+    ordre = list(range(len(x)))
+    if _aire_signee(x, y) < 0:
+        ordre.reverse() # sens horaire (Graham...)
+    return x[ordre].tolist(), y[ordre].tolist(), ordre
+
+
+def _double_aire(xs: List[float], ys: List[float], a: int, b: int, c: int) -> float:
+    """Deux fois l'aire (signée, > 0 dans le sens trigo) du triangle (a, b, c)."""
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+
+def _distance_carre(xs: List[float], ys: List[float], a: int, b: int) -> float:
+    return (xs[b] - xs[a]) ** 2 + (ys[b] - ys[a]) ** 2
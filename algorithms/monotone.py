@@ -0,0 +1,159 @@
+from typing import List
+import numpy as np
+from geometry import PointArray, orientation_coords, orientation_xy
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+# Si une passe vectorisée retire moins que cette fraction des points restants,
+# on termine la chaîne avec la pile classique (les passes ne sont plus rentables).
+FRACTION_MIN_PAR_PASSE = 0.05
+
+
+@accepte_point_array
+def trouver_enveloppe_monotone(points: PointArray) -> np.ndarray:
+    """
+    Chaîne monotone d'Andrew, version NumPy (O(n log n)).
+    1) un seul tri lexicographique (x, puis y)
+    2) construction des chaînes haute et basse par passes vectorisées :
+       à chaque passe on calcule d'un coup l'orientation de tous les triplets
+       consécutifs et on retire tous les points « rentrants ».
+
+    L'enveloppe est donnée dans le même sens que Jarvis, en partant du point
+    le plus à gauche (puis le plus bas).
+    Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
+    """
+    if len(points) < 3:
+        return indices_vers_tableau([])
+
+    ordre = ordre_lexicographique(points.x, points.y)
+    return enveloppe_triee(points.x, points.y, ordre)
+
+
+def ordre_lexicographique(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Indices qui trient les points par x puis par y.
+    Équivalent à np.lexsort((y, x)) mais bien plus rapide sur de gros tableaux :
+    on trie seulement sur x, puis on ne re-trie que les paquets d'abscisses égales
+    (rares sur des flottants).
+    En mode entier, les abscisses égales sont la règle (grilles de pixels) : on
+    trie plutôt une seule clé int64 qui range directement par (x, y).
+    """
+    if x.dtype.kind in "iu":
+        cle = _cle_entiere(x, y)
+        if cle is not None:
+            return np.argsort(cle)
+    ordre = np.argsort(x)
+    xs = x[ordre]
+    egaux = xs[1:] == xs[:-1]
+    if egaux.any():
+        dans_paquet = np.zeros(len(ordre), dtype=bool)
+        dans_paquet[1:] |= egaux
+        dans_paquet[:-1] |= egaux
+        # Les paquets sont contigus et déjà rangés par x croissant : trier le
+        # sous-ensemble par (x, y) et le remettre aux mêmes places suffit
+        sous_ordre = ordre[dans_paquet]
+        ordre[dans_paquet] = sous_ordre[np.lexsort((y[sous_ordre], xs[dans_paquet]))]
+    return ordre
+
+
+def _cle_entiere(x: np.ndarray, y: np.ndarray):
+    """
+    (x - x_min) * hauteur + (y - y_min), avec hauteur = étendue des y + 1 : même ordre
+    que (x, y). None si la clé risque de déborder d'un int64 (trop grande étendue).
+    """
+    if len(x) == 0:
+        return None
+    x0, y0 = int(x.min()), int(y.min())
+    hauteur = int(y.max()) - y0 + 1
+    if (int(x.max()) - x0 + 1) * hauteur >= 2 ** 63:
+        return None
+    return (x - x0) * hauteur + (y - y0)
+
+
+def enveloppe_triee(x: np.ndarray, y: np.ndarray, ordre: np.ndarray, bord: bool = False) -> np.ndarray:
+    """
+    Enveloppe convexe des points `ordre` (indices dans x / y) déjà triés
+    lexicographiquement. Renvoie les indices (dans x / y) des sommets.
+    Permet de réutiliser un tri déjà fait (plusieurs enveloppes, couches...).
+    bord=True : garde aussi les points alignés sur les arêtes (tout le bord de
+    l'enveloppe, dans l'ordre de parcours), sans les doublons.
+    """
+    xs = x[ordre]
+    ys = y[ordre]
+
+    # Les doublons cassent le retrait simultané (deux copies d'un même sommet
+    # se « cacheraient » mutuellement) : on ne garde qu'un exemplaire.
+    if len(ordre) > 1:
+        distinct = np.ones(len(ordre), dtype=bool)
+        distinct[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+        if not distinct.all():
+            ordre, xs, ys = ordre[distinct], xs[distinct], ys[distinct]
+
+    if len(ordre) < 3:
+        return indices_vers_tableau(ordre)
+
+    # Première passe commune : le segment [premier, dernier] sert de témoin,
+    # chaque point ne peut appartenir qu'à la chaîne située de son côté.
+    cote = orientation_xy(xs[0], ys[0], xs, ys, xs[-1], ys[-1])
+    cote[0] = cote[-1] = 0.0
+
+    haut = _chaine(xs, ys, 1.0, cote, bord)   # de gauche à droite, virages « > 0 »
+    bas = _chaine(xs, ys, -1.0, cote, bord)   # de gauche à droite, virages « < 0 »
+
+    if bord and not cote.any():
+        # Tous alignés : la chaîne basse contient déjà tous les points, de gauche à droite
+        return ordre[bas]
+
+    # On parcourt la chaîne basse puis la chaîne haute à l'envers,
+    # sans répéter les deux extrémités communes
+    positions = np.concatenate((bas, haut[-2:0:-1]))
+    return ordre[positions]
+
+
+def _chaine(xs: np.ndarray, ys: np.ndarray, sens: float, cote: np.ndarray, bord: bool = False) -> np.ndarray:
+    """
+    Renvoie les positions (dans xs / ys triés) d'une demi-enveloppe.
+    Un point du milieu d'un triplet (p, q, r) tel que sens * orientation(p, q, r) <= 0
+    est sous (ou sur) le segment [p, r] : il ne peut pas être un sommet,
+    donc on peut retirer tous ces points en même temps.
+    `cote` contient orientation(premier, q, dernier) : c'est la première passe.
+    Avec bord=True on ne retire que les points strictement rentrants :
+    les points alignés sur une arête restent dans la chaîne.
+    """
+    garder = sens * cote >= 0 if bord else sens * cote > 0
+    garder[0] = garder[-1] = True
+    pos = np.flatnonzero(garder)
+    cx, cy = xs[pos], ys[pos]
+
+    while len(pos) > 2:
+        # orientation(p, q, r) pour tous les triplets consécutifs en une fois (signe exact)
+        o = orientation_xy(cx[:-2], cy[:-2], cx[1:-1], cy[1:-1], cx[2:], cy[2:])
+
+        garder = np.ones(len(pos), dtype=bool)
+        garder[1:-1] = sens * o >= 0 if bord else sens * o > 0
+        nb_retires = len(pos) - int(np.count_nonzero(garder))
+        if nb_retires == 0:
+            break
+
+        pos, cx, cy = pos[garder], cx[garder], cy[garder]
+
+        if nb_retires < FRACTION_MIN_PAR_PASSE * len(pos):
+            # Presque tout est déjà sur la chaîne : une pile finit le travail en O(m)
+            return pos[_chaine_pile(cx.tolist(), cy.tolist(), sens, bord)]
+
+    return pos
+
+
+def _chaine_pile(xs: List[float], ys: List[float], sens: float, bord: bool = False) -> List[int]:
+    """Demi-enveloppe par la pile classique d'Andrew (même critère que _chaine)."""
+    pile = []
+    for i in range(len(xs)):
+        rx, ry = xs[i], ys[i]
+        while len(pile) >= 2:
+            p, q = pile[-2], pile[-1]
+            o = orientation_coords(xs[p], ys[p], xs[q], ys[q], rx, ry)
+            if sens * o > 0 or (bord and o == 0):
+                break
+            pile.pop()
+        pile.append(i)
+    return pile
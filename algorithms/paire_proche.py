@@ -0,0 +1,245 @@
+from typing import Iterator, Tuple
+import math
+import numpy as np
+from algorithms.flux import vers_point_array
+
+# Paire de points la plus proche (et toutes les paires à moins d'un rayon donné).
+# Toutes les comparaisons se font sur le carré des distances, comme
+# geometry.distance_carre ; on ne prend la racine qu'à la fin.
+# Les résultats sont des indices dans le nuage (liste de Point, PointArray
+# ou tableau (n, 2)), pour pouvoir dédoublonner directement.
+
+# En dessous de cette taille, on compare toutes les paires d'un coup
+TAILLE_FEUILLE = 32
+
+# Nombre maximal de paires candidates examinées à la fois (mémoire bornée sur 10^7 points)
+TAILLE_BLOC = 1 << 22
+
+
+# =============================================================================
+# 1) Fonctions publiques
+# =============================================================================
+def paire_la_plus_proche(points, methode: str = "grille") -> Tuple[int, int, float]:
+    """
+    Les deux points les plus proches du nuage : (i, j, distance), i < j.
+    methode = "grille" (hachage par grille, O(n) en moyenne) ou "diviser"
+    (diviser pour régner, O(n log n) dans tous les cas).
+    S'il y a des doublons, la distance est 0 (une des paires de doublons).
+    """
+    if methode == "grille":
+        return paire_proche_grille(points)
+    if methode == "diviser":
+        return paire_proche_diviser(points)
+    raise ValueError(f"Méthode inconnue : {methode!r} (\"grille\" ou \"diviser\").")
+
+
+def paire_proche_diviser(points) -> Tuple[int, int, float]:
+    """
+    Diviser pour régner classique, O(n log n) :
+    1) on trie une fois par x et une fois par y
+    2) on coupe en deux moitiés gauche / droite (le tri par y est partagé
+       entre les moitiés par un masque, sans retrier : O(n) par niveau)
+    3) avec d = meilleure distance des deux moitiés, seuls les points de la
+       bande |x - x_milieu| < d peuvent faire mieux ; dans la bande triée par y,
+       chaque point n'est comparé qu'à ses suivants tant que l'écart en y est < d
+       (au plus 7 : argument de « tassement » des points dans un rectangle d x 2d).
+    Chaque étape est une passe NumPy sur tous les points de la bande.
+    """
+    x, y = _colonnes(points)
+    d2, i, j = _paire_diviser(x, y)
+    return _resultat(d2, i, j)
+
+
+def paire_proche_grille(points, graine=None) -> Tuple[int, int, float]:
+    """
+    Variante aléatoire en O(n) en moyenne (Rabin) :
+    1) on tire n^(2/3) points au hasard ; leur paire la plus proche (diviser
+       pour régner, sur peu de points) donne une borne d >= la vraie distance
+    2) on range tous les points dans une grille de cases de côté d : la paire
+       cherchée est dans une même case ou dans deux cases voisines
+    3) on compare, par paquets vectorisés, les points des cases voisines ;
+       avec une borne tirée au hasard il y a O(n) paires à examiner en moyenne
+    `graine` rend le tirage reproductible (le résultat, lui, est toujours exact).
+    """
+    x, y = _colonnes(points)
+    n = len(x)
+    m = int(n ** (2 / 3))
+    if m <= TAILLE_FEUILLE:
+        d2, i, j = _paire_diviser(x, y)
+        return _resultat(d2, i, j)
+
+    echantillon = np.random.default_rng(graine).choice(n, m, replace=False)
+    d2, i, j = _paire_diviser(x[echantillon], y[echantillon])
+    i, j = int(echantillon[i]), int(echantillon[j])
+    if d2 > 0:
+        for a, b in _paires_voisines(x, y, math.sqrt(d2)):
+            distances = _distances_carres(x, y, a, b)
+            k = int(np.argmin(distances))
+            if distances[k] < d2:
+                d2, i, j = float(distances[k]), int(a[k]), int(b[k])
+    return _resultat(d2, i, j)
+
+
+def paires_dans_rayon(points, rayon: float) -> np.ndarray:
+    """
+    Toutes les paires de points à distance <= rayon, en tableau (k, 2)
+    d'indices (i < j, triées), avec la même grille que paire_proche_grille
+    (cases de côté `rayon`). Coût O(n + nombre de paires voisines).
+    rayon = 0 : les paires de doublons exacts.
+    """
+    if rayon < 0:
+        raise ValueError("Le rayon doit être positif.")
+    x, y = _colonnes(points)
+    r2 = rayon * rayon
+    morceaux = [np.empty((0, 2), dtype=np.intp)]
+    for a, b in _paires_voisines(x, y, rayon):
+        gardes = _distances_carres(x, y, a, b) <= r2
+        morceaux.append(np.column_stack((a[gardes], b[gardes])))
+    paires = np.concatenate(morceaux)
+    paires.sort(axis=1)
+    return paires[np.lexsort((paires[:, 1], paires[:, 0]))]
+
+
+# =============================================================================
+# 2) Diviser pour régner
+# =============================================================================
+def _paire_diviser(x: np.ndarray, y: np.ndarray) -> Tuple[float, int, int]:
+    n = len(x)
+    if n < 2:
+        raise ValueError("Il faut au moins 2 points.")
+    ordre_x = np.lexsort((y, x))
+    ordre_y = np.lexsort((x, y))
+    rang = np.empty(n, dtype=np.intp) # position de chaque point dans ordre_x
+    rang[ordre_x] = np.arange(n)
+    return _diviser(x, y, ordre_x, ordre_y, rang, 0)
+
+
+def _diviser(x, y, ordre_x, ordre_y, rang, debut: int) -> Tuple[float, int, int]:
+    """
+    ordre_x = les points de ordre_x[debut:debut + n] du nuage, triés par x ;
+    ordre_y = les mêmes, triés par y. Renvoie (distance², i, j).
+    """
+    n = len(ordre_x)
+    if n <= TAILLE_FEUILLE:
+        return _force_brute(x, y, ordre_x)
+
+    milieu = n // 2
+    a_gauche = rang[ordre_y] < debut + milieu
+    meilleur = min(_diviser(x, y, ordre_x[:milieu], ordre_y[a_gauche], rang, debut),
+                   _diviser(x, y, ordre_x[milieu:], ordre_y[~a_gauche], rang, debut + milieu))
+    d2 = meilleur[0]
+    if d2 == 0:
+        return meilleur
+
+    # Bande autour de la coupure, toujours triée par y
+    bande = ordre_y[(x[ordre_y] - x[ordre_x[milieu]]) ** 2 < d2]
+    bx, by = x[bande], y[bande]
+    for k in range(1, len(bande)):
+        dy = by[k:] - by[:-k]
+        if not (dy * dy < d2).any():
+            break # y trié : les suivants sont encore plus loin
+        distances = (bx[k:] - bx[:-k]) ** 2 + dy * dy
+        p = int(np.argmin(distances))
+        if distances[p] < d2:
+            d2 = float(distances[p])
+            meilleur = (d2, int(bande[p]), int(bande[p + k]))
+    return meilleur
+
+
+def _force_brute(x, y, indices) -> Tuple[float, int, int]:
+    """Toutes les paires d'un petit groupe, d'un coup (matrice des distances²)."""
+    gx, gy = x[indices], y[indices]
+    distances = (gx[:, None] - gx) ** 2 + (gy[:, None] - gy) ** 2
+    np.fill_diagonal(distances, np.inf)
+    a, b = divmod(int(np.argmin(distances)), len(indices))
+    return float(distances[a, b]), int(indices[a]), int(indices[b])
+
+
+# =============================================================================
+# 3) Grille
+# =============================================================================
+# Cases à examiner depuis chaque case : elle-même et 4 voisines « en avant »,
+# les 4 autres voisines voient la case depuis l'autre côté (chaque paire une fois)
+VOISINES = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _paires_voisines(x: np.ndarray, y: np.ndarray, cote: float) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Paires candidates (tableaux d'indices a, b) : tous les couples de points
+    distincts dans une même case de côté `cote`, ou dans deux cases voisines.
+    Chaque paire n'est donnée qu'une fois ; par paquets d'environ TAILLE_BLOC.
+    """
+    cx, cy = _case(x, cote), _case(y, cote)
+    hauteur = int(cy.max()) + 2
+    cle = cx * hauteur + cy
+    ordre = np.argsort(cle, kind="stable")
+    cle = cle[ordre]
+
+    # Cases non vides : clé, premier point (dans ordre) et nombre de points
+    debuts = np.flatnonzero(np.r_[True, cle[1:] != cle[:-1]])
+    cles_cases = cle[debuts]
+    tailles = np.diff(np.r_[debuts, len(cle)])
+
+    for dx, dy in VOISINES:
+        voisine = cles_cases + (dx * hauteur + dy)
+        k = np.searchsorted(cles_cases, voisine)
+        k[k == len(cles_cases)] = 0
+        existe = cles_cases[k] == voisine
+        a_debut, a_taille = debuts[existe], tailles[existe]
+        b_debut, b_taille = debuts[k[existe]], tailles[k[existe]]
+
+        # Produit cartésien des deux cases, découpé pour borner la mémoire
+        totaux = np.cumsum(a_taille * b_taille)
+        coupures = np.searchsorted(totaux, np.arange(TAILLE_BLOC, totaux[-1] if len(totaux) else 0, TAILLE_BLOC))
+        for morceau in np.split(np.arange(len(a_taille)), coupures):
+            if len(morceau) == 0:
+                continue
+            nb = a_taille[morceau] * b_taille[morceau]
+            case = np.repeat(np.arange(len(morceau)), nb)
+            local = np.arange(len(case)) - np.repeat(np.cumsum(nb) - nb, nb)
+            largeur = b_taille[morceau][case]
+            a = a_debut[morceau][case] + local // largeur
+            b = b_debut[morceau][case] + local % largeur
+            if (dx, dy) == (0, 0):
+                garde = a < b # même case : chaque paire une fois, pas de (p, p)
+                a, b = a[garde], b[garde]
+            if len(a):
+                yield ordre[a], ordre[b]
+
+
+def _case(v: np.ndarray, cote: float) -> np.ndarray:
+    """
+    Numéro de case (int64) de chaque coordonnée. Deux cases voisines ont des
+    numéros consécutifs ; si la grille est trop fine pour tenir en int64 (ou
+    cote = 0), on resserre les numéros en gardant qui est voisin de qui.
+    """
+    if cote > 0:
+        numeros = np.floor((v - v.min()) / cote)
+        if numeros.max() < 2 ** 30:
+            return numeros.astype(np.int64)
+        voisins = True
+    else:
+        numeros, voisins = v, False # cases réduites à une valeur : aucune n'est voisine
+    valeurs, inverse = np.unique(numeros, return_inverse=True)
+    sauts = np.diff(valeurs) if voisins else np.full(len(valeurs) - 1, 2.0)
+    # Un écart de 1 reste 1 (voisines), tout écart plus grand devient 2 (pas voisines)
+    resserres = np.concatenate(([0], np.cumsum(np.minimum(sauts, 2)).astype(np.int64)))
+    return resserres[inverse.ravel()]
+
+
+# =============================================================================
+# 4) Outils
+# =============================================================================
+def _colonnes(points) -> Tuple[np.ndarray, np.ndarray]:
+    pa = vers_point_array(points)
+    # En float64 même en mode entier : les carrés de grandes différences d'entiers débordent en int64
+    return pa.x.astype(np.float64), pa.y.astype(np.float64)
+
+
+def _distances_carres(x, y, a, b) -> np.ndarray:
+    """distance_carre entre les points a[k] et b[k], pour tous les k d'un coup."""
+    return (x[b] - x[a]) ** 2 + (y[b] - y[a]) ** 2
+
+
+def _resultat(d2: float, i: int, j: int) -> Tuple[int, int, float]:
+    return min(i, j), max(i, j), math.sqrt(d2)
@@ -0,0 +1,177 @@
+from typing import Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from geometry import PointArray, orientation_xy
+
+# En dessous de ce nombre total de points, lancer des processus coûte plus cher que le calcul
+SEUIL_PARALLELE = 200_000
+
+
+def hull_many(coords, offsets, parallele: bool = False, n_processus: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Enveloppes convexes de beaucoup de petits ensembles de points en un seul appel.
+
+    Entrée « CSR » : `coords` tableau (N, 2) (ou PointArray) de tous les points
+    mis bout à bout, et `offsets` de taille k + 1 : l'ensemble i est formé des
+    lignes offsets[i] à offsets[i + 1] - 1.
+    Sortie dans la même disposition : (sommets, offsets_enveloppes) où
+    sommets[offsets_enveloppes[i]:offsets_enveloppes[i + 1]] sont les indices
+    (lignes de coords) des sommets de l'enveloppe de l'ensemble i, dans le sens
+    de Jarvis. coords[sommets] donne directement les coordonnées.
+
+    Tous les ensembles sont traités ensemble par la chaîne monotone vectorisée
+    « segmentée » : un seul tri, puis des passes NumPy où un triplet n'est
+    regardé que si ses trois points sont dans le même ensemble. Avec
+    parallele=True, les ensembles sont répartis en tranches entre processus.
+    """
+    x, y = _colonnes(coords)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if offsets.ndim != 1 or len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(x) \
+            or (np.diff(offsets) < 0).any():
+        raise ValueError("offsets doit être croissant, commencer à 0 et finir au nombre de points.")
+
+    n_ensembles = len(offsets) - 1
+    if parallele and len(x) >= SEUIL_PARALLELE and n_ensembles > 1:
+        return _hull_many_parallele(x, y, offsets, n_processus or os.cpu_count() or 1)
+    return _hull_many_noyau(x, y, offsets)
+
+
+def _colonnes(coords) -> Tuple[np.ndarray, np.ndarray]:
+    if isinstance(coords, PointArray):
+        return coords.x, coords.y
+    pa = PointArray.depuis_coords(coords)
+    return pa.x, pa.y
+
+
+# =============================================================================
+# 1) Noyau vectorisé
+# =============================================================================
+def _hull_many_noyau(x: np.ndarray, y: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    n_ensembles = len(offsets) - 1
+    tailles = np.diff(offsets)
+    ensemble = np.repeat(np.arange(n_ensembles), tailles)
+
+    # Comme les autres algorithmes : moins de 3 points => pas d'enveloppe
+    valide = np.repeat(tailles >= 3, tailles)
+    lignes = np.flatnonzero(valide)
+
+    # Un seul tri pour tout le monde : par ensemble, puis x, puis y
+    ordre = lignes[_ordre_par_ensemble(x[lignes], y[lignes], ensemble[lignes])]
+    xs, ys, ens = x[ordre], y[ordre], ensemble[ordre]
+
+    # Doublons retirés (même raison que dans la chaîne monotone)
+    if len(ordre) > 1:
+        distinct = np.ones(len(ordre), dtype=bool)
+        distinct[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1]) | (ens[1:] != ens[:-1])
+        ordre, xs, ys, ens = ordre[distinct], xs[distinct], ys[distinct], ens[distinct]
+
+    # Premier et dernier point (dans l'ordre trié) de chaque ensemble
+    debut = np.ones(len(ordre), dtype=bool)
+    fin = np.ones(len(ordre), dtype=bool)
+    debut[1:] = ens[1:] != ens[:-1]
+    fin[:-1] = ens[1:] != ens[:-1]
+    bornes = debut | fin
+    premier = np.flatnonzero(debut)[np.cumsum(debut) - 1]
+    dernier = np.flatnonzero(fin)[np.cumsum(debut) - 1]
+
+    # Première passe : côté de chaque point par rapport au segment [premier, dernier]
+    cote = orientation_xy(xs[premier], ys[premier], xs, ys, xs[dernier], ys[dernier])
+    cote[bornes] = 0.0
+
+    haut = _chaines_segmentees(xs, ys, ens, (cote > 0) | bornes, 1.0)
+    bas = _chaines_segmentees(xs, ys, ens, (cote < 0) | bornes, -1.0)
+
+    # Par ensemble : chaîne basse de gauche à droite, puis chaîne haute à l'envers
+    # sans ses extrémités. On range tout d'un coup avec un tri (ensemble, partie, position).
+    haut = haut[~bornes[haut]]
+    pos = np.concatenate((bas, haut))
+    partie = np.concatenate((np.zeros(len(bas), dtype=np.intp), np.ones(len(haut), dtype=np.intp)))
+    rang = np.concatenate((bas, -haut))
+    tri = np.lexsort((rang, partie, ens[pos]))
+    sommets = ordre[pos[tri]]
+
+    offsets_env = np.zeros(n_ensembles + 1, dtype=np.intp)
+    np.cumsum(np.bincount(ens[pos], minlength=n_ensembles), out=offsets_env[1:])
+    return sommets, offsets_env
+
+
+def _ordre_par_ensemble(x: np.ndarray, y: np.ndarray, ens: np.ndarray) -> np.ndarray:
+    """
+    Indices qui trient par (ensemble, x, y). Comme monotone.ordre_lexicographique :
+    np.lexsort à trois clés est lent, on trie sur x puis (tri stable) sur
+    l'ensemble, et on ne reprend que les paquets de même (ensemble, x).
+    """
+    ordre = np.argsort(x)
+    ordre = ordre[np.argsort(ens[ordre], kind="stable")]
+    xs, es = x[ordre], ens[ordre]
+    egaux = (xs[1:] == xs[:-1]) & (es[1:] == es[:-1])
+    if egaux.any():
+        dans_paquet = np.zeros(len(ordre), dtype=bool)
+        dans_paquet[1:] |= egaux
+        dans_paquet[:-1] |= egaux
+        sous_ordre = ordre[dans_paquet]
+        ordre[dans_paquet] = sous_ordre[np.lexsort((y[sous_ordre], xs[dans_paquet], es[dans_paquet]))]
+    return ordre
+
+
+def _chaines_segmentees(xs: np.ndarray, ys: np.ndarray, ens: np.ndarray, garder: np.ndarray, sens: float) -> np.ndarray:
+    """
+    Demi-enveloppes (haute si sens = 1, basse si sens = -1) de tous les ensembles
+    à la fois. Même passes que monotone._chaine : tous les points « rentrants »
+    sont retirés en même temps ; un triplet à cheval sur deux ensembles ne compte pas
+    (les extrémités de chaque ensemble sont donc toujours gardées).
+    Renvoie les positions (dans xs / ys triés) des points gardés.
+    """
+    pos = np.flatnonzero(garder)
+    cx, cy, ce = xs[pos], ys[pos], ens[pos]
+
+    while len(pos) > 2:
+        # orientation(p, q, r) pour tous les triplets consécutifs (signe exact)
+        o = orientation_xy(cx[:-2], cy[:-2], cx[1:-1], cy[1:-1], cx[2:], cy[2:])
+
+        garder = np.ones(len(pos), dtype=bool)
+        garder[1:-1] = (sens * o > 0) | (ce[:-2] != ce[1:-1]) | (ce[2:] != ce[1:-1])
+        if garder.all():
+            break
+        pos, cx, cy, ce = pos[garder], cx[garder], cy[garder], ce[garder]
+
+    return pos
+
+
+# =============================================================================
+# 2) Version parallèle
+# =============================================================================
+def _hull_many_parallele(x: np.ndarray, y: np.ndarray, offsets: np.ndarray, n_processus: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coupe la liste des ensembles en tranches de tailles (en points) comparables,
+    une par processus, puis recolle les résultats.
+    """
+    # Coupures aux frontières d'ensembles les plus proches d'un partage égal des points
+    cibles = np.linspace(0, offsets[-1], n_processus + 1)
+    coupures = np.unique(np.searchsorted(offsets, cibles))
+    coupures[0], coupures[-1] = 0, len(offsets) - 1
+    coupures = np.unique(coupures)
+
+    taches = []
+    for a, b in zip(coupures[:-1].tolist(), coupures[1:].tolist()):
+        d, f = offsets[a], offsets[b]
+        taches.append((x[d:f], y[d:f], offsets[a:b + 1] - d))
+
+    with ProcessPoolExecutor(max_workers=len(taches)) as executeur:
+        resultats = list(executeur.map(_tache_lot, taches))
+
+    # Les indices de chaque tranche sont locaux : on les décale de son premier point
+    sommets = np.concatenate([s + offsets[a] for (s, _), a in zip(resultats, coupures[:-1].tolist())])
+    offsets_env = [np.zeros(1, dtype=np.intp)]
+    total = 0
+    for _, o in resultats:
+        offsets_env.append(o[1:] + total)
+        total += o[-1]
+    return sommets, np.concatenate(offsets_env)
+
+
+def _tache_lot(tache) -> Tuple[np.ndarray, np.ndarray]:
+    """Travail d'un processus : une tranche d'ensembles consécutifs."""
+    x, y, offsets = tache
+    return _hull_many_noyau(x, y, offsets)
@@ -1,11 +1,95 @@
-from geometry import Point, orientation, distance_carre
-from typing import List
+from dataclasses import dataclass
+import numpy as np
+from geometry import PointArray, ERREUR_ORIENTATION, PLUS_PETIT_NORMAL, orientation_xy
 
 
+@dataclass(frozen=True)
+class ResultatFiltre:
+    """
+    Résultat d'un pré-filtrage : indices des points conservés (dans l'ordre
+    d'origine) et taille du nuage de départ.
+    """
+    indices: np.ndarray
+    n_initial: int
 
+    @property
+    def n_restants(self) -> int:
+        return len(self.indices)
 
+    @property
+    def taux_elimination(self) -> float:
+        """Proportion des points écartés (entre 0 et 1)."""
+        if self.n_initial == 0:
+            return 0.0
+        return 1.0 - self.n_restants / self.n_initial
 
+    def __repr__(self):
+        return (f"ResultatFiltre({self.n_restants}/{self.n_initial} points conservés, "
+                f"{100 * self.taux_elimination:.1f}% éliminés)")
 
 
+def sommets_octogone(points: PointArray) -> np.ndarray:
+    """
+    Renvoie les indices des 8 points extrêmes (min/max de x, y, x+y et x-y),
+    rangés dans le sens trigonométrique en partant du point le plus à gauche.
+    Certains peuvent coïncider : l'octogone peut être dégénéré.
+    """
+    x, y = points.x, points.y
+    s = x + y
+    d = x - y
+    return np.array([
+        np.argmin(x),   # gauche
+        np.argmin(s),   # bas-gauche
+        np.argmin(y),   # bas
+        np.argmax(d),   # bas-droite
+        np.argmax(x),   # droite
+        np.argmax(s),   # haut-droite
+        np.argmax(y),   # haut
+        np.argmin(d),   # haut-gauche
+    ], dtype=np.intp)
 
 
+def filtre_quatre_cadrans(points: PointArray) -> ResultatFiltre:
+    """
+    Pré-filtre d'Akl–Toussaint (« 4 cadrans ») en O(n) vectorisé.
+    Les 8 points extrêmes sont sur l'enveloppe : tout point strictement à
+    l'intérieur de leur octogone ne peut pas être un sommet, on l'écarte.
+    Sur un nuage uniforme dans un carré, plus de 95% des points disparaissent.
+    """
+    n = len(points)
+    if n < 3:
+        return ResultatFiltre(np.arange(n, dtype=np.intp), n)
+
+    x, y = points.x, points.y
+    sommets = sommets_octogone(points)
+    sx, sy = x[sommets].tolist(), y[sommets].tolist()
+    x_min, x_max, y_min, y_max = sx[0], sx[4], sy[2], sy[6]
+
+    interieur = np.ones(n, dtype=bool)
+    nb_aretes = 0
+    for k in range(8):
+        ax, ay = sx[k], sy[k]
+        bx, by = sx[(k + 1) % 8], sy[(k + 1) % 8]
+        if ax == bx and ay == by:
+            continue # arête dégénérée (deux extrêmes confondus)
+        nb_aretes += 1
+        # Strictement à gauche de l'arête a -> b (octogone parcouru dans le sens trigo),
+        # soit orientation(a, b, r) < 0 avec la convention de geometry.orientation.
+        if points.entier:
+            # Mode entier : orientation exacte (sans débordement), pas besoin de marge
+            interieur &= orientation_xy(ax, ay, bx, by, x, y) < 0
+            continue
+        # Les arrondis sont bornés comme dans geometry.orientation_xy, mais avec une
+        # marge unique par arête (majorant des deux produits sur tout le nuage, x2) :
+        # un point douteux est gardé, et garder un point de trop ne change rien.
+        # Au moins PLUS_PETIT_NORMAL : sous ce seuil, un produit peut être arrondi à 0.
+        marge = max(2 * ERREUR_ORIENTATION * (abs(by - ay) * max(x_max - bx, bx - x_min)
+                                              + abs(bx - ax) * max(y_max - by, by - y_min)),
+                    PLUS_PETIT_NORMAL)
+        interieur &= (by - ay) * (x - bx) - (bx - ax) * (y - by) < -marge
+
+    if nb_aretes < 3:
+        # Octogone plat (points alignés ou confondus) : rien n'est strictement dedans
+        return ResultatFiltre(np.arange(n, dtype=np.intp), n)
+
+    return ResultatFiltre(np.flatnonzero(~interieur), n)
@@ -0,0 +1,151 @@
+import math
+from fractions import Fraction
+import numpy as np
+from geometry import PointArray, orientation_xy, ERREUR_ORIENTATION, PLUS_PETIT_NORMAL
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+
+@accepte_point_array
+def trouver_enveloppe_quickhull(points: PointArray) -> np.ndarray:
+    """
+    QuickHull : O(n log n) en moyenne, O(n²) dans le pire cas.
+    1) on relie le point le plus à gauche et le plus à droite
+    2) pour chaque côté, le point le plus éloigné de la droite est un sommet :
+       les points du triangle formé sont éliminés, on recommence sur les deux
+       nouveaux côtés avec les seuls points restés à l'extérieur.
+    Le partage des points se fait avec des masques NumPy (pas de boucle Python
+    sur les points), ce qui élimine très vite l'intérieur des nuages aléatoires.
+
+    Même résultat et même sens de parcours que Jarvis (départ au point le plus
+    à gauche). Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets de l'enveloppe).
+    """
+    n = len(points)
+    if n < 3:
+        return indices_vers_tableau([])
+
+    x, y = points.x, points.y
+    # Extrémités gauche et droite (à égalité de x : le plus bas / le plus haut), sans tri
+    a = _extreme(y, np.flatnonzero(x == x.min()), np.argmin)
+    b = _extreme(y, np.flatnonzero(x == x.max()), np.argmax)
+    if x[a] == x[b] and y[a] == y[b]:
+        return indices_vers_tableau([a]) # tous les points sont confondus
+
+    # c > 0 : à gauche de a -> b (c = -orientation(a, b, r), signe exact)
+    c = -orientation_xy(x[a], y[a], x[b], y[b], x, y)
+
+    # Taille de la boîte englobante : sert à borner les erreurs d'arrondi des distances
+    boite = (float(x[b] - x[a]), float(y.max() - y.min()))
+
+    # On descend d'abord (a -> b par le bas) puis on remonte (b -> a par le haut)
+    enveloppe = [a]
+    enveloppe += _chaine_exterieure(x, y, a, b, np.flatnonzero(c < 0), -c[c < 0], boite)
+    enveloppe.append(b)
+    enveloppe += _chaine_exterieure(x, y, b, a, np.flatnonzero(c > 0), c[c > 0], boite)
+
+    return indices_vers_tableau(enveloppe)
+
+
+def _extreme(y: np.ndarray, candidats: np.ndarray, choix) -> int:
+    """Parmi les candidats (même x), celui que `choix` (argmin / argmax) retient sur y."""
+    return int(candidats[choix(y[candidats])])
+
+
+def _chaine_exterieure(x: np.ndarray, y: np.ndarray, p: int, q: int,
+                       exterieurs: np.ndarray, distance: np.ndarray, boite) -> list:
+    """
+    Sommets de l'enveloppe strictement entre p et q, parmi les points `exterieurs`
+    (tous strictement à droite de p -> q), dans l'ordre de parcours de p vers q.
+    `distance` est orientation(p, q, r) > 0 pour chaque extérieur r.
+    Pile explicite : pas de récursion profonde même si l'enveloppe est grande.
+    """
+    chaine = []
+    # Une tâche est soit un segment à traiter, soit un sommet à émettre.
+    # Les coordonnées voyagent avec les indices pour ne les extraire qu'une fois.
+    pile = [(p, q, exterieurs, x[exterieurs], y[exterieurs], distance)]
+    while pile:
+        tache = pile.pop()
+        if isinstance(tache, int):
+            chaine.append(tache)
+            continue
+
+        p, q, idx, rx, ry, distance = tache
+        if len(idx) == 0:
+            continue
+
+        # Le point le plus éloigné de la droite (p, q) ; à égalité, le plus proche de p,
+        # pour ne jamais prendre un point au milieu d'une arête.
+        # Les distances sont arrondies (au plus `erreur` chacune, borne de Shewchuk) :
+        # s'il y a des ex æquo aux arrondis près, on les départage exactement.
+        k = int(np.argmax(distance))
+        erreur = _erreur_distance(x, y, p, q, *boite)
+        if np.count_nonzero(distance >= _seuil(distance[k], erreur)) > 1:
+            # Borne plus fine avec l'étendue des seuls points de la tâche
+            largeur = max(rx.max() - x[q], x[q] - rx.min())
+            hauteur = max(ry.max() - y[q], y[q] - ry.min())
+            erreur = _erreur_distance(x, y, p, q, largeur, hauteur)
+            proches = np.flatnonzero(distance >= _seuil(distance[k], erreur))
+            if len(proches) > 1:
+                k = _plus_eloigne_exact(x, y, p, q, rx, ry, proches)
+        c = int(idx[k])
+
+        # Seuls les points à l'extérieur des deux nouveaux côtés restent candidats,
+        # ceux du triangle (p, c, q) sont éliminés d'un coup (signes exacts)
+        d_gauche = orientation_xy(x[p], y[p], x[c], y[c], rx, ry)
+        g = d_gauche > 0
+        # Un point ne peut pas être à l'extérieur des deux côtés : on ne teste
+        # le côté (c, q) que sur les autres (sans c lui-même)
+        reste = ~g
+        reste[k] = False
+        idx_r, rx_r, ry_r = idx[reste], rx[reste], ry[reste]
+        d_droite = orientation_xy(x[c], y[c], x[q], y[q], rx_r, ry_r)
+        d = d_droite > 0
+
+        # Ordre de sortie : côté (p, c), puis c, puis côté (c, q)
+        pile.append((c, q, idx_r[d], rx_r[d], ry_r[d], d_droite[d]))
+        pile.append(c)
+        pile.append((p, c, idx[g], rx[g], ry[g], d_gauche[g]))
+
+    return chaine
+
+
+def _seuil(distance_max: float, erreur: float) -> float:
+    """
+    Distance au-dessus de laquelle un point peut être ex æquo avec le plus
+    éloigné. Coordonnées énormes (~1e300) : les distances trop grandes pour un
+    float valent inf (signe exact), et la borne d'erreur peut déborder aussi ;
+    alors seuls les points à distance inf (ou tous, si seule la borne déborde)
+    sont départagés exactement.
+    """
+    seuil = float(distance_max) - 2 * erreur
+    return float(distance_max) if math.isnan(seuil) else seuil
+
+
+def _erreur_distance(x: np.ndarray, y: np.ndarray, p: int, q: int, largeur: float, hauteur: float) -> float:
+    """
+    Majorant de l'erreur d'arrondi de orientation(p, q, r) quand |r.x - q.x| <= largeur
+    et |r.y - q.y| <= hauteur (les deux produits de la formule sont bornés par là).
+    """
+    # En float : en mode entier, ces produits peuvent dépasser un int64.
+    # Au moins PLUS_PETIT_NORMAL : sous ce seuil, un produit peut être arrondi à 0
+    return max(2 * ERREUR_ORIENTATION * (float(abs(y[q] - y[p])) * float(largeur)
+                                         + float(abs(x[q] - x[p])) * float(hauteur)),
+               PLUS_PETIT_NORMAL)
+
+
+def _plus_eloigne_exact(x: np.ndarray, y: np.ndarray, p: int, q: int,
+                        rx: np.ndarray, ry: np.ndarray, candidats: np.ndarray) -> int:
+    """
+    Parmi les candidats (positions dans rx / ry), le plus éloigné de la droite (p, q),
+    puis le plus proche de p, calculé en fractions exactes.
+    """
+    # .item() : int Python en mode entier (un int64 ne passe pas toujours par un float)
+    px, py, qx, qy = (Fraction(v.item()) for v in (x[p], y[p], x[q], y[q]))
+
+    def cle(k: int):
+        r_x, r_y = Fraction(rx[k].item()), Fraction(ry[k].item())
+        distance = (qy - py) * (r_x - qx) - (qx - px) * (r_y - qy)
+        avance = (r_x - px) * (qx - px) + (r_y - py) * (qy - py)
+        return distance, -avance
+
+    return max(candidats.tolist(), key=cle)
@@ -1,39 +1,42 @@
-from geometry import Point, orientation
-from typing import List
+from geometry import PointArray, orientation_coords
+from typing import List, Sequence
+import numpy as np
 
-def appliquer_scan_sklansky(polygone_ordonne: List[Point]) -> List[Point]:
+from algorithms.commun import accepte_point_array, indices_vers_tableau
+
+
+def scanner_sklansky(xs: Sequence[float], ys: Sequence[float], ordre: Sequence[int]) -> List[int]:
     """
-    Calcule l'enveloppe convexe d'un polygone simple (ou d'une liste 
-    de points déjà triés par angle) en temps linéaire O(n).
-    
-    C'est la routine "Sklansky" utilisée dans Graham et d'autres algos.
-    Elle utilise une pile pour éliminer les virages "rentrants".
+    Scan de Sklansky sur des indices : `ordre` donne l'ordre de parcours des
+    points dont les coordonnées sont dans xs / ys.
+    Renvoie la liste des indices conservés dans la pile.
     """
-    
     # La pile qui contiendra l'enveloppe finale
     # On commence avec les deux premiers points du polygone
     pile = []
-    
+
     # Cas particulier : si le polygone est vide ou a peu de points
-    if len(polygone_ordonne) < 2:
-        return polygone_ordonne
-        
-    pile.append(polygone_ordonne[0])
-    pile.append(polygone_ordonne[1])
-    
+    if len(ordre) < 2:
+        return list(ordre)
+
+    pile.append(ordre[0])
+    pile.append(ordre[1])
+
     # On parcourt tous les autres points à partir du troisième
-    for i in range(2, len(polygone_ordonne)):
-        point_teste = polygone_ordonne[i]
-        
+    for k in range(2, len(ordre)):
+        i = ordre[k]
+        rx, ry = xs[i], ys[i]
+
         # Tant qu'on a au moins 2 points dans la pile ET que le triplet (avant-dernier, dernier, point_teste) forme un virage à droite (orientation <= 0),
         # c'est que le dernier point est inutile.
-        
+
         while len(pile) >= 2:
-            avant_dernier = pile[-2]
-            dernier = pile[-1]
-            
-            o = orientation(avant_dernier, dernier, point_teste)
-            
+            p = pile[-2]
+            q = pile[-1]
+
+            # geometry.orientation(p, q, r), avec un signe exact
+            o = orientation_coords(xs[p], ys[p], xs[q], ys[q], rx, ry)
+
             if o <= 0: # Virage à droite ou colinéaire
                 # Le point 'dernier' est à l'intérieur ou sur le segment
                 # On le supprime de la pile ("étape retour" )
@@ -41,8 +44,28 @@ def appliquer_scan_sklansky(polygone_ordonne: List[Point]) -> List[Point]:
             else:
                 # C'est un virage à gauche, c'est bon
                 break
-        
+
         # On a fini de nettoyer, on peut ajouter le 'point_teste' à la pile ("étape aller" )
-        pile.append(point_teste)
-        
-    return pile
\ No newline at end of file
+        pile.append(i)
+
+    return pile
+
+
+@accepte_point_array
+def appliquer_scan_sklansky(polygone_ordonne: PointArray) -> np.ndarray:
+    """
+    Calcule l'enveloppe convexe d'un polygone simple (ou d'une liste
+    de points déjà triés par angle) en temps linéaire O(n).
+
+    C'est la routine "Sklansky" utilisée dans Graham et d'autres algos.
+    Elle utilise une pile pour éliminer les virages "rentrants".
+    Attention : sur un polygone simple quelconque (pas étoilé depuis le premier
+    sommet), le scan peut se tromper ; utiliser alors trouver_enveloppe_melkman.
+
+    Accepte une liste de Point (renvoie des Point) ou un PointArray
+    (renvoie les indices des sommets conservés).
+    """
+    n = len(polygone_ordonne)
+    xs, ys = polygone_ordonne.colonnes()
+
+    return indices_vers_tableau(scanner_sklansky(xs, ys, range(n)))
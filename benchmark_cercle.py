@@ -1,7 +1,6 @@
 import math
 import sys
 import time
-import random
 from geometry import Point
 
 try:
@@ -15,9 +14,11 @@ except ImportError:
 try:
     from cas_de_test import generer_points_aleatoires, generer_points_cercle, generer_points_carre
     from visualisation import afficher_enveloppe
-    from algorithms.glouton import trouver_enveloppe_glouton
+    from algorithms.glouton import trouver_enveloppe_glouton, trouver_enveloppe_glouton_vectorise
     from algorithms.graham_scan import trouver_enveloppe_sklanski
     from algorithms.divide_conquer import trouver_enveloppe_diviser
+    from algorithms.monotone import trouver_enveloppe_monotone
+    from algorithms.quickhull import trouver_enveloppe_quickhull
 except ImportError:
     print("ERREUR: Impossible d'importer les algos.")
     sys.exit(1)
@@ -28,7 +29,10 @@ NB_POINTS_CERCLE = 10000
 RAYON = 10 
 ALGOS_A_TESTER = [
     trouver_enveloppe_glouton,
+    trouver_enveloppe_glouton_vectorise,
     trouver_enveloppe_sklanski,
+    trouver_enveloppe_monotone,
+    trouver_enveloppe_quickhull,
 ]
 COULEURS_PLOT = ['#FF0000', '#0000FF', '#00AA00', '#FF00FF', '#FFA500']
 
@@ -43,12 +47,10 @@ def generer_cercle_parfait(N, rayon):
         # Calcule l'angle pour ce point
         angle = (i / N) * 2 * math.pi
 
-
-        # On ajoute une minuscule gigue (jitter) pour éviter une colinéarité verticale/horizontale parfaite peut perturber certains algos de tri.
-        gigue = random.uniform(-1e-9, 1e-9)
-
-        x = rayon * math.cos(angle) + gigue
-        y = rayon * math.sin(angle) + gigue
+        # Pas besoin de gigue (jitter) : les orientations ont un signe exact
+        # (geometry.orientation_coords / orientation_xy), même pour des points presque alignés.
+        x = rayon * math.cos(angle)
+        y = rayon * math.sin(angle)
 
         points.append(Point(x, y))
 
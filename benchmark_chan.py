@@ -0,0 +1,80 @@
+import sys
+import time
+
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    print("ERREUR: 'matplotlib' est requis pour ce benchmark.")
+    sys.exit(1)
+
+try:
+    from cas_de_test import generer_point_array_h_sommets
+    from algorithms.glouton import trouver_enveloppe_glouton, trouver_enveloppe_glouton_vectorise
+    from algorithms.graham_scan import trouver_enveloppe_sklanski
+    from algorithms.chan import trouver_enveloppe_chan
+except ImportError:
+    print("ERREUR: Impossible d'importer les algos.")
+    sys.exit(1)
+
+
+#Constantes
+NB_POINTS = 20000
+VALEURS_H = [4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048]
+ALGOS_A_TESTER = [
+    trouver_enveloppe_glouton,   # O(n·h)
+    trouver_enveloppe_glouton_vectorise, # O(n·h), chaque pas en une passe NumPy
+    trouver_enveloppe_sklanski,  # O(n log n)
+    trouver_enveloppe_chan,      # O(n log h)
+]
+COULEURS_PLOT = ['#FF0000', '#0000FF', '#00AA00', '#FF00FF', '#FFA500']
+
+
+def lancer_benchmark_h(algos, n, valeurs_h):
+    """
+    À n fixé, fait varier le nombre h de sommets de l'enveloppe et
+    chronomètre chaque algo. Renvoie {nom_algo: [temps pour chaque h]}.
+    """
+    print(f"Benchmark à n = {n} points, h variable")
+    print("-" * 40)
+
+    resultats = {algo.__name__: [] for algo in algos}
+
+    for h in valeurs_h:
+        points = generer_point_array_h_sommets(n, h)
+        print(f"h = {h}")
+        for algo in algos:
+            start_time = time.perf_counter()
+            enveloppe = algo(points)
+            duree = time.perf_counter() - start_time
+
+            resultats[algo.__name__].append(duree)
+            print(f"  {algo.__name__.ljust(28)}: {duree * 1000:9.2f} ms  ({len(enveloppe)} sommets)")
+
+    return resultats
+
+
+def afficher_croisement(resultats, valeurs_h, n):
+    """Trace le temps de chaque algo en fonction de h (échelles log)."""
+    plt.figure(figsize=(10, 7))
+
+    for i, (nom_algo, temps) in enumerate(resultats.items()):
+        plt.plot(valeurs_h, temps, 'o-', color=COULEURS_PLOT[i % len(COULEURS_PLOT)],
+                 label=nom_algo, linewidth=2)
+
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel("Nombre de sommets de l'enveloppe (h)")
+    plt.ylabel("Temps d'exécution (secondes)")
+    plt.title(f"Jarvis (classique et vectorisé) vs Graham vs Chan (n = {n})")
+    plt.legend()
+    plt.grid(True, linestyle=':', alpha=0.6)
+
+    plt.savefig("benchmark_chan.png")
+    print("Graphique sauvegardé dans 'benchmark_chan.png' !")
+
+
+# --- Point d'entrée principal ---
+if __name__ == "__main__":
+    resultats_des_algos = lancer_benchmark_h(ALGOS_A_TESTER, NB_POINTS, VALEURS_H)
+
+    afficher_croisement(resultats_des_algos, VALEURS_H, NB_POINTS)
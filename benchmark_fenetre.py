@@ -0,0 +1,100 @@
+import sys
+import time
+
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    print("ERREUR: 'matplotlib' est requis pour ce benchmark.")
+    sys.exit(1)
+
+try:
+    from collections import deque
+    from cas_de_test import generer_points_aleatoires
+    from algorithms.graham_scan import trouver_enveloppe_sklanski
+    from algorithms.fenetre import EnveloppeGlissante
+except ImportError:
+    print("ERREUR: Impossible d'importer les algos.")
+    sys.exit(1)
+
+
+#Constantes
+VALEURS_W = [100, 300, 1000, 3000, 10000, 30000]  # tailles de fenêtre
+N_MESURES = 500  # arrivées chronométrées, après remplissage de la fenêtre
+COULEURS_PLOT = ['#FF0000', '#0000FF', '#00AA00', '#FF00FF', '#FFA500']
+
+
+def recalcul_graham(w, initiaux):
+    """À chaque arrivée, on recalcule l'enveloppe de toute la fenêtre (ce qu'on fait aujourd'hui)."""
+    fenetre = deque(initiaux, maxlen=w)
+    def arrivee(p):
+        fenetre.append(p)
+        return trouver_enveloppe_sklanski(list(fenetre))
+    return arrivee
+
+
+def fenetre_glissante(w, initiaux):
+    """Mise à jour de l'EnveloppeGlissante, puis lecture de l'enveloppe."""
+    fenetre = EnveloppeGlissante(taille=w)
+    for p in initiaux:
+        fenetre.ajouter(p)
+    def arrivee(p):
+        fenetre.ajouter(p)
+        return fenetre.enveloppe()
+    return arrivee
+
+
+APPROCHES = {
+    "Recalcul Graham": recalcul_graham,
+    "EnveloppeGlissante": fenetre_glissante,
+}
+
+
+def lancer_benchmark_fenetre(approches, valeurs_w):
+    """Temps moyen par arrivée (mise à jour + enveloppe) une fois la fenêtre pleine."""
+    print(f"Benchmark : fenêtre des W derniers points, {N_MESURES} arrivées mesurées")
+    print("-" * 40)
+
+    resultats = {nom: [] for nom in approches}
+
+    for w in valeurs_w:
+        points = generer_points_aleatoires(w + N_MESURES)
+        print(f"W = {w}")
+        for nom, fabrique in approches.items():
+            arrivee = fabrique(w, points[:w]) # fenêtre déjà pleine, non chronométré
+
+            start_time = time.perf_counter()
+            for p in points[w:]:
+                arrivee(p)
+            duree = (time.perf_counter() - start_time) / N_MESURES
+
+            resultats[nom].append(duree)
+            print(f"  {nom.ljust(24)}: {duree * 1e6:10.1f} µs par arrivée")
+
+    return resultats
+
+
+def afficher_resultats(resultats, valeurs_w):
+    """Trace la latence par arrivée en fonction de la taille de la fenêtre."""
+    plt.figure(figsize=(10, 7))
+
+    for i, (nom, temps) in enumerate(resultats.items()):
+        plt.plot(valeurs_w, temps, 'o-', color=COULEURS_PLOT[i % len(COULEURS_PLOT)],
+                 label=nom, linewidth=2)
+
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel("Taille de la fenêtre (W)")
+    plt.ylabel("Temps par arrivée (secondes)")
+    plt.title("Enveloppe d'une fenêtre glissante : recalcul vs mise à jour")
+    plt.legend()
+    plt.grid(True, linestyle=':', alpha=0.6)
+
+    plt.savefig("benchmark_fenetre.png")
+    print("Graphique sauvegardé dans 'benchmark_fenetre.png' !")
+
+
+# --- Point d'entrée principal ---
+if __name__ == "__main__":
+    resultats_des_approches = lancer_benchmark_fenetre(APPROCHES, VALEURS_W)
+
+    afficher_resultats(resultats_des_approches, VALEURS_W)
@@ -0,0 +1,88 @@
+import sys
+import time
+
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    print("ERREUR: 'matplotlib' est requis pour ce benchmark.")
+    sys.exit(1)
+
+try:
+    from geometry import PointArray
+    from cas_de_test import generer_lots_aleatoires
+    from algorithms.graham_scan import trouver_enveloppe_sklanski
+    from algorithms.monotone import trouver_enveloppe_monotone
+    from algorithms.par_lots import hull_many
+except ImportError:
+    print("ERREUR: Impossible d'importer les algos.")
+    sys.exit(1)
+
+
+#Constantes
+VALEURS_K = [100, 500, 1000, 5000, 10000, 20000]  # nombre de petits ensembles
+TAILLE_MIN, TAILLE_MAX = 10, 200
+COULEURS_PLOT = ['#FF0000', '#0000FF', '#00AA00', '#FF00FF', '#FFA500']
+
+
+def une_par_une(algo):
+    """Appelle `algo` sur chaque ensemble, l'un après l'autre (ce qu'on fait sans hull_many)."""
+    def boucle(coords, offsets):
+        pa = PointArray.depuis_coords(coords)
+        return [algo(pa[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+    boucle.__name__ = f"boucle {algo.__name__}"
+    return boucle
+
+
+ALGOS_A_TESTER = [
+    une_par_une(trouver_enveloppe_sklanski),
+    une_par_une(trouver_enveloppe_monotone),
+    hull_many,
+]
+
+
+def lancer_benchmark_lots(algos, valeurs_k):
+    """Chronomètre chaque approche pour k ensembles de 10 à 200 points."""
+    print(f"Benchmark : k ensembles de {TAILLE_MIN} à {TAILLE_MAX} points")
+    print("-" * 40)
+
+    resultats = {algo.__name__: [] for algo in algos}
+
+    for k in valeurs_k:
+        coords, offsets = generer_lots_aleatoires(k, TAILLE_MIN, TAILLE_MAX)
+        print(f"k = {k} ({len(coords)} points)")
+        for algo in algos:
+            start_time = time.perf_counter()
+            algo(coords, offsets)
+            duree = time.perf_counter() - start_time
+
+            resultats[algo.__name__].append(duree)
+            print(f"  {algo.__name__.ljust(36)}: {duree * 1000:9.2f} ms")
+
+    return resultats
+
+
+def afficher_resultats(resultats, valeurs_k):
+    """Trace le temps de chaque approche en fonction du nombre d'ensembles."""
+    plt.figure(figsize=(10, 7))
+
+    for i, (nom_algo, temps) in enumerate(resultats.items()):
+        plt.plot(valeurs_k, temps, 'o-', color=COULEURS_PLOT[i % len(COULEURS_PLOT)],
+                 label=nom_algo, linewidth=2)
+
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.xlabel("Nombre d'ensembles (k)")
+    plt.ylabel("Temps d'exécution (secondes)")
+    plt.title("Un appel par ensemble vs hull_many")
+    plt.legend()
+    plt.grid(True, linestyle=':', alpha=0.6)
+
+    plt.savefig("benchmark_lots.png")
+    print("Graphique sauvegardé dans 'benchmark_lots.png' !")
+
+
+# --- Point d'entrée principal ---
+if __name__ == "__main__":
+    resultats_des_algos = lancer_benchmark_lots(ALGOS_A_TESTER, VALEURS_K)
+
+    afficher_resultats(resultats_des_algos, VALEURS_K)
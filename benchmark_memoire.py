@@ -0,0 +1,196 @@
+import gc
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass
+from functools import cmp_to_key
+
+try:
+    import matplotlib.pyplot as plt
+except ImportError:
+    print("ERREUR: 'matplotlib' est requis pour ce benchmark.")
+    sys.exit(1)
+
+try:
+    import numpy as np
+    from geometry import Point, PointArray, orientation, distance_carre
+    from algorithms.monotone import trouver_enveloppe_monotone
+    from algorithms.graham_scan import trouver_enveloppe_sklanski
+    from algorithms.divide_conquer import trouver_enveloppe_diviser
+    from mediane import mediane_des_medianes, mediane_par_tri, elt_rg
+except ImportError:
+    print("ERREUR: Impossible d'importer les algos.")
+    sys.exit(1)
+
+
+#Constantes
+N = 10**6
+N_MEDIANE = 10**7
+COULEURS_PLOT = ['#FF0000', '#0000FF', '#00AA00', '#FF00FF', '#FFA500']
+
+
+@dataclass(frozen=True)
+class AncienPoint:
+    """L'ancien Point (dataclass avec __dict__), gardé ici pour la comparaison."""
+    x: float
+    y: float
+
+
+def graham_ancien(points):
+    """
+    L'ancien parcours de Graham (tri de la liste de Point, puis pile de Point),
+    gardé ici comme référence : une régression de mémoire des algos se voit.
+    """
+    if len(points) < 3:
+        return []
+    depart = min(points, key=lambda p: (p.y, p.x))
+
+    def comparer_angles(p1, p2):
+        o = orientation(depart, p1, p2)
+        if o == 0:
+            return -1 if distance_carre(depart, p1) < distance_carre(depart, p2) else 1
+        return -1 if o > 0 else 1
+
+    polygone = [depart] + sorted([p for p in points if p != depart], key=cmp_to_key(comparer_angles))
+    pile = polygone[:2]
+    for p in polygone[2:]:
+        while len(pile) >= 2 and orientation(pile[-2], pile[-1], p) <= 0:
+            pile.pop()
+        pile.append(p)
+    return pile
+
+
+def mesurer(fabrique):
+    """
+    Pic de mémoire (octets, tracemalloc) pendant l'appel de fabrique(), et pic
+    du nombre d'allocations de l'appel vivantes en même temps : blocs comptés
+    par sys.getallocatedblocks(), relevés toutes les millisecondes par un
+    thread puis une dernière fois après l'appel. Tous les objets Python créés
+    en masse (Point, int, float, clés de tri...) y apparaissent ; les gros
+    buffers NumPy, alloués hors de ces petits blocs, n'y sont pas.
+    Renvoie (pic, allocations, resultat).
+    """
+    gc.collect()
+    depart = sys.getallocatedblocks()
+    pic_blocs = 0
+    fini = threading.Event()
+
+    def relever():
+        nonlocal pic_blocs
+        while not fini.wait(0.001):
+            pic_blocs = max(pic_blocs, sys.getallocatedblocks() - depart)
+
+    releveur = threading.Thread(target=relever)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    releveur.start()
+    resultat = fabrique()
+    fini.set()
+    releveur.join()
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    allocations = max(pic_blocs, sys.getallocatedblocks() - depart)
+    return pic, allocations, resultat
+
+
+def lancer_benchmark_stockage(x, y):
+    """Mémoire pour stocker N points : ancien Point, Point (tuple nommé), PointArray."""
+    print(f"Stockage de {N} points")
+    print("-" * 40)
+    xs, ys = x.tolist(), y.tolist()
+    representations = {
+        "dataclass (ancien)": lambda: [AncienPoint(a, b) for a, b in zip(xs, ys)],
+        "Point (tuple nommé)": lambda: [Point(a, b) for a, b in zip(xs, ys)],
+        "PointArray": lambda: PointArray(x.copy(), y.copy()),
+    }
+    resultats = {}
+    for nom, fabrique in representations.items():
+        pic, allocations, _ = mesurer(fabrique)
+        resultats[nom] = pic
+        print(f"  {nom.ljust(24)}: {pic / 2**20:8.1f} Mo, {allocations:9d} allocations")
+    return resultats
+
+
+def lancer_benchmark_algos(x, y):
+    """
+    Pic de mémoire et allocations de chaque algo, sur une liste de Point et
+    sur un PointArray. La ligne « ancien » (liste de Point seulement) sert de référence.
+    """
+    print(f"\nPic de mémoire pendant le calcul de l'enveloppe ({N} points)")
+    print("-" * 40)
+    points = [Point(a, b) for a, b in zip(x.tolist(), y.tolist())]
+    pa = PointArray(x, y)
+    algos = {
+        "Graham (ancien)": graham_ancien,
+        "Monotone": trouver_enveloppe_monotone,
+        "Graham/Sklansky": trouver_enveloppe_sklanski,
+        "Diviser pour régner": trouver_enveloppe_diviser,
+    }
+    resultats = {"liste de Point": [], "PointArray": []}
+    for nom, algo in algos.items():
+        for entree, donnees in (("liste de Point", points), ("PointArray", pa)):
+            if algo is graham_ancien and entree == "PointArray":
+                resultats[entree].append(float("nan")) # pas de barre : ne prend que des Point
+                continue
+            pic, allocations, _ = mesurer(lambda: algo(donnees))
+            resultats[entree].append(pic)
+            print(f"  {nom.ljust(20)} ({entree.ljust(14)}): {pic / 2**20:8.1f} Mo, {allocations:9d} allocations")
+    return list(algos), resultats
+
+
+def lancer_benchmark_mediane():
+    """Pic de mémoire des calculs de médiane sur une liste de N_MEDIANE flottants."""
+    print(f"\nPic de mémoire pendant le calcul de la médiane ({N_MEDIANE} éléments)")
+    print("-" * 40)
+    t = np.random.default_rng(1).random(N_MEDIANE).tolist()
+    methodes = {
+        "Tri (sorted)": mediane_par_tri,
+        "elt_rg (P/E/G)": lambda t: elt_rg(len(t) // 2, t),
+        "Introselect": mediane_des_medianes,
+    }
+    resultats = {}
+    for nom, methode in methodes.items():
+        pic, _, _ = mesurer(lambda: methode(t))
+        resultats[nom] = pic
+        print(f"  {nom.ljust(24)}: {pic / 2**20:8.1f} Mo")
+    return resultats
+
+
+def afficher_resultats(stockage, noms_algos, algos, medianes):
+    """Graphiques en barres : stockage des points, pic de mémoire des algos et des médianes."""
+    fig, (g1, g2, g3) = plt.subplots(1, 3, figsize=(20, 6))
+
+    g1.bar(list(stockage), [v / 2**20 for v in stockage.values()], color=COULEURS_PLOT[:len(stockage)])
+    g1.set_ylabel("Mémoire (Mo)")
+    g1.set_title(f"Stockage de {N} points")
+
+    largeur = 0.4
+    positions = np.arange(len(noms_algos))
+    for i, (entree, pics) in enumerate(algos.items()):
+        g2.bar(positions + i * largeur, [v / 2**20 for v in pics], largeur,
+               color=COULEURS_PLOT[i % len(COULEURS_PLOT)], label=entree)
+    g2.set_xticks(positions + largeur / 2)
+    g2.set_xticklabels(noms_algos)
+    g2.set_ylabel("Pic de mémoire (Mo)")
+    g2.set_title(f"Calcul de l'enveloppe ({N} points)")
+    g2.legend()
+
+    g3.bar(list(medianes), [v / 2**20 for v in medianes.values()], color=COULEURS_PLOT[:len(medianes)])
+    g3.set_ylabel("Pic de mémoire (Mo)")
+    g3.set_title(f"Médiane de {N_MEDIANE} éléments")
+
+    plt.tight_layout()
+    plt.savefig("benchmark_memoire.png")
+    print("Graphique sauvegardé dans 'benchmark_memoire.png' !")
+
+
+# --- Point d'entrée principal ---
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    x, y = rng.random(N), rng.random(N)
+
+    stockage = lancer_benchmark_stockage(x, y)
+    noms_algos, algos = lancer_benchmark_algos(x, y)
+    medianes = lancer_benchmark_mediane()
+
+    afficher_resultats(stockage, noms_algos, algos, medianes)
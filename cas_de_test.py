@@ -1,6 +1,7 @@
 import numpy as np
-from typing import List
-from geometry import Point
+from typing import Iterator, List, Tuple
+from geometry import Point, PointArray
+from fichiers_points import creer_fichier_points, ecrire_points, vider
 import random
 import math
 
@@ -15,6 +16,69 @@ def generer_points_aleatoires(n: int, x_max: int = 100, y_max: int = 100) -> Lis
     # Convertit les paires de coordonnées en objets Point
     return [Point(x, y) for x, y in zip(coords_x, coords_y)]
 
+def generer_point_array_aleatoire(n: int, x_max: int = 100, y_max: int = 100) -> PointArray:
+    """
+    Comme generer_points_aleatoires, mais garde les tableaux NumPy tels quels
+    (aucun objet Point créé) : à privilégier pour les grands n.
+    """
+    return PointArray(np.random.rand(n) * x_max, np.random.rand(n) * y_max)
+
+def generer_point_array_grille(n: int, x_max: int = 1000, y_max: int = 1000) -> PointArray:
+    """
+    n points aléatoires à coordonnées entières dans [0, x_max] x [0, y_max]
+    (pixels...) : PointArray en mode entier (int64), beaucoup d'alignements et de doublons.
+    """
+    return PointArray(np.random.randint(0, x_max + 1, n), np.random.randint(0, y_max + 1, n))
+
+def generer_flux_aleatoire(n_blocs: int, taille_bloc: int, x_max: int = 100, y_max: int = 100) -> Iterator[PointArray]:
+    """
+    Flux de n_blocs paquets de points aléatoires (générés à la demande) :
+    simule des données qui arrivent au fil de l'eau, pour algorithms/flux.py.
+    """
+    for _ in range(n_blocs):
+        yield generer_point_array_aleatoire(taille_bloc, x_max, y_max)
+
+def sauver_points(chemin: str, points) -> None:
+    """
+    Enregistre un jeu de données produit par un générateur (liste de Point ou
+    PointArray) au format planaire, ou en .npy selon l'extension.
+    Ex : sauver_points("cercle.pts", generer_points_cercle(1000))
+    """
+    if not isinstance(points, PointArray):
+        points = PointArray.depuis_points(points)
+    ecrire_points(chemin, points)
+
+def sauver_points_aleatoires(chemin: str, n: int, x_max: int = 100, y_max: int = 100, taille_bloc: int = 1 << 20) -> None:
+    """
+    Écrit directement sur disque n points aléatoires, tranche par tranche :
+    permet de créer des fichiers bien plus gros que la mémoire.
+    """
+    x, y = creer_fichier_points(chemin, n)
+    for debut in range(0, n, taille_bloc):
+        bloc = generer_point_array_aleatoire(min(taille_bloc, n - debut), x_max, y_max)
+        x[debut:debut + len(bloc)] = bloc.x
+        y[debut:debut + len(bloc)] = bloc.y
+    vider(x)
+
+def generer_lots_aleatoires(n_ensembles: int, taille_min: int = 10, taille_max: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Beaucoup de petits nuages aléatoires mis bout à bout (disposition « CSR ») :
+    renvoie (coords (N, 2), offsets) pour algorithms/par_lots.hull_many.
+    """
+    tailles = np.random.randint(taille_min, taille_max + 1, n_ensembles)
+    offsets = np.zeros(n_ensembles + 1, dtype=np.intp)
+    np.cumsum(tailles, out=offsets[1:])
+    return np.random.rand(offsets[-1], 2) * 100, offsets
+
+def generer_points_gaussiens(n: int, sigma: float = 15, centre: float = 50) -> List[Point]:
+    """
+    Génère n points selon une loi normale autour de (centre, centre).
+    Peu de points loin du centre : cas favorable pour QuickHull.
+    """
+    coords_x = np.random.normal(centre, sigma, n)
+    coords_y = np.random.normal(centre, sigma, n)
+    return [Point(x, y) for x, y in zip(coords_x, coords_y)]
+
 def generer_points_cercle(N, rayon=10):
     """
     Génère N points sur un cercle parfait en utilisant la trigonométrie.
@@ -34,6 +98,31 @@ def generer_points_cercle(N, rayon=10):
 
     return points
 
+def generer_point_array_h_sommets(n: int, h: int, rayon: float = 10) -> PointArray:
+    """
+    Génère n points dont exactement h sont sur l'enveloppe :
+    h points réguliers sur un cercle, les n - h autres tirés dans un disque
+    strictement intérieur au polygone régulier. Sert à faire varier h à n fixé.
+    """
+    angles = np.arange(h) * (2 * math.pi / h)
+    # Le disque inscrit dans le h-gone a pour rayon rayon * cos(pi / h) ; on reste en dessous
+    r_int = 0.9 * rayon * math.cos(math.pi / h)
+    r = r_int * np.sqrt(np.random.rand(n - h))
+    theta = np.random.rand(n - h) * 2 * math.pi
+    x = np.concatenate((rayon * np.cos(angles), r * np.cos(theta)))
+    y = np.concatenate((rayon * np.sin(angles), r * np.sin(theta)))
+    return PointArray(x, y)
+
+def generer_polygone_simple(n: int, rayon: float = 10) -> List[Point]:
+    """
+    Génère les n sommets d'un polygone simple (étoilé autour de l'origine),
+    dans l'ordre du contour : un angle par secteur de 2π/n, rayon au hasard.
+    Beaucoup de sommets rentrants, c'est le cas où le scan de Sklansky se trompe.
+    """
+    angles = (np.arange(n) + np.random.rand(n)) * (2 * math.pi / n)
+    r = rayon * (0.1 + 0.9 * np.random.rand(n))
+    return [Point(float(a), float(b)) for a, b in zip(r * np.cos(angles), r * np.sin(angles))]
+
 def generer_points_carre(n_par_cote: int, taille: int = 100) -> List[Point]:
     """
     Génère 4*(n-1) points formant un carré (juste les bords).
@@ -0,0 +1,117 @@
+#Lecture / écriture de nuages de points sur disque
+"""
+Deux formats sont reconnus, d'après l'extension du fichier :
+
+1) `.npy` : tableau NumPy float64 (ou int64 en mode entier) de forme (n, 2)
+   (colonnes x, y), tel que produit par np.save(chemin, pa.coords()).
+
+2) Format « planaire » (toute autre extension, `.pts` conseillé), little-endian :
+
+       octets 0-7    : signature b"PTS2D\\x00\\x02\\x00" (format, version 2)
+       octets 8-15   : n, nombre de points (uint64)
+       octets 16-23  : type des coordonnées, b"<f8" (float64) ou b"<i8"
+                       (int64, mode entier), complété par des octets nuls
+       puis          : n valeurs, toutes les abscisses x
+       puis          : n valeurs, toutes les ordonnées y
+
+   Les fichiers de la version 1 (signature b"PTS2D\\x00\\x01\\x00", sans le
+   champ de type : en-tête de 16 octets, float64) se lisent toujours.
+
+   Les x puis les y sont rangés en deux blocs contigus (comme un PointArray) :
+   on peut lire une tranche de points avec deux lectures séquentielles, sans
+   jamais charger le fichier entier (np.memmap).
+"""
+import os
+import struct
+from typing import Tuple
+import numpy as np
+from geometry import PointArray
+
+SIGNATURE = b"PTS2D\x00\x02\x00"
+TAILLE_ENTETE = 24
+# Version 1 : pas de champ de type, toujours float64
+SIGNATURE_V1 = b"PTS2D\x00\x01\x00"
+TAILLE_ENTETE_V1 = 16
+# Types acceptés : float64, et int64 pour garder le mode entier exact
+_DTYPES = {b"<f8": np.dtype("<f8"), b"<i8": np.dtype("<i8")}
+
+
+def est_npy(chemin: str) -> bool:
+    return os.fspath(chemin).lower().endswith(".npy")
+
+
+def creer_fichier_points(chemin: str, n: int, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Crée un fichier de n points et renvoie deux tableaux (x, y) projetés en
+    mémoire, à remplir par tranches : de quoi écrire plus de points que la RAM.
+    dtype : np.float64, ou np.int64 pour des coordonnées entières (mode entier).
+    """
+    dtype = np.dtype(dtype).newbyteorder("<")
+    code = dtype.str.encode()
+    if code not in _DTYPES:
+        raise ValueError(f"Type de coordonnées non pris en charge : {dtype} (float64 ou int64).")
+
+    if est_npy(chemin):
+        coords = np.lib.format.open_memmap(chemin, mode="w+", dtype=dtype, shape=(n, 2))
+        return coords[:, 0], coords[:, 1]
+
+    with open(chemin, "wb") as f:
+        f.write(SIGNATURE + struct.pack("<Q", n) + code.ljust(8, b"\x00"))
+        f.truncate(TAILLE_ENTETE + 2 * n * dtype.itemsize)
+    if n == 0:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+    data = np.memmap(chemin, dtype=dtype, mode="r+", offset=TAILLE_ENTETE, shape=(2, n))
+    return data[0], data[1]
+
+
+def ouvrir_points(chemin: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ouvre un fichier de points en lecture seule, sans le charger : renvoie
+    (x, y) en np.memmap, seules les tranches lues passent en mémoire.
+    """
+    if est_npy(chemin):
+        coords = np.load(chemin, mmap_mode="r")
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError(f"{chemin} : on attend un tableau (n, 2), pas {coords.shape}.")
+        return coords[:, 0], coords[:, 1]
+
+    with open(chemin, "rb") as f:
+        entete = f.read(TAILLE_ENTETE)
+    if len(entete) >= TAILLE_ENTETE_V1 and entete[:8] == SIGNATURE_V1:
+        taille_entete, dtype = TAILLE_ENTETE_V1, _DTYPES[b"<f8"]
+    elif len(entete) == TAILLE_ENTETE and entete[:8] == SIGNATURE:
+        taille_entete, dtype = TAILLE_ENTETE, _DTYPES.get(entete[16:].rstrip(b"\x00"))
+        if dtype is None:
+            raise ValueError(f"{chemin} : type de coordonnées inconnu {entete[16:]!r}.")
+    else:
+        raise ValueError(f"{chemin} n'est pas un fichier de points (signature invalide).")
+    (n,) = struct.unpack("<Q", entete[8:16])
+    if os.path.getsize(chemin) != taille_entete + 2 * n * dtype.itemsize:
+        raise ValueError(f"{chemin} est tronqué : {n} points annoncés.")
+    if n == 0:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+    data = np.memmap(chemin, dtype=dtype, mode="r", offset=taille_entete, shape=(2, n))
+    return data[0], data[1]
+
+
+def ecrire_points(chemin: str, points: PointArray) -> None:
+    """Écrit un PointArray (déjà en mémoire) dans un fichier, sans changer son type (float64 ou int64)."""
+    x, y = creer_fichier_points(chemin, len(points), points.x.dtype)
+    x[:] = points.x
+    y[:] = points.y
+    vider(x)
+
+
+def lire_points(chemin: str) -> PointArray:
+    """Charge entièrement un fichier de points en mémoire."""
+    x, y = ouvrir_points(chemin)
+    return PointArray(np.array(x), np.array(y))
+
+
+def vider(tableau: np.ndarray) -> None:
+    """Force l'écriture sur disque d'un tableau projeté (x et y partagent le même fichier)."""
+    base = tableau
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    if base is not None:
+        base.flush()
@@ -1,40 +1,372 @@
 #Classes pour généraliser l'implémentation 
-from typing import List
-from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple
+from itertools import chain
+from fractions import Fraction
+import math
+import numpy as np
 
-@dataclass(frozen=True)
-class Point:
+class Point(NamedTuple):
+    """
+    Un point du plan. Tuple nommé : immuable, sans __dict__ (56 octets au lieu
+    d'un objet + son dictionnaire), et l'égalité / le hachage (utiles pour les
+    tests, les set() et les dict()) sont ceux des tuples, faits en C.
+    Attention, c'est donc un vrai tuple : Point(1, 2) == (1, 2) est vrai, les
+    deux ont le même hachage (même clé dans un dict), et les Point se
+    comparent avec < dans l'ordre lexicographique (x, puis y).
+    """
     x: float
     y: float
 
     def __repr__(self):
         return f"Point({self.x}, {self.y})"
-    
-    def __eq__(self, other) -> bool:
-        """Permet de comparer deux points (utile pour les tests)."""
-        if not isinstance(other, Point):
-            return False
-        # Utiliser une tolérance pour les flottants si nécessaire
-        return self.x == other.x and self.y == other.y
-
-    def __hash__(self):
-        """Permet d'utiliser les points dans un set() ou un dict()."""
-        return hash((self.x, self.y))
 
 Polygone = List[Point]
 
+
+class PointArray:
+    """
+    Nuage de points stocké « en colonnes » : deux tableaux NumPy float64
+    (x et y) au lieu d'une liste d'objets Point.
+    Un point coûte 16 octets au lieu d'un objet Python complet.
+
+    Mode entier : si x et y sont des tableaux d'entiers, ils sont gardés en
+    int64 (pixels, GPS en virgule fixe...). Les orientations sont alors
+    calculées exactement en entiers, sans aucun arrondi (voir orientation_xy),
+    et le tri lexicographique devient un simple argsort sur une clé entière.
+    Limite : toutes les coordonnées doivent vérifier |c| < 2^62 (les différences
+    tiennent alors en int64), sinon ValueError : convertir soi-même en float64
+    si l'arrondi est acceptable. Vérifié une seule fois, à la construction
+    (pas sur les vues ni les sous-ensembles).
+
+    - pa[i]         -> Point
+    - pa[a:b]       -> PointArray qui partage les buffers (vue, sans copie)
+    - pa[indices]   -> PointArray (copie, indexation NumPy classique)
+
+    Les algorithmes d'enveloppe qui reçoivent un PointArray renvoient
+    les indices des sommets de l'enveloppe dans ce PointArray.
+    """
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        # np.asarray ne copie pas si le tableau est déjà en float64 (ou en int64)
+        x = _sans_objets(np.asarray(x))
+        y = _sans_objets(np.asarray(y))
+        entier = _est_entier(x) and _est_entier(y)
+        if entier:
+            _verifier_limite(x)
+            _verifier_limite(y)
+        dtype = np.int64 if entier else np.float64
+        x = x.astype(dtype, copy=False)
+        y = y.astype(dtype, copy=False)
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError("x et y doivent être deux tableaux 1-D de même taille.")
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def _depuis_colonnes(cls, x: np.ndarray, y: np.ndarray) -> "PointArray":
+        """Sans conversion ni vérification : x et y viennent déjà d'un PointArray (vues, sous-ensembles)."""
+        pa = cls.__new__(cls)
+        pa.x = x
+        pa.y = y
+        return pa
+
+    @classmethod
+    def depuis_points(cls, points: List[Point]) -> "PointArray":
+        """
+        Construit un PointArray à partir d'une liste de Point (O(n)).
+        Si toutes les coordonnées sont des entiers, le PointArray est en mode
+        entier (int64, même limite |c| < 2^62 que le constructeur) : les
+        orientations restent exactes, comme sur les Point d'origine.
+        Une liste qui mélange entiers et flottants passe en float64, sauf si un
+        entier y serait arrondi (|c| > 2^53) : ValueError.
+        """
+        types = set(map(type, chain.from_iterable(points)))
+        entiers = [issubclass(t, (int, np.integer)) for t in types]
+        if types and all(entiers):
+            try:
+                # Les Point sont des tuples : un seul passage en C sur (x0, y0, x1, y1, ...)
+                xy = np.fromiter(chain.from_iterable(points), dtype=np.int64, count=2 * len(points))
+            except OverflowError:
+                raise ValueError("Coordonnées entières hors limite (il faut |c| < 2^62) : "
+                                 "les convertir en float64 si l'arrondi est acceptable.") from None
+        else:
+            xy = np.fromiter(chain.from_iterable(points), dtype=np.float64, count=2 * len(points))
+            if any(entiers) and xy.size and np.abs(xy).max() > _LIMITE_FLOAT_EXACT:
+                _verifier_entiers_exacts(chain.from_iterable(points))
+        return cls(np.ascontiguousarray(xy[0::2]), np.ascontiguousarray(xy[1::2]))
+
+    @classmethod
+    def depuis_coords(cls, coords) -> "PointArray":
+        """Construit un PointArray à partir d'un tableau (n, 2) de coordonnées (entières ou non)."""
+        coords = _sans_objets(np.asarray(coords))
+        if not _est_entier(coords):
+            coords = coords.astype(np.float64, copy=False)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Les coordonnées doivent former un tableau (n, 2).")
+        # Les colonnes d'un tableau (n, 2) ne sont pas contiguës : on les recopie
+        return cls(np.ascontiguousarray(coords[:, 0]), np.ascontiguousarray(coords[:, 1]))
+
+    @property
+    def entier(self) -> bool:
+        """True si les coordonnées sont en int64 (mode entier exact)."""
+        return self.x.dtype == np.int64
+
+    def vers_points(self) -> List[Point]:
+        """Reconstruit la liste de Point équivalente (O(n) objets créés)."""
+        return [Point(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+
+    def colonnes(self) -> Tuple[memoryview, memoryview]:
+        """
+        x et y vus comme des memoryview, sans copie : xs[i] renvoie un float
+        Python (un int en mode entier, donc des calculs exacts) comme une liste
+        tirée par tolist(), mais sans créer 2n objets d'un coup.
+        C'est ce que parcourent les boucles Python des algorithmes.
+        """
+        return memoryview(self.x), memoryview(self.y)
+
+    def coords(self) -> np.ndarray:
+        """Renvoie une copie des coordonnées sous forme de tableau (n, 2)."""
+        return np.column_stack((self.x, self.y))
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def __getitem__(self, cle):
+        if isinstance(cle, (int, np.integer)):
+            # .item() : int Python en mode entier, float sinon
+            return Point(self.x[cle].item(), self.y[cle].item())
+        # Tranche -> vue sur les mêmes buffers ; tableau d'indices/masque -> copie
+        return PointArray._depuis_colonnes(self.x[cle], self.y[cle])
+
+    def __iter__(self):
+        for x, y in zip(self.x.tolist(), self.y.tolist()):
+            yield Point(x, y)
+
+    def __repr__(self):
+        return f"PointArray(n={len(self)}{', entier' if self.entier else ''})"
+
+
+def _est_entier(tableau: np.ndarray) -> bool:
+    return tableau.dtype.kind in "iu"
+
+# Mode entier : au-delà, x[q] - x[p] peut déborder de l'int64
+_LIMITE_ENTIERS = 2 ** 62
+
+def _verifier_limite(tableau: np.ndarray) -> None:
+    """ValueError si une valeur entière dépasse |c| < 2^62 (comparaison en entiers Python, sans débordement)."""
+    if tableau.size and not (int(tableau.min()) > -_LIMITE_ENTIERS and int(tableau.max()) < _LIMITE_ENTIERS):
+        raise ValueError("Coordonnées entières hors limite (il faut |c| < 2^62) : "
+                         "les convertir en float64 si l'arrondi est acceptable.")
+
+# Au-delà, un entier n'a plus forcément de représentation exacte en float64
+_LIMITE_FLOAT_EXACT = 2 ** 53
+
+def _verifier_entiers_exacts(valeurs) -> None:
+    """ValueError si une coordonnée entière d'une liste mixte serait arrondie en float64."""
+    for c in valeurs:
+        if isinstance(c, (int, np.integer)) and abs(int(c)) > _LIMITE_FLOAT_EXACT:
+            raise ValueError("Entiers au-delà de 2^53 mélangés à des flottants : ils seraient "
+                             "arrondis en float64 ; n'utiliser que des entiers (mode entier exact).")
+
+def _sans_objets(tableau: np.ndarray) -> np.ndarray:
+    """
+    np.asarray([2**70, 1]) donne un tableau d'objets (entiers Python) : astype
+    le convertirait en float64 sans prévenir. Même règle que depuis_points :
+    que des entiers -> int64 après vérification de la limite 2^62, mélange
+    entiers/flottants -> float64 sauf si un entier y serait arrondi.
+    """
+    if tableau.dtype != object:
+        return tableau
+    valeurs = tableau.ravel().tolist()
+    types = set(map(type, valeurs))
+    if types and all(issubclass(t, (int, np.integer)) for t in types):
+        _verifier_limite(tableau)
+        return tableau.astype(np.int64)
+    _verifier_entiers_exacts(valeurs)
+    return tableau.astype(np.float64)
+
 #Outils géométriques
 
+# Filtre de Shewchuk : avec epsilon = 2^-53 (arrondi des float64), le signe de
+# a - b calculé en flottants est sûr dès que |a - b| > (3 + 16 eps) eps (|a| + |b|).
+# En dessous, on recalcule exactement (entiers ou fractions), ce qui est rare.
+EPSILON = 2.0 ** -53
+ERREUR_ORIENTATION = (3.0 + 16.0 * EPSILON) * EPSILON
+# Le filtre suppose des produits sans sous-dépassement : en dessous, calcul exact
+PLUS_PETIT_NORMAL = np.finfo(np.float64).tiny
+
+# Coordonnées entières jusqu'à 2^30 : différences < 2^31, produits < 2^62, tout tient en int64
+_LIMITE_INT64 = 2.0 ** 30
+# Même idée en mode entier, mais directement sur les différences de coordonnées
+_LIMITE_DIFFERENCE = 2 ** 31
+
 def orientation(p: Point, q: Point, r: Point) -> float:
     """
     Calcule l'orientation de (p, q, r).
     > 0 : Virage à gauche
     < 0 : Virage à droite
     = 0 : Colinéaire
+    Le signe est exact (filtre d'erreur puis calcul exact si besoin),
+    même pour des points presque alignés.
+    """
+    return orientation_coords(p.x, p.y, q.x, q.y, r.x, r.y)
+
+def orientation_coords(px: float, py: float, qx: float, qy: float, rx: float, ry: float) -> float:
+    """
+    orientation() sur des coordonnées plutôt que des Point : c'est la version
+    appelée dans les boucles des algorithmes (xs / ys de PointArray.colonnes()).
+    Avec des int Python (lus dans un PointArray entier),
+    le calcul est exact quelle que soit la taille des coordonnées.
+    """
+    gauche = (qy - py) * (rx - qx)
+    droite = (qx - px) * (ry - qy)
+    val = gauche - droite
+    if type(val) is int:
+        return val # coordonnées entières Python (mode entier) : calcul déjà exact
+    borne = ERREUR_ORIENTATION * (abs(gauche) + abs(droite))
+    if abs(val) > borne >= PLUS_PETIT_NORMAL:
+        return val
+    # Un facteur nul dans chaque produit : le 0 est exact. Sinon, borne sous le
+    # plus petit float normal = un produit a pu être arrondi à 0 : recalcul exact.
+    if (qy == py or rx == qx) and (qx == px or ry == qy):
+        return val
+    return _orientation_exacte(px, py, qx, qy, rx, ry)
+
+def orientation_xy(px, py, qx, qy, rx, ry) -> np.ndarray:
+    """
+    orientation(p, q, r) pour des tableaux de coordonnées (diffusion NumPy :
+    p et q peuvent être des scalaires, r un tableau...).
+    Calcul en float64 ; seules les valeurs dont le signe est douteux sont
+    recalculées exactement. Le signe du résultat est donc toujours exact.
+    Si toutes les coordonnées sont entières (mode entier), voir _orientation_entiers.
+    """
+    if _tous_entiers(px, py, qx, qy, rx, ry):
+        return _orientation_entiers(px, py, qx, qy, rx, ry)
+    # Coordonnées énormes (~1e300) : les produits débordent en inf / nan, ce qui
+    # envoie ces valeurs au recalcul exact ; inutile d'avertir
+    with np.errstate(over="ignore", invalid="ignore"):
+        a, b = qy - py, rx - qx
+        c, d = qx - px, ry - qy
+        gauche = a * b
+        droite = c * d
+        val = np.asarray(gauche - droite, dtype=np.float64)
+        borne = ERREUR_ORIENTATION * (np.abs(gauche) + np.abs(droite))
+        doute = _douteux(val, borne, a, b, c, d)
+    if not doute.any():
+        return val
+
+    if val.ndim == 0:
+        return np.float64(_orientation_exacte(px, py, qx, qy, rx, ry))
+    # Indexer les vues diffusées évite de recopier les arguments scalaires en tableaux
+    quoi = np.nonzero(doute)
+    coords = [np.broadcast_to(c, val.shape)[quoi] for c in (px, py, qx, qy, rx, ry)]
+    val[quoi] = _orientations_exactes(*coords)
+    return val
+
+def orientation_batch(p, q, r) -> np.ndarray:
+    """
+    Orientations de nombreux triplets d'un coup : chacun de p, q, r est un Point
+    ou un PointArray (de même taille). Ex : orientation_batch(p, q, nuage)
+    donne le côté de chaque point du nuage par rapport à la droite (p, q).
+    Même signe que orientation() (exact).
+    """
+    return orientation_xy(p.x, p.y, q.x, q.y, r.x, r.y)
+
+def signes_orientation_batch(p, q, r) -> np.ndarray:
+    """Comme orientation_batch mais renvoie seulement les signes (-1, 0, 1) en int8."""
+    return np.sign(orientation_batch(p, q, r)).astype(np.int8)
+
+def _douteux(val, borne, a, b, c, d) -> np.ndarray:
+    """
+    Masque des orientations à recalculer exactement (val = a * b - c * d) :
+    |val| <= borne, ou borne sous le plus petit float normal (un produit a pu
+    être arrondi à 0 ou perdre des chiffres), ou val = nan (inf - inf : les
+    deux produits ont débordé). Seule exception : un facteur nul dans chaque
+    produit, le 0 est alors exact.
     """
-    val = (q.y - p.y) * (r.x - q.x) - (q.x - p.x) * (r.y - q.y)
+    doute = (np.abs(val) <= borne) | np.isnan(val)
+    sous = borne < PLUS_PETIT_NORMAL
+    if np.any(sous):
+        doute = (doute | sous) & ~(((a == 0) | (b == 0)) & ((c == 0) | (d == 0)))
+    return doute
+
+def _orientations_exactes(px, py, qx, qy, rx, ry) -> np.ndarray:
+    """Recalcul exact des cas douteux : en int64 si les coordonnées sont de petits entiers."""
+    entiers = np.ones(len(px), dtype=bool)
+    for c in (px, py, qx, qy, rx, ry):
+        entiers &= (c == np.round(c)) & (np.abs(c) < _LIMITE_INT64)
+
+    val = np.empty(len(px), dtype=np.float64)
+    if entiers.any():
+        i = [c[entiers].astype(np.int64) for c in (px, py, qx, qy, rx, ry)]
+        val[entiers] = (i[3] - i[1]) * (i[4] - i[2]) - (i[2] - i[0]) * (i[5] - i[3])
+    for k in np.flatnonzero(~entiers).tolist():
+        val[k] = _orientation_exacte(px[k], py[k], qx[k], qy[k], rx[k], ry[k])
     return val
 
+def _orientation_exacte(px, py, qx, qy, rx, ry) -> float:
+    """Même formule en entiers Python ou en fractions exactes ; renvoyée en float avec le bon signe."""
+    # .item() : scalaires NumPy -> int / float Python (sans passer un int64 par un float)
+    coords = [c.item() if isinstance(c, np.generic) else c for c in (px, py, qx, qy, rx, ry)]
+    if all(isinstance(c, int) or c.is_integer() for c in coords):
+        px, py, qx, qy, rx, ry = (int(c) for c in coords)
+    else:
+        px, py, qx, qy, rx, ry = (Fraction(c) for c in coords)
+    return _vers_float((qy - py) * (rx - qx) - (qx - px) * (ry - qy))
+
+def _vers_float(exacte) -> float:
+    """Un résultat exact (int ou Fraction) en float, sans jamais perdre son signe."""
+    try:
+        val = float(exacte)
+    except OverflowError:
+        # Trop grand pour un float : seul le signe sert
+        return math.inf if exacte > 0 else -math.inf
+    if val == 0.0 and exacte != 0:
+        # Trop petit pour un float : on garde au moins le signe
+        val = math.copysign(5e-324, exacte)
+    return val
+
+def _tous_entiers(*coords) -> bool:
+    """True si chaque argument est un entier ou un tableau d'entiers."""
+    return all(isinstance(c, (int, np.integer)) or (isinstance(c, np.ndarray) and _est_entier(c))
+               for c in coords)
+
+def _orientation_entiers(px, py, qx, qy, rx, ry) -> np.ndarray:
+    """
+    orientation_xy en mode entier (coordonnées |c| < 2^62, différences exactes en int64).
+    - si toutes les différences sont < 2^31 en valeur absolue, les produits
+      tiennent dans un int64 : résultat exact en int64, sans aucun test ;
+    - sinon on élargit : produits en float64 avec la borne de Shewchuk (convertir
+      une différence exacte en float arrondit autant que la calculer en float),
+      et les rares valeurs douteuses sont refaites en entiers Python.
+      Résultat en float64, avec un signe exact.
+    """
+    a = np.subtract(qy, py, dtype=np.int64)
+    b = np.subtract(rx, qx, dtype=np.int64)
+    c = np.subtract(qx, px, dtype=np.int64)
+    d = np.subtract(ry, qy, dtype=np.int64)
+    if max(_max_abs(t) for t in (a, b, c, d)) < _LIMITE_DIFFERENCE:
+        return a * b - c * d
+
+    gauche = np.multiply(a, b, dtype=np.float64)
+    droite = np.multiply(c, d, dtype=np.float64)
+    val = np.asarray(gauche - droite)
+    borne = ERREUR_ORIENTATION * (np.abs(gauche) + np.abs(droite))
+    doute = _douteux(val, borne, a, b, c, d)
+    if not doute.any():
+        return val
+
+    if val.ndim == 0:
+        return np.float64(_vers_float(int(a) * int(b) - int(c) * int(d)))
+    quoi = np.nonzero(doute)
+    a, b, c, d = (np.broadcast_to(t, val.shape)[quoi].tolist() for t in (a, b, c, d))
+    val[quoi] = [_vers_float(ia * ib - ic * id_) for ia, ib, ic, id_ in zip(a, b, c, d)]
+    return val
+
+def _max_abs(t: np.ndarray) -> int:
+    return int(np.abs(t).max()) if t.size else 0
+
 def distance_carre(p: Point, q: Point) -> float:
     """
     Calcule le carré de la distance euclidienne entre 2 points p et q.
@@ -1,11 +1,15 @@
 import time
 import matplotlib.pyplot as plt
 from typing import List
-from cas_de_test import generer_points_aleatoires, generer_points_cercle, generer_points_carre
+from cas_de_test import generer_points_aleatoires, generer_points_cercle, generer_points_carre, generer_point_array_aleatoire, generer_points_gaussiens
 from visualisation import afficher_enveloppe
-from algorithms.glouton import trouver_enveloppe_glouton
+from algorithms.glouton import trouver_enveloppe_glouton, trouver_enveloppe_glouton_vectorise
 from algorithms.graham_scan import trouver_enveloppe_sklanski
 from algorithms.divide_conquer import trouver_enveloppe_diviser
+from algorithms.monotone import trouver_enveloppe_monotone
+from algorithms.chan import trouver_enveloppe_chan
+from algorithms.quickhull import trouver_enveloppe_quickhull
+from algorithms.paire_proche import paire_proche_diviser, paire_proche_grille
 
 
 # =============================================================================
@@ -45,6 +49,11 @@ algos_a_tester = [
         "func": trouver_enveloppe_glouton,
         "generateur": generer_points_aleatoires
     },
+    {
+        "nom": "Glouton vectorisé (Cas Moyen, aléatoire)",
+        "func": trouver_enveloppe_glouton_vectorise,
+        "generateur": generer_point_array_aleatoire
+    },
     {
          "nom": "Tri angles (Cas Moyen)",
          "func": trouver_enveloppe_sklanski, 
@@ -55,6 +64,59 @@ algos_a_tester = [
         "func": trouver_enveloppe_diviser,
         "generateur": generer_points_aleatoires
     },
+    {
+        "nom": "Chaîne monotone NumPy (Cas Moyen)",
+        "func": trouver_enveloppe_monotone,
+        "generateur": generer_point_array_aleatoire
+    },
+    {
+        "nom": "Chan (Cas Moyen)",
+        "func": trouver_enveloppe_chan,
+        "generateur": generer_points_aleatoires
+    },
+    {
+        "nom": "QuickHull (Cas Moyen)",
+        "func": trouver_enveloppe_quickhull,
+        "generateur": generer_points_aleatoires
+    },
+    {
+        "nom": "QuickHull (gaussien)",
+        "func": trouver_enveloppe_quickhull,
+        "generateur": generer_points_gaussiens
+    },
+    {
+        "nom": "Tri angles (gaussien)",
+        "func": trouver_enveloppe_sklanski,
+        "generateur": generer_points_gaussiens
+    },
+    {
+        "nom": "Diviser pour Régner (gaussien)",
+        "func": trouver_enveloppe_diviser,
+        "generateur": generer_points_gaussiens
+    },
+    {
+        "nom": "Glouton + 4 cadrans (Cas Moyen)",
+        "func": trouver_enveloppe_glouton,
+        "generateur": generer_point_array_aleatoire,
+        "options": {"prefilter": True}
+    },
+    {
+        "nom": "Tri angles + 4 cadrans (Cas Moyen)",
+        "func": trouver_enveloppe_sklanski,
+        "generateur": generer_point_array_aleatoire,
+        "options": {"prefilter": True}
+    },
+    # Paire de points la plus proche (même boucle de mesure)
+    {
+        "nom": "Paire proche, diviser pour régner (Cas Moyen)",
+        "func": paire_proche_diviser,
+        "generateur": generer_point_array_aleatoire
+    },
+    {
+        "nom": "Paire proche, grille (Cas Moyen)",
+        "func": paire_proche_grille,
+        "generateur": generer_point_array_aleatoire
+    },
 ]
 
 # Définir les tailles de 'n' (nombre de points) à tester
@@ -68,6 +130,7 @@ for algo in algos_a_tester:
     nom_algo = algo["nom"]
     fonction_algo = algo["func"]
     generateur_points = algo["generateur"]
+    options = algo.get("options", {}) # ex : {"prefilter": True}
     
     print(f"\nTest de l'algorithme : {nom_algo}")
     
@@ -79,12 +142,19 @@ for algo in algos_a_tester:
         
         # 2. Chronométrer l'exécution
         t_debut = time.perf_counter()
-        fonction_algo(points_test)
+        if options.get("prefilter"):
+            _, filtrage = fonction_algo(points_test, avec_filtrage=True, **options)
+        else:
+            fonction_algo(points_test, **options)
         t_fin = time.perf_counter()
         
         temps_ecoule = t_fin - t_debut
         temps_passes.append(temps_ecoule)
-        print(f"  n = {n:<5} -> {temps_ecoule:.6f} secondes")
+        if options.get("prefilter"):
+            print(f"  n = {n:<5} -> {temps_ecoule:.6f} secondes"
+                  f"  ({100 * filtrage.taux_elimination:.1f}% des points écartés par le pré-filtre)")
+        else:
+            print(f"  n = {n:<5} -> {temps_ecoule:.6f} secondes")
     
     # Stocker les résultats pour le graphique
     resultats_temps[nom_algo] = temps_passes
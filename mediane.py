@@ -1,3 +1,7 @@
+from bisect import bisect_left, bisect_right
+from itertools import islice
+import math
+import numpy as np
 from majoritaire import maj_dico
 
 def _find_kth_naive(k, T):
@@ -143,70 +147,128 @@ def rang_k_tri(k, t):
 #--- Médianes des médianes ---
 
 #Tri par insertion, rapide pour les petites listes, utilisé dans l'algo suivant
-def tri_insertion(arr):
+def tri_insertion(arr, lo=0, hi=None):
     """
-    Trie une liste en place en utilisant le tri par insertion.
+    Trie en place la plage arr[lo..hi] (toute la liste par défaut) en utilisant le tri par insertion.
     """
+    if hi is None:
+        hi = len(arr) - 1
 
-    for i in range(1, len(arr)):
+    for i in range(lo + 1, hi + 1):
         key = arr[i]
 
         j = i - 1
-        while j >= 0 and key < arr[j]:
+        while j >= lo and key < arr[j]:
             arr[j + 1] = arr[j]
             j -= 1
 
         arr[j + 1] = key
 
 
-def _find_kth_bfprt(k : int, t : list):
-    n = len(t)
+# En dessous de cette taille, un tri par insertion de la plage va plus vite
+SEUIL_INSERTION = 16
+
 
-    #cas de sortie
-    if len(t) < 10:
-        t = sorted(t)
-        return t[k]
+def introselect(t: list, k: int, lo: int = 0, hi: int = None):
+    """
+    Place en t[k] l'élément de rang k de la plage t[lo..hi] (toute la liste par
+    défaut) et le renvoie, en place (comme nth_element en C++) : à la fin,
+    t[lo..k-1] <= t[k] <= t[k+1..hi]. Aucune sous-liste n'est créée.
+
+    Quickselect (pivot médiane de 3, partition en 3 : <, ==, >) tant que la plage
+    diminue vite ; si elle n'a pas été divisée par 2 en deux partitions, on passe
+    au pivot « médiane des médianes » (BFPRT, calculé en place lui aussi), qui
+    garantit O(n) dans le pire cas.
+    """
+    if hi is None:
+        hi = len(t) - 1
+    if not lo <= k <= hi:
+        raise IndexError(f"Rang {k} hors de la plage [{lo}, {hi}].")
+
+    bfprt = False
+    taille_ref = hi - lo + 1
+    etapes = 0
+    while hi - lo >= SEUIL_INSERTION:
+        if bfprt:
+            pivot = _pivot_bfprt(t, lo, hi)
+        else:
+            pivot = t[_indice_mediane3(t, lo, (lo + hi) // 2, hi)]
 
-    # on divise la liste en blocs de 5 (O(n)) on les trie (O(n))
-    liste_des_medianes = []
-    for i in range(0, n, 5):
-        chunk = t[i:i+5] #récupère par bloc de 5
+        lt, gt = _partition3(t, lo, hi, pivot)
+        if k < lt:
+            hi = lt - 1
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return t[k] # k tombe dans le paquet des égaux au pivot
 
-        tri_insertion(chunk) #on trie
-        liste_des_medianes.append(chunk[(len(chunk) - 1) // 2]) #pour gérer le cas du dernier paquet pas complet
+        # Tous les 2 tours, la plage doit avoir au moins diminué de moitié
+        etapes += 1
+        if etapes % 2 == 0:
+            if 2 * (hi - lo + 1) > taille_ref:
+                bfprt = True
+            taille_ref = hi - lo + 1
 
-    #On recurre
-    k_pivot = len(liste_des_medianes) // 2 #on prend la médiane comme pivot
-    alpha = _find_kth_bfprt(k_pivot, liste_des_medianes) #appel récursif pour trouver alpha
+    tri_insertion(t, lo, hi)
+    return t[k]
 
-    def partitionner(t : list, alpha):
-        p, egal, g = [], [], []
-        for i in t:
-            if i < alpha :
-                p.append(i)
-            elif i > alpha :
-                g.append(i)
-            else :
-                egal.append(i)
 
-        return p,egal,g
+def _pivot_bfprt(t: list, lo: int, hi: int):
+    """
+    Médiane des médianes de t[lo..hi], en place : chaque bloc de 5 est trié par
+    insertion et sa médiane est ramenée au début de la plage, puis on cherche
+    (récursivement) la médiane de ces médianes.
+    """
+    m = lo
+    for i in range(lo, hi + 1, 5):
+        fin = min(i + 4, hi)
+        tri_insertion(t, i, fin)
+        milieu = (i + fin) // 2 #pour gérer le cas du dernier paquet pas complet
+        t[m], t[milieu] = t[milieu], t[m]
+        m += 1
+    return introselect(t, lo + (m - lo - 1) // 2, lo, m - 1)
 
-    P, E, G = partitionner(t, alpha)
 
-    #Récursion sur p ou g
-    if k < len(P):
-        return _find_kth_bfprt(k, P)
+def _partition3(t: list, lo: int, hi: int, pivot):
+    """
+    Partition de Dijkstra (drapeau hollandais) de t[lo..hi] autour de pivot.
+    Renvoie (lt, gt) : t[lo..lt-1] < pivot, t[lt..gt] == pivot, t[gt+1..hi] > pivot.
+    Le paquet des égaux fait que les doublons ne ralentissent pas la sélection.
+    """
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        x = t[i]
+        if x < pivot:
+            t[i] = t[lt]
+            t[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            t[i] = t[gt]
+            t[gt] = x
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
 
-    elif k < len(P) + len(E):
-        return alpha
 
+def _indice_mediane3(t: list, i: int, j: int, k: int) -> int:
+    # renvoie l'indice de la médiane de t[i], t[j], t[k]
+    x, y, z = t[i], t[j], t[k]
+    if x < y:
+        if y < z:   return j
+        if x < z:   return k
+        return i
     else:
-        return _find_kth_bfprt(k - len(P) - len(E), G)
+        if x < z:   return i
+        if y < z:   return k
+        return j
 
 
 def mediane_des_medianes(t_input):
     """
-    on applique _find_kth_bfprt au cas de la médiane
+    Médiane par introselect (quickselect + médiane des médianes), O(n) dans le pire cas.
+    Une seule copie de l'entrée (qui n'est pas modifiée), tout le reste se fait dedans.
     """
     n = len(t_input)
 
@@ -214,23 +276,164 @@ def mediane_des_medianes(t_input):
     if n == 0:
         raise ValueError("La liste vide n'a pas de médiane.")
 
-    # 2. Cas impair : simple, on trouve l'élément du milieu
+    t = list(t_input)
+    k = n // 2
+    val = introselect(t, k)
+
+    # 2. Cas impair : simple, c'est l'élément du milieu
     if n % 2 == 1:
-        k = n // 2
-        # On fait une copie pour garantir que la liste originale n'est pas mutée
-        return _find_kth_bfprt(k, list(t_input))
+        return val
 
-        # 3. Cas pair : il faut trouver deux éléments et faire la moyenne
-    else:
-        k1 = n // 2 - 1
-        k2 = n // 2
+    # 3. Cas pair : après la sélection, t[0..k-1] <= t[k], donc l'autre élément
+    # central est le plus grand de la partie gauche (pas besoin de 2e sélection)
+    return (max(islice(t, k)) + val) / 2.0
 
-        # On doit appeler l'algo DEUX fois (sur des copies), c'est chiant
-        val1 = _find_kth_bfprt(k1, list(t_input))
-        val2 = _find_kth_bfprt(k2, list(t_input))
+#--- Plusieurs rangs d'un coup : select_many, quantiles ---
+
+def select_many(t, ranks):
+    """
+    Éléments de rangs `ranks` (indexés à 0, dans l'ordre demandé) de la liste t,
+    qui n'est pas modifiée. Multisélection : une seule copie, partitionnée en
+    place, et on ne descend que dans les morceaux qui contiennent encore des
+    rangs demandés. O(n log k) pour k rangs distincts, au lieu de k sélections
+    en O(n) chacune (chacune sur sa copie).
+    """
+    n = len(t)
+    if n == 0:
+        raise ValueError("La liste vide n'a pas d'élément de rang k.")
+    ranks = list(ranks)
+    rangs = sorted(set(ranks))
+    if rangs and not (0 <= rangs[0] and rangs[-1] < n):
+        raise IndexError(f"Rangs hors de [0, {n - 1}].")
+
+    tableau = _tableau_numerique(t)
+    if tableau is not None:
+        # Même chose en C : np.partition place tous les rangs demandés en une fois
+        if not rangs:
+            return []
+        tableau = np.partition(tableau, rangs)
+        return tableau[ranks].tolist()
+
+    t = list(t)
+    _multiselect(t, rangs, 0, len(rangs), 0, n - 1)
+    return [t[k] for k in ranks]
+
+
+def _multiselect(t: list, rangs: list, a: int, b: int, lo: int, hi: int, profondeur: int = 0):
+    """
+    Place en t[k] l'élément de rang k pour tous les k de rangs[a:b] (triés,
+    tous dans [lo, hi]). Une partition en 3 autour d'un pivot, puis on ne
+    descend que dans les côtés qui contiennent encore des rangs demandés ;
+    avec un seul rang, c'est introselect. Si les pivots sont mauvais trop
+    longtemps, on prend la médiane des médianes (pire cas garanti).
+    """
+    while b - a > 1:
+        if profondeur > 2 * (hi - lo + 1).bit_length():
+            pivot = _pivot_bfprt(t, lo, hi)
+        else:
+            pivot = t[_indice_mediane3(t, lo, (lo + hi) // 2, hi)]
+        lt, gt = _partition3(t, lo, hi, pivot)
+        profondeur += 1
+
+        # rangs[a:g] < lt <= rangs[g:d] <= gt < rangs[d:b] ; ceux du milieu sont placés
+        g = bisect_left(rangs, lt, a, b)
+        d = bisect_right(rangs, gt, g, b)
+        if g > a:
+            _multiselect(t, rangs, a, g, lo, lt - 1, profondeur)
+        a, lo = d, gt + 1
+
+    if b - a == 1:
+        introselect(t, rangs[a], lo, hi)
+
+
+def _indice_continu(alpha, beta):
+    # Indice « virtuel » des méthodes de Hyndman & Fan (même formule que NumPy)
+    return lambda n, q: n * q + (alpha + q * (1 - alpha - beta)) - 1
+
+
+def _indice_discret(decalage, condition):
+    # Méthodes discrètes de NumPy : on prend l'indice du dessous ou celui du dessus
+    def indice(n, q):
+        index = n * q - 1 - decalage
+        dessous = math.floor(index)
+        return max(dessous if condition(index - dessous, dessous) else dessous + 1, 0)
+    return indice
+
+
+def _gamma_identite(gamma, indice):
+    return gamma
+
+
+# Les méthodes de np.quantile : nom -> (indice virtuel, correction du poids gamma).
+# Sans correction (None), l'indice est entier et on renvoie l'élément tel quel.
+METHODES_QUANTILE = {
+    "inverted_cdf": (_indice_discret(0, lambda gamma, dessous: gamma == 0), None),
+    "averaged_inverted_cdf": (lambda n, q: n * q - 1, lambda gamma, indice: 0.5 if gamma == 0 else 1.0),
+    "closest_observation": (_indice_discret(0.5, lambda gamma, dessous: gamma == 0 and dessous % 2 == 1), None),
+    "interpolated_inverted_cdf": (_indice_continu(0, 1), _gamma_identite),
+    "hazen": (_indice_continu(0.5, 0.5), _gamma_identite),
+    "weibull": (_indice_continu(0, 0), _gamma_identite),
+    "linear": (lambda n, q: (n - 1) * q, _gamma_identite),
+    "median_unbiased": (_indice_continu(1 / 3.0, 1 / 3.0), _gamma_identite),
+    "normal_unbiased": (_indice_continu(3 / 8.0, 3 / 8.0), _gamma_identite),
+    "lower": (lambda n, q: math.floor((n - 1) * q), None),
+    "higher": (lambda n, q: math.ceil((n - 1) * q), None),
+    "midpoint": (lambda n, q: 0.5 * (math.floor((n - 1) * q) + math.ceil((n - 1) * q)),
+                 lambda gamma, indice: 0.0 if indice % 1 == 0 else 0.5),
+    "nearest": (lambda n, q: round((n - 1) * q), None), # arrondi au pair, comme np.around
+}
+
+
+def quantiles(t, qs, method="linear"):
+    """
+    Quantiles qs (entre 0 et 1) de la liste t, avec les mêmes méthodes
+    d'interpolation et les mêmes résultats que np.quantile(t, qs, method=...).
+    Tous les éléments nécessaires (2 par quantile au plus) sont trouvés en
+    une seule multisélection (select_many). qs peut être un nombre ou une liste.
+    """
+    if method not in METHODES_QUANTILE:
+        raise ValueError(f"Méthode inconnue : {method!r} ({', '.join(METHODES_QUANTILE)}).")
+    n = len(t)
+    if n == 0:
+        raise ValueError("La liste vide n'a pas de quantile.")
+    un_seul = not hasattr(qs, "__iter__")
+    liste_qs = [qs] if un_seul else list(qs)
+    if any(not 0 <= q <= 1 for q in liste_qs):
+        raise ValueError("Les quantiles doivent être entre 0 et 1.")
+
+    indice_virtuel, corriger_gamma = METHODES_QUANTILE[method]
+    calculs = [] # par quantile : (rang du dessous, rang du dessus, gamma)
+    for q in liste_qs:
+        indice = indice_virtuel(n, q)
+        if corriger_gamma is None:
+            calculs.append((indice, indice, None))
+        elif indice >= n - 1:
+            calculs.append((n - 1, n - 1, None))
+        elif indice < 0:
+            calculs.append((0, 0, None))
+        else:
+            dessous = math.floor(indice)
+            calculs.append((dessous, dessous + 1, corriger_gamma(indice - dessous, indice)))
+
+    rangs = sorted({r for dessous, dessus, _ in calculs for r in (dessous, dessus)})
+    valeurs = dict(zip(rangs, select_many(t, rangs)))
+
+    resultats = []
+    for dessous, dessus, gamma in calculs:
+        if gamma is None:
+            resultats.append(valeurs[dessous])
+        else:
+            resultats.append(_lerp(valeurs[dessous], valeurs[dessus], gamma))
+    return resultats[0] if un_seul else resultats
+
+
+def _lerp(a, b, gamma):
+    # Interpolation entre a et b, écrite comme dans NumPy (mêmes arrondis)
+    ecart = b - a
+    if gamma >= 0.5:
+        return b - ecart * (1 - gamma)
+    return a + ecart * gamma
 
-        # Retourne la moyenne
-        return (val1 + val2) / 2.0
 
 def mediane_quicksort(t : list):
     n = len(t)
@@ -286,6 +489,93 @@ def elt_rg(k, t): #
         return elt_rg(k - n_p - n_e, G)
 
 
+#--- Choix automatique du backend ---
+
+def _tableau_numerique(t):
+    """
+    t sous forme de tableau NumPy 1D s'il est numérique (entiers ou flottants :
+    tableau NumPy, ou liste dont tous les éléments sont des entiers, ou tous
+    des flottants), sinon None.
+    Objets, chaînes, booléens, types mélangés (entiers et flottants : la
+    conversion en float64 arrondirait les grands entiers), entiers trop grands
+    pour int64 / uint64... restent pour le code Python pur.
+    """
+    if isinstance(t, np.ndarray):
+        return t.ravel() if t.dtype.kind in "iuf" else None
+
+    types = set(map(type, t))
+    if all(issubclass(ty, (float, np.floating)) for ty in types):
+        genre = "f"
+    elif all(issubclass(ty, (int, np.integer)) and ty is not bool for ty in types):
+        genre = "iu"
+    else:
+        return None
+    try:
+        tableau = np.asarray(t)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    # Des entiers >= 2^63 mêlés à des négatifs deviennent float64 (ou object) : refusé
+    if tableau.ndim != 1 or tableau.dtype.kind not in genre:
+        return None
+    return tableau
+
+
+def _mediane_numpy(tableau):
+    """Médiane avec np.partition (introselect en C), une seule passe même pour n pair."""
+    n = len(tableau)
+    k = n // 2
+    if n % 2 == 1:
+        return np.partition(tableau, k)[k].item()
+    # Les deux éléments centraux placés d'un coup ; la moyenne en Python
+    # (entiers exacts, comme pour les autres méthodes)
+    bas, haut = np.partition(tableau, [k - 1, k])[k - 1:k + 1].tolist()
+    return (bas + haut) / 2.0
+
+
+def _mediane_elt_rg(t):
+    n = len(t)
+    if n == 0:
+        raise ValueError("La liste vide n'a pas de médiane.")
+    if n % 2 == 1:
+        return elt_rg(n // 2, t)
+    return (elt_rg(n // 2 - 1, t) + elt_rg(n // 2, t)) / 2.0
+
+
+# Les méthodes en Python pur (marchent sur tout ce qui se compare)
+METHODES_MEDIANE = {
+    "introselect": mediane_des_medianes,
+    "quickselect": _mediane_elt_rg,
+    "tri": mediane_par_tri,
+    "naif": mediane_naif,
+}
+
+
+def mediane(t, method="auto", avec_methode=False):
+    """
+    Médiane de t, avec choix du backend :
+    - "auto" : NumPy (np.partition) si t est numérique, sinon introselect en Python
+    - "numpy" : NumPy obligatoirement (TypeError si t n'est pas numérique)
+    - "introselect", "quickselect", "tri", "naif" : le code Python pur correspondant
+    Avec avec_methode=True, renvoie le couple (médiane, méthode réellement
+    utilisée) : "numpy", ou le nom de la méthode Python ("introselect"...).
+    """
+    if method not in ("auto", "numpy") and method not in METHODES_MEDIANE:
+        raise ValueError(f"Méthode inconnue : {method!r} (auto, numpy, {', '.join(METHODES_MEDIANE)}).")
+    if len(t) == 0:
+        raise ValueError("La liste vide n'a pas de médiane.")
+
+    tableau = _tableau_numerique(t) if method in ("auto", "numpy") else None
+    if method == "numpy" and tableau is None:
+        raise TypeError("Le backend NumPy demande des nombres (entiers ou flottants).")
+
+    if tableau is not None:
+        methode, resultat = "numpy", _mediane_numpy(tableau)
+    else:
+        methode = "introselect" if method == "auto" else method
+        resultat = METHODES_MEDIANE[methode](t.ravel().tolist() if isinstance(t, np.ndarray) else t)
+    return (resultat, methode) if avec_methode else resultat
+
+
 if __name__ == "__main__":
 
     # Définition tes cas de tests
@@ -301,7 +591,7 @@ if __name__ == "__main__":
         ([5, 1], 3.0),  # Deux éléments
     ]
 
-    list_of_algos = [mediane_naif, mediane_des_medianes]
+    list_of_algos = [mediane_naif, mediane_des_medianes, mediane]
 
     print("Démarrage des tests de correction...")
 
@@ -333,6 +623,52 @@ if __name__ == "__main__":
             # Une autre exception a été levée
             print(f"  FAIL: La liste vide [] a levé {type(e).__name__} au lieu de ValueError.")
 
+    # 3. introselect contre un tri, sur des listes au hasard (avec beaucoup de doublons)
+    print("\n--- Test de : introselect (listes aléatoires) ---")
+    erreurs = 0
+    for _ in range(500):
+        t = [random.randint(0, 20) for _ in range(random.randint(1, 200))]
+        k = random.randrange(len(t))
+        copie = list(t)
+        val = introselect(copie, k)
+        if val != sorted(t)[k] or any(x > val for x in copie[:k]) or any(x < val for x in copie[k + 1:]):
+            erreurs += 1
+    print(f"  {'PASS' if erreurs == 0 else 'FAIL'}: {erreurs} erreur(s) sur 500 listes")
+
+    # 4. quantiles : valeurs de référence données par np.quantile(t, qs, method=...)
+    print("\n--- Test de : quantiles ---")
+    t = [7, 1, 3, 3, 9, 4]
+    attendus = {
+        "linear": [2.0, 3.5, 8.0],
+        "lower": [1, 3, 7],
+        "higher": [3, 4, 9],
+        "midpoint": [2.0, 3.5, 8.0],
+        "nearest": [1, 3, 7],
+        "hazen": [1.2000000000000002, 3.5, 8.8],
+    }
+    for methode, expected in attendus.items():
+        result = quantiles(t, [0.1, 0.5, 0.9], method=methode)
+        print(f"  {'PASS' if result == expected else 'FAIL'}: {methode} -> {result}")
+    result = select_many(t, [5, 0, 2])
+    print(f"  {'PASS' if result == [9, 1, 3] else 'FAIL'}: select_many(t, [5, 0, 2]) -> {result}")
+
+    # 5. mediane : le backend choisi dépend du type des éléments
+    print("\n--- Test de : mediane (choix du backend) ---")
+    for entree, backend in (([3, 1, 2], "numpy"), (np.array([1.5, 0.5]), "numpy"),
+                            (["b", "a", "c"], "python"), ([2**70, 1, 5], "python"),
+                            ([10**17 + 1, 10**17 + 3, 0.5], "python"), ([2**63, -1, 5], "python")):
+        _, methode = mediane(entree, avec_methode=True)
+        obtenu = "numpy" if methode == "numpy" else "python"
+        etat = "PASS" if obtenu == backend else "FAIL"
+        print(f"  {etat}: {entree!r} -> {obtenu} ({methode})")
+    # Types mélangés : résultat exact, comme le code Python pur
+    for entree, attendu in ((lambda: mediane([10**17 + 1, 10**17 + 3, 0.5]), 10**17 + 1),
+                            (lambda: select_many([2**53 + 1, 0.5, 2**53 + 1], [1]), [2**53 + 1]),
+                            (lambda: quantiles([2**53 + 1, 0.5, 2**53 + 1], 0.5, method="lower"), 2**53 + 1)):
+        result = entree()
+        etat = "PASS" if result == attendu and type(result) == type(attendu) else "FAIL"
+        print(f"  {etat}: {result!r} (attendu {attendu!r})")
+
     print("\n--- Tests terminés ---")
 
 